@@ -0,0 +1,165 @@
+"""
+Batch runner for the research phase.
+
+Submits the round-opening research tasks for many companies (e.g. an
+overnight portfolio review) to the OpenAI Batch API, which is ~50% cheaper
+than realtime calls in exchange for up to 24h latency.
+
+Batch requests are single chat completions: agents cannot call tools, so they
+answer from the provided company data and model knowledge.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Callable, List, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from agents.definitions import create_all_agents
+from agents.llm import get_model_name
+from config import settings
+from tasks.research_tasks import (
+    create_market_researcher_task,
+    create_founder_evaluator_task,
+    create_product_critic_task,
+    create_financial_analyst_task
+)
+
+logger = logging.getLogger(__name__)
+
+# agent_id -> research task factory (the tasks that open each round)
+RESEARCH_TASK_FACTORIES = {
+    "market_researcher": create_market_researcher_task,
+    "founder_evaluator": create_founder_evaluator_task,
+    "product_critic": create_product_critic_task,
+    "financial_analyst": create_financial_analyst_task,
+}
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def build_batch_requests(company_list: List[dict]) -> List[dict]:
+    """
+    Build one Batch API request per (company, research task)
+
+    Args:
+        company_list: List of company_data dicts (same shape as /analyze input)
+
+    Returns:
+        list of Batch API request dicts; custom_id is "{company_index}:{agent_id}"
+    """
+    agents = create_all_agents()
+    model = get_model_name()
+    requests = []
+
+    for index, company_data in enumerate(company_list):
+        for agent_id, create_task in RESEARCH_TASK_FACTORIES.items():
+            task = create_task(agents, company_data, context=[])
+            agent = task.agent
+            requests.append({
+                "custom_id": f"{index}:{agent_id}",
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {
+                    "model": model,
+                    "messages": [
+                        # Static per-agent prefix first so prompt caching applies
+                        {
+                            "role": "system",
+                            "content": f"You are {agent.role}. {agent.backstory}\nYour personal goal is: {agent.goal}"
+                        },
+                        {
+                            "role": "user",
+                            "content": f"{task.description}\n\nExpected output:\n{task.expected_output}"
+                        }
+                    ]
+                }
+            })
+
+    return requests
+
+
+async def run_research_batch(
+    company_list: List[dict],
+    batch_id: Optional[str] = None,
+    poll_interval: float = 30.0,
+    on_submit: Optional[Callable[[str], None]] = None,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> List[dict]:
+    """
+    Run the research tasks for many companies through the OpenAI Batch API
+
+    Args:
+        company_list: List of company_data dicts
+        batch_id: Existing batch to resume polling (skips resubmission, e.g.
+            after a crash). Must have been created from the same company_list.
+        poll_interval: Seconds between batch status checks
+        on_submit: Called with the batch id once it is known (e.g. to persist
+            it for resuming)
+        http_client: Shared pooled client (app.state.http); None lets the
+            OpenAI SDK open its own
+
+    Returns:
+        list of {"company_name": str, "research": {agent_id: output}} in the
+        same order as company_list
+
+    Raises:
+        ValueError: If the configured provider is not OpenAI
+        RuntimeError: If the batch does not complete
+    """
+    if settings.llm_provider != "openai":
+        raise ValueError("Batch research requires LLM_PROVIDER=openai")
+
+    client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
+
+    if batch_id is None:
+        requests = build_batch_requests(company_list)
+        payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+
+        batch_file = await client.files.create(
+            file=("research_batch.jsonl", payload),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h"
+        )
+        logger.info(f"Submitted research batch {batch.id} ({len(requests)} requests)")
+    else:
+        batch = await client.batches.retrieve(batch_id)
+        logger.info(f"Resuming research batch {batch.id} (status: {batch.status})")
+
+    if on_submit is not None:
+        on_submit(batch.id)
+
+    while batch.status not in TERMINAL_STATUSES:
+        await asyncio.sleep(poll_interval)
+        batch = await client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Research batch {batch.id} ended with status: {batch.status}")
+
+    content = await client.files.content(batch.output_file_id)
+
+    reports = [
+        {"company_name": company_data.get("company_name"), "research": {}}
+        for company_data in company_list
+    ]
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        index, agent_id = record["custom_id"].split(":", 1)
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            output = response["body"]["choices"][0]["message"]["content"]
+        else:
+            output = f"Error: {record.get('error') or response.get('body')}"
+        reports[int(index)]["research"][agent_id] = output
+
+    logger.info(f"Research batch {batch.id} completed for {len(company_list)} companies")
+    return reports
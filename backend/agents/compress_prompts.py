@@ -0,0 +1,85 @@
+"""
+Build step: compress agent prompts with LLMLingua.
+
+Usage (from backend/):
+    pip install llmlingua
+    python -m agents.compress_prompts [--rate 0.5]
+
+Writes agents/prompts_compressed.py with the same constant names as
+agents/prompts.py. Set USE_COMPRESSED_PROMPTS=true to have the agents use it;
+agents/prompts.py stays the source of truth for editing and debugging.
+
+Compression runs once at build time, so the output is a fixed string and
+still cacheable as a prompt prefix.
+"""
+
+import argparse
+import os
+
+from agents.prompts import PROMPTS
+
+# Lead partner prompt carries the exact calendar-event rules - keep verbatim
+KEEP_VERBATIM = {"LEAD_PARTNER_PROMPT"}
+
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "prompts_compressed.py")
+
+
+def compress_prompts(rate: float) -> dict:
+    """
+    Compress every prompt except KEEP_VERBATIM
+
+    Args:
+        rate: Target fraction of tokens to keep (0-1)
+
+    Returns:
+        dict: {prompt_name: compressed_prompt}
+    """
+    from llmlingua import PromptCompressor
+
+    compressor = PromptCompressor(
+        model_name="microsoft/llmlingua-2-xlm-roberta-large-meetingbank",
+        use_llmlingua2=True,
+        device_map="cpu"
+    )
+
+    compressed = {}
+    for name, prompt in PROMPTS.items():
+        if name in KEEP_VERBATIM:
+            compressed[name] = prompt
+            continue
+        result = compressor.compress_prompt(prompt, rate=rate, force_tokens=["\n", "**", "-"])
+        compressed[name] = result["compressed_prompt"].strip()
+        print(f"{name}: {result['origin_tokens']} -> {result['compressed_tokens']} tokens")
+
+    return compressed
+
+
+def write_module(compressed: dict, rate: float) -> None:
+    """Write the compressed prompts as a Python module"""
+    lines = [
+        '"""',
+        "Compressed agent prompts - GENERATED by agents/compress_prompts.py, do not edit.",
+        f"Source: agents/prompts.py, rate={rate}",
+        '"""',
+        "",
+    ]
+    for name, prompt in compressed.items():
+        lines.append(f"{name} = {prompt!r}")
+        lines.append("")
+
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compress agent prompts with LLMLingua")
+    parser.add_argument("--rate", type=float, default=0.5, help="Fraction of tokens to keep")
+    args = parser.parse_args()
+
+    compressed = compress_prompts(args.rate)
+    write_module(compressed, args.rate)
+    print(f"Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
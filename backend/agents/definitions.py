@@ -1,220 +1,373 @@
 """
 CrewAI Agent Definitions for the VC Council investment analysis system.
+
+crewai and the tool modules are imported inside the factories, so importing
+this module (e.g. for prompts or helpers) stays cheap; the cost is paid on the
+first create_*() call, which main.py triggers at startup.
 """
 
-from crewai import Agent
-from agents.prompts import (
-    MARKET_RESEARCHER_PROMPT,
-    FOUNDER_EVALUATOR_PROMPT,
-    PRODUCT_CRITIC_PROMPT,
-    FINANCIAL_ANALYST_PROMPT,
-    RISK_ASSESSOR_PROMPT,
-    BULL_AGENT_PROMPT,
-    BEAR_AGENT_PROMPT,
-    LEAD_PARTNER_PROMPT
-)
-from tools.github_tool import GitHubAnalyzerTool
-from tools.hackernews_tool import HackerNewsSearchTool
-from tools.exa_tool import ExaSearchTool
-from tools.gcalendar_tool import GoogleCalendarTool
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping
+
+from agents.llm import get_lead_partner_llm, get_shared_llm, get_tool_agent_llm
+from agents.prompts import prompt_hash
+from config import settings
+
+# Compressed prompts are generated by `python -m agents.compress_prompts`
+if settings.use_compressed_prompts:
+    from agents.prompts_compressed import (
+        MARKET_RESEARCHER_PROMPT,
+        FOUNDER_EVALUATOR_PROMPT,
+        PRODUCT_CRITIC_PROMPT,
+        FINANCIAL_ANALYST_PROMPT,
+        RISK_ASSESSOR_PROMPT,
+        BULL_AGENT_PROMPT,
+        BEAR_AGENT_PROMPT,
+        LEAD_PARTNER_PROMPT
+    )
+else:
+    from agents.prompts import (
+        MARKET_RESEARCHER_PROMPT,
+        FOUNDER_EVALUATOR_PROMPT,
+        PRODUCT_CRITIC_PROMPT,
+        FINANCIAL_ANALYST_PROMPT,
+        RISK_ASSESSOR_PROMPT,
+        BULL_AGENT_PROMPT,
+        BEAR_AGENT_PROMPT,
+        LEAD_PARTNER_PROMPT
+    )
+
+if TYPE_CHECKING:
+    from crewai import Agent
+    from tools.github_tool import GitHubAnalyzerTool
+    from tools.hackernews_tool import HackerNewsSearchTool
+    from tools.exa_tool import ExaSearchTool
+
+logger = logging.getLogger(__name__)
+
+# ========== SHARED TOOLS ==========
+# Tools are stateless wrappers around the MCP client, so one instance of each
+# is built per process and shared by every agent that uses it.
+
+@lru_cache(maxsize=None)
+def get_hackernews_tool() -> "HackerNewsSearchTool":
+    """Return the shared HackerNewsSearchTool instance."""
+    from tools.hackernews_tool import HackerNewsSearchTool
+
+    return HackerNewsSearchTool()
+
+
+@lru_cache(maxsize=None)
+def get_github_tool() -> "GitHubAnalyzerTool":
+    """Return the shared GitHubAnalyzerTool instance."""
+    from tools.github_tool import GitHubAnalyzerTool
+
+    return GitHubAnalyzerTool()
+
+
+@lru_cache(maxsize=None)
+def get_exa_tool() -> "ExaSearchTool":
+    """Return the shared ExaSearchTool instance."""
+    from tools.exa_tool import ExaSearchTool
+
+    return ExaSearchTool()
+
+
+
+def _new_agent(**kwargs) -> "Agent":
+    """Construct a CrewAI Agent (crewai is imported on first use)."""
+    from crewai import Agent
+
+    return Agent(**kwargs)
+
+
+def get_max_iter(tier: str) -> int:
+    """
+    Resolve the max_iter ceiling for an agent tier from settings
+
+    Args:
+        tier: "research", "debate" or "lead"
+
+    Returns:
+        int: settings.max_iter_<tier>, or 1 when settings.dry_run is set
+    """
+    if settings.dry_run:
+        return 1
+    return getattr(settings, f"max_iter_{tier}")
 
 # ========== RESEARCH AGENTS (Phase 1) ==========
 
-def create_market_researcher() -> Agent:
+@lru_cache(maxsize=None)
+def create_market_researcher() -> "Agent":
     """
     Create market research specialist agent.
 
     Configuration:
     - allow_delegation=False: Focus on own research
-    - verbose=True: See thinking process
-    - max_iter=5: Limit iterations
+    - verbose: settings.crew_verbose (off by default)
+    - max_iter: settings.max_iter_research
     - tools: HackerNewsSearchTool
     """
-    return Agent(
+    return _new_agent(
         role='Market Research Specialist',
         goal='Research and analyze market size, growth, competitive landscape, and sentiment',
         backstory=MARKET_RESEARCHER_PROMPT,
-        tools=[HackerNewsSearchTool()],
-        verbose=True,
+        tools=[get_hackernews_tool()],
+        llm=get_tool_agent_llm(),
+        verbose=settings.crew_verbose,
         allow_delegation=False,
-        max_iter=5
+        max_iter=get_max_iter("research")
     )
 
 
-def create_founder_evaluator() -> Agent:
+@lru_cache(maxsize=None)
+def create_founder_evaluator() -> "Agent":
     """
     Create founder evaluation agent.
 
     Configuration:
     - allow_delegation=False: Focus on own research
-    - verbose=True: See thinking process
-    - max_iter=5: Limit iterations
+    - verbose: settings.crew_verbose (off by default)
+    - max_iter: settings.max_iter_research
     - tools: GitHubAnalyzerTool
     """
-    return Agent(
+    return _new_agent(
         role='Founder Evaluator',
         goal='Assess founder background, technical skills, and execution ability',
         backstory=FOUNDER_EVALUATOR_PROMPT,
-        tools=[GitHubAnalyzerTool()],
-        verbose=True,
+        tools=[get_github_tool()],
+        llm=get_tool_agent_llm(),
+        verbose=settings.crew_verbose,
         allow_delegation=False,
-        max_iter=5
+        max_iter=get_max_iter("research")
     )
 
 
-def create_product_critic() -> Agent:
+@lru_cache(maxsize=None)
+def create_product_critic() -> "Agent":
     """
     Create product and moat analysis agent.
 
     Configuration:
     - allow_delegation=False: Focus on own research
-    - verbose=True: See thinking process
-    - max_iter=5: Limit iterations
+    - verbose: settings.crew_verbose (off by default)
+    - max_iter: settings.max_iter_research
     - tools: [] (works primarily with provided data)
     """
-    return Agent(
+    return _new_agent(
         role='Product Critic',
         goal='Evaluate product defensibility, moat strength, and competitive threats',
         backstory=PRODUCT_CRITIC_PROMPT,
         tools=[],
-        verbose=True,
+        llm=get_shared_llm(),
+        verbose=settings.crew_verbose,
         allow_delegation=False,
-        max_iter=5
+        max_iter=get_max_iter("research")
     )
 
 
-def create_financial_analyst() -> Agent:
+@lru_cache(maxsize=None)
+def create_financial_analyst() -> "Agent":
     """
     Create financial analyst agent.
 
     Configuration:
     - allow_delegation=False: Focus on own analysis
-    - verbose=True: See thinking process
-    - max_iter=5: Limit iterations
+    - verbose: settings.crew_verbose (off by default)
+    - max_iter: settings.max_iter_research
     - tools: [] (works primarily with provided data)
     """
-    return Agent(
+    return _new_agent(
         role='Financial Analyst',
         goal='Calculate LTV:CAC, burn rate, runway, and financial health metrics',
         backstory=FINANCIAL_ANALYST_PROMPT,
         tools=[],
-        verbose=True,
+        llm=get_shared_llm(),
+        verbose=settings.crew_verbose,
         allow_delegation=False,
-        max_iter=5
+        max_iter=get_max_iter("research")
     )
 
 
-def create_risk_assessor() -> Agent:
+@lru_cache(maxsize=None)
+def create_risk_assessor() -> "Agent":
     """
     Create risk assessment agent.
 
     Configuration:
     - allow_delegation=False: Focus on own research
-    - verbose=True: See thinking process
-    - max_iter=5: Limit iterations
+    - verbose: settings.crew_verbose (off by default)
+    - max_iter: settings.max_iter_research
     - tools: HackerNewsSearchTool
     """
-    return Agent(
+    return _new_agent(
         role='Risk Assessor',
         goal='Identify catastrophic failure modes, regulatory risks, and red flags',
         backstory=RISK_ASSESSOR_PROMPT,
-        tools=[HackerNewsSearchTool()],
-        verbose=True,
+        tools=[get_hackernews_tool()],
+        llm=get_tool_agent_llm(),
+        verbose=settings.crew_verbose,
         allow_delegation=False,
-        max_iter=5
+        max_iter=get_max_iter("research")
     )
 
 # ========== DEBATE AGENTS (Phase 3) ==========
+# Bull and Bear stay separate agents rather than two personas of one
+# multi-turn conversation: the frontend attributes every step and output by
+# agent role, and CrewAI opens each prompt with "You are {role}", so a shared
+# KV prefix across the two isn't reachable without losing attribution. Within
+# a round, Bear already receives Bull's output as context.
 
-def create_bull_agent() -> Agent:
+@lru_cache(maxsize=None)
+def create_bull_agent(allow_delegation: bool = False) -> "Agent":
     """
     Create Bull advocate agent.
 
     Configuration:
-    - allow_delegation=True: Can ask research agents for more evidence
+    - allow_delegation: Off by default; enabled only when research output is
+      thin (see needs_more_evidence), since each delegation adds a full
+      research round-trip
     - tools: ALL tools (can verify claims and gather supporting evidence)
-    - max_iter=4: Slightly fewer iterations
+    - max_iter: settings.max_iter_debate
     """
-    return Agent(
+    return _new_agent(
         role='Bull Advocate',
         goal='Build the strongest case FOR investing with compelling evidence',
         backstory=BULL_AGENT_PROMPT,
         tools=[
-            HackerNewsSearchTool(),
-            GitHubAnalyzerTool(),
-            ExaSearchTool()
+            get_hackernews_tool(),
+            get_github_tool(),
+            get_exa_tool()
         ],
-        verbose=True,
-        allow_delegation=True,
-        max_iter=4
+        llm=get_tool_agent_llm(),
+        verbose=settings.crew_verbose,
+        allow_delegation=allow_delegation,
+        max_iter=get_max_iter("debate")
     )
 
 
-def create_bear_agent() -> Agent:
+@lru_cache(maxsize=None)
+def create_bear_agent(allow_delegation: bool = False) -> "Agent":
     """
     Create Bear advocate agent.
 
     Configuration:
-    - allow_delegation=True: Can ask research agents for more evidence
+    - allow_delegation: Off by default; enabled only when research output is
+      thin (see needs_more_evidence), since each delegation adds a full
+      research round-trip
     - tools: ALL tools (can find counter-evidence and verify claims)
-    - max_iter=4: Slightly fewer iterations
+    - max_iter: settings.max_iter_debate
     """
-    return Agent(
+    return _new_agent(
         role='Bear Advocate',
         goal='Build the strongest case AGAINST investing with rigorous evidence',
         backstory=BEAR_AGENT_PROMPT,
         tools=[
-            HackerNewsSearchTool(),
-            GitHubAnalyzerTool(),
-            ExaSearchTool()
+            get_hackernews_tool(),
+            get_github_tool(),
+            get_exa_tool()
         ],
-        verbose=True,
-        allow_delegation=True,
-        max_iter=4
+        llm=get_tool_agent_llm(),
+        verbose=settings.crew_verbose,
+        allow_delegation=allow_delegation,
+        max_iter=get_max_iter("debate")
     )
 
 
 # ========== DECISION MAKER (Phase 5) ==========
 
-def create_lead_partner() -> Agent:
+@lru_cache(maxsize=None)
+def create_lead_partner() -> "Agent":
     """
     Create Lead Investment Partner agent.
 
     Configuration:
     - allow_delegation=False: Makes decision independently
-    - tools: Google Calendar (optional - can create events after decision)
-    - max_iter=3: Quick decision making
-
-    Note: Primary output is structured JSON (InvestmentDecision Pydantic model).
-    GCalendarTool is available for optionally creating calendar events in Google Calendar
-    after making the decision, but calendar_events should still be in JSON output.
+    - tools: None - with no tools CrewAI passes the task's InvestmentDecision
+      model to the provider as native structured output (OpenAI json_schema,
+      Anthropic tool use); the orchestrator creates the calendar events
+    - max_iter: settings.max_iter_lead
     """
-    return Agent(
+    return _new_agent(
         role='Lead Investment Partner',
         goal='Make final investment decision (PASS/MAYBE/INVEST) based on all evidence',
         backstory=LEAD_PARTNER_PROMPT,
-        tools=[GoogleCalendarTool()],
-        verbose=True,
+        tools=[],
+        llm=get_lead_partner_llm(),
+        verbose=settings.crew_verbose,
         allow_delegation=False,
-        max_iter=3
+        max_iter=get_max_iter("lead")
     )
 
 # ========== HELPER FUNCTIONS ==========
 
-def create_all_agents() -> dict:
+def needs_more_evidence(research_outputs: Iterable[str]) -> bool:
+    """
+    Check whether the research phase left gaps worth delegating for.
+
+    Args:
+        research_outputs: Raw outputs of the research tasks
+
+    Returns:
+        bool: True if any output is shorter than settings.min_research_chars
+    """
+    return any(
+        len((output or "").strip()) < settings.min_research_chars
+        for output in research_outputs
+    )
+
+
+# ========== REGISTRY ==========
+
+@dataclass(frozen=True, slots=True)
+class AgentSpec:
+    """Static description of one council agent."""
+    agent_id: str
+    prompt: str  # Backstory / system prompt
+    phase: int   # 1 = research, 3 = debate, 5 = decision (as in agents/prompts.py)
+    create: Callable[[], "Agent"]
+
+
+AGENT_SPECS: Mapping[str, AgentSpec] = MappingProxyType({
+    spec.agent_id: spec for spec in (
+        AgentSpec("market_researcher", MARKET_RESEARCHER_PROMPT, 1, create_market_researcher),
+        AgentSpec("founder_evaluator", FOUNDER_EVALUATOR_PROMPT, 1, create_founder_evaluator),
+        AgentSpec("product_critic", PRODUCT_CRITIC_PROMPT, 1, create_product_critic),
+        AgentSpec("financial_analyst", FINANCIAL_ANALYST_PROMPT, 1, create_financial_analyst),
+        AgentSpec("risk_assessor", RISK_ASSESSOR_PROMPT, 1, create_risk_assessor),
+        AgentSpec("bull_agent", BULL_AGENT_PROMPT, 3, create_bull_agent),
+        AgentSpec("bear_agent", BEAR_AGENT_PROMPT, 3, create_bear_agent),
+        AgentSpec("lead_partner", LEAD_PARTNER_PROMPT, 5, create_lead_partner),
+    )
+})
+
+# The exact prompt strings agents may carry as backstory (checked in
+# tests/test_tasks.py): any per-analysis text in the system prompt would make
+# it miss the provider prefix cache on every call.
+STATIC_PROMPTS = frozenset(spec.prompt for spec in AGENT_SPECS.values())
+
+
+@lru_cache(maxsize=1)
+def create_all_agents() -> Mapping[str, "Agent"]:
     """
-    Create all 8 agents and return as dictionary.
+    Create all 8 agents and return as a read-only mapping.
+
+    Agents are built once per process and shared across analyses; repeat
+    calls return the same mapping. Analyses run concurrently, so these agents
+    must never be mutated per run: set per-run state (e.g. step_callback) on
+    agent.copy() instead, as the orchestrator does for each analysis.
 
     Returns:
-        dict: {agent_id: Agent object} with all 8 agents
-    """
-    return {
-        "market_researcher": create_market_researcher(),
-        "founder_evaluator": create_founder_evaluator(),
-        "product_critic": create_product_critic(),
-        "financial_analyst": create_financial_analyst(),
-        "risk_assessor": create_risk_assessor(),
-        "bull_agent": create_bull_agent(),
-        "bear_agent": create_bear_agent(),
-        "lead_partner": create_lead_partner()
-    }
+        Mapping: {agent_id: Agent object} with all 8 agents
+    """
+    agents = MappingProxyType({
+        agent_id: spec.create() for agent_id, spec in AGENT_SPECS.items()
+    })
+
+    for agent_id, agent in agents.items():
+        logger.info("Agent %s backstory hash: %s", agent_id, prompt_hash(agent.backstory))
+
+    return agents
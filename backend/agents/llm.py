@@ -0,0 +1,237 @@
+"""
+LLM configuration for the VC Council agents.
+
+Each agent's system prompt (role, goal, backstory) is identical on every turn,
+so it leads every request as a reusable prefix:
+- Anthropic: only caches prefixes explicitly marked with cache_control, and
+  only from 1024 tokens. The compressed system prompts are far below that on
+  their own, so the breakpoint sits on the task message (system prompt plus
+  instructions, context and company details) for the agents that resend it:
+  tool-using agents on every ReAct iteration, the lead partner on its own
+  iterations over all 16 round outputs. Tool-less agents answer in one call
+  and get no breakpoint.
+- OpenAI: caches prompt prefixes >=1024 tokens automatically. CrewAI places the
+  static system prompt first; requests also carry a prompt_cache_key derived
+  from the prompt content hashes (agents.prompts.PROMPTS_DIGEST).
+
+Agents share LLM instances (see get_shared_llm; only the cache breakpoints
+differ for tool-using agents and the lead partner) so they reuse a single
+keep-alive HTTP connection pool instead of opening one per agent.
+With settings.llm_fallback_endpoints set, calls are load-balanced across the
+primary and fallback endpoints with failover (see PooledLLM).
+settings.llm_requests_per_minute adds a client-side token bucket in front of
+the provider (429s are additionally retried with backoff by CrewAI). When
+settings.llm_cache_enabled is set the result is wrapped in a CachingLLM so
+repeat analyses are served from the on-disk response cache.
+
+LLM_PROVIDER=vllm targets a local OpenAI-compatible vLLM server. Run it with
+LMCache so the shared backstory KV is computed once and reused across agents:
+
+    LMCACHE_CHUNK_SIZE=256 LMCACHE_LOCAL_CPU=True LMCACHE_MAX_LOCAL_CPU_SIZE=20 \\
+    LMCACHE_ENABLE_BLENDING=True LMCACHE_BLEND_SPECIAL_STR=" # # " \\
+    vllm serve <model> --port 8001 \\
+        --kv-transfer-config '{"kv_connector":"LMCacheConnectorV1","kv_role":"kv_both"}'
+
+warm_vllm_prefix_cache() pre-fills each agent's system prompt at startup;
+LMCache logs should then show "Retrieved N tokens" on the first real task.
+With blending enabled, research outputs fenced by settings.lmcache_blend_separator
+are reused by every debate task that sees them, regardless of prefix.
+"""
+
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import httpx
+from agents.prompts import PROMPTS_DIGEST
+from config import settings
+
+if TYPE_CHECKING:
+    from crewai import LLM
+    from crewai.llms.base_llm import BaseLLM
+
+logger = logging.getLogger(__name__)
+
+# Stamp cache_control={"type": "ephemeral"} (5-min TTL) on the task message,
+# caching it together with the system prompt ahead of it (LiteLLM). No
+# breakpoint goes on the system message alone: at 70-190 tokens it is below
+# Anthropic's 1024-token minimum and would never be cached.
+#
+# Tool-using agents: the task message is the stable prefix of every ReAct
+# iteration (only tool observations are appended). Lead partner: the task
+# message carries all 16 round outputs, which its own iterations reuse.
+# Tool-less agents answer in one call, where it would only add cache-write cost.
+TASK_CACHE_INJECTION_POINTS = [{"location": "message", "index": 1}]
+
+# Connection pool shared by every agent's LLM calls
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTP_TIMEOUT = 60.0
+
+
+def get_model_name() -> str:
+    """Resolve the configured model name (MODEL overrides LLM_MODEL)."""
+    return settings.model or settings.llm_model
+
+
+def create_llm(
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    cache_injection_points: Optional[list] = None,
+    stream: bool = False
+) -> "LLM":
+    """
+    Create the LLM used by the council agents with prompt caching enabled
+    on the static system prompt.
+
+    Args:
+        provider: "openai", "anthropic" or "vllm" (default: settings.llm_provider)
+        model: Model name (default: get_model_name())
+        cache_injection_points: Anthropic cache breakpoints (default: none)
+        stream: Stream the completion (emits CrewAI LLMStreamChunkEvents)
+
+    Returns:
+        LLM: CrewAI LLM configured for the provider
+    """
+    from crewai import LLM
+
+    provider = provider or settings.llm_provider
+    model = model or get_model_name()
+
+    if provider == "vllm":
+        return LLM(
+            model=f"hosted_vllm/{model}",
+            base_url=settings.vllm_base_url,
+            api_key=settings.vllm_api_key,
+            stream=stream
+        )
+
+    if provider == "anthropic":
+        if "/" not in model:
+            model = f"anthropic/{model}"
+        _configure_litellm_http_clients()
+        cache_options = (
+            {"cache_control_injection_points": cache_injection_points} if cache_injection_points else {}
+        )
+        return LLM(
+            model=model,
+            api_key=settings.anthropic_api_key,
+            is_litellm=True,
+            stream=stream,
+            **cache_options
+        )
+
+    # Same routing key for every council call so OpenAI sends requests
+    # sharing the static prompts to the same prefix-cache shard
+    return LLM(
+        model=model,
+        api_key=settings.openai_api_key,
+        prompt_cache_key=f"socratspace-{PROMPTS_DIGEST}",
+        stream=stream
+    )
+
+
+@lru_cache(maxsize=1)
+def get_shared_llm() -> "BaseLLM":
+    """Return the process-wide LLM instance shared by all agents."""
+    return _build_llm()
+
+
+@lru_cache(maxsize=1)
+def get_tool_agent_llm() -> "BaseLLM":
+    """
+    Return the LLM for agents with tools: on Anthropic, the task message is
+    cached (see TASK_CACHE_INJECTION_POINTS); otherwise the shared LLM.
+    """
+    if settings.llm_provider != "anthropic":
+        return get_shared_llm()
+    return _build_llm(TASK_CACHE_INJECTION_POINTS)
+
+
+@lru_cache(maxsize=1)
+def get_lead_partner_llm() -> "BaseLLM":
+    """
+    Return the lead partner's LLM: the task message cached on Anthropic
+    (see TASK_CACHE_INJECTION_POINTS) and streaming when
+    settings.stream_lead_partner is set, otherwise the shared LLM.
+    """
+    anthropic = settings.llm_provider == "anthropic"
+    if not anthropic and not settings.stream_lead_partner:
+        return get_shared_llm()
+    return _build_llm(
+        TASK_CACHE_INJECTION_POINTS if anthropic else None,
+        stream=settings.stream_lead_partner
+    )
+
+
+def _build_llm(cache_injection_points: Optional[list] = None, stream: bool = False) -> "BaseLLM":
+    """Create the primary LLM wrapped with the configured pool and response cache."""
+    from agents.llm_cache import CachingLLM
+    from services.response_cache import ResponseCache
+    from agents.llm_pool import PooledLLM
+    from agents.rate_limit import RateLimitedLLM
+
+    llm = create_llm(cache_injection_points=cache_injection_points, stream=stream)
+
+    if settings.llm_fallback_endpoints:
+        endpoints = [llm]
+        for endpoint in settings.llm_fallback_endpoints:
+            provider, model = endpoint.split("/", 1)
+            endpoints.append(create_llm(provider, model, stream=stream))
+        llm = PooledLLM.from_llms(
+            endpoints,
+            [settings.llm_endpoint_concurrency_limit] * len(endpoints)
+        )
+
+    if settings.llm_requests_per_minute:
+        llm = RateLimitedLLM.wrap(llm, get_rate_limiter())
+
+    if settings.llm_cache_enabled:
+        return CachingLLM.wrap(
+            llm,
+            ResponseCache(settings.llm_cache_path, settings.llm_cache_ttl_seconds)
+        )
+    return llm
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter():
+    """Return the process-wide request token bucket (shared by every agent LLM)."""
+    from agents.rate_limit import TokenBucket
+
+    return TokenBucket(settings.llm_requests_per_minute)
+
+
+@lru_cache(maxsize=1)
+def _configure_litellm_http_clients() -> None:
+    """Point LiteLLM at pooled keep-alive HTTP clients (configured once)."""
+    import litellm
+
+    litellm.client_session = httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    litellm.aclient_session = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+async def warm_vllm_prefix_cache(agents: Iterable, client: httpx.AsyncClient) -> None:
+    """
+    Send each agent's system prompt to the vLLM server once so its KV lands
+    in LMCache before the first task arrives.
+
+    Args:
+        agents: CrewAI Agent objects (role, goal, backstory)
+        client: Shared pooled HTTP client (app.state.http)
+    """
+    url = f"{settings.vllm_base_url.rstrip('/')}/chat/completions"
+    headers = {"Authorization": f"Bearer {settings.vllm_api_key}"}
+
+    for agent in agents:
+        system_prompt = f"You are {agent.role}. {agent.backstory}\nYour personal goal is: {agent.goal}"
+        try:
+            response = await client.post(url, headers=headers, json={
+                "model": get_model_name(),
+                "messages": [{"role": "system", "content": system_prompt}],
+                "max_tokens": 1
+            })
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Prefix warm-up failed for {agent.role}: {e}")
+            continue
+        logger.info(f"Warmed vLLM prefix cache for {agent.role}")
@@ -0,0 +1,140 @@
+"""
+Response cache in front of the shared LLM.
+
+Re-running an analysis on the same company sends byte-identical messages to
+every agent, so completions are cached on disk keyed by a hash of the model,
+sampling settings and full message list. A hit skips the API call entirely.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from pydantic import Field
+
+from services.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachingLLM(BaseLLM):
+    """
+    BaseLLM wrapper that serves repeated calls from a ResponseCache.
+
+    Only plain-text completions are cached; tool-call results and structured
+    responses always go to the wrapped LLM.
+    """
+
+    llm_type: str = "cached"
+    inner: BaseLLM = Field(exclude=True)
+    response_cache: Any = Field(exclude=True)
+
+    @classmethod
+    def wrap(cls, inner: BaseLLM, response_cache: ResponseCache) -> "CachingLLM":
+        return cls(
+            model=inner.model,
+            provider=inner.provider,
+            temperature=inner.temperature,
+            seed=inner.seed,
+            stop=list(inner.stop),
+            inner=inner,
+            response_cache=response_cache
+        )
+
+    def _cache_key(self, messages: Any, tools: Optional[list]) -> str:
+        payload = json.dumps(
+            {
+                "model": self.inner.model,
+                "temperature": self.inner.temperature,
+                "seed": self.inner.seed,
+                "stop": sorted(self.stop_sequences),
+                "tools": [str(tool) for tool in tools or []],
+                "messages": messages,
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        cacheable = response_model is None
+        key = self._cache_key(messages, tools) if cacheable else None
+        if cacheable:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.debug("LLM response cache hit (%.12s)", key)
+                return cached
+
+        with call_stop_override(self.inner, self.stop_sequences):
+            result = self.inner.call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+                response_model=response_model,
+            )
+
+        if cacheable and isinstance(result, str) and result:
+            self.response_cache.set(key, result)
+        return result
+
+    async def acall(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        cacheable = response_model is None
+        key = self._cache_key(messages, tools) if cacheable else None
+        if cacheable:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.debug("LLM response cache hit (%.12s)", key)
+                return cached
+
+        with call_stop_override(self.inner, self.stop_sequences):
+            result = await self.inner.acall(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+                response_model=response_model,
+            )
+
+        if cacheable and isinstance(result, str) and result:
+            self.response_cache.set(key, result)
+        return result
+
+    def supports_function_calling(self) -> bool:
+        return self.inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size()
+
+    def supports_multimodal(self) -> bool:
+        return self.inner.supports_multimodal()
+
+    def get_token_usage_summary(self):
+        return self.inner.get_token_usage_summary()
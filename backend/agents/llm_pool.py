@@ -0,0 +1,166 @@
+"""
+Multi-endpoint LLM pool with least-loaded routing and failover.
+
+Each call goes to the endpoint with the lowest in-flight/limit ratio; if that
+endpoint errors (429, 5xx, timeout) the call is retried on the next least
+loaded one, so one slow or throttled provider doesn't stall the debate. Other
+errors (bad requests, response_model validation) would fail the same way on
+every endpoint and are raised as-is.
+"""
+
+import logging
+import threading
+from typing import Any, List
+
+import httpx
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from crewai.types.usage_metrics import UsageMetrics
+from pydantic import Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# Provider SDK connection/timeout errors (openai, anthropic) that don't
+# derive from a builtin; CrewAI re-raises some of them as ConnectionError
+_TRANSPORT_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+
+
+def _status_code(error: BaseException):
+    """HTTP status of a provider error, when the SDK exposes one"""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def _is_failover_error(error: BaseException) -> bool:
+    """
+    Whether another endpoint might succeed: transport errors, timeouts, 429s
+    and 5xx responses, anywhere in the exception's cause chain
+    """
+    seen = set()
+    current = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (ConnectionError, TimeoutError, httpx.TransportError)):
+            return True
+        if type(current).__name__ in _TRANSPORT_ERROR_NAMES:
+            return True
+        status_code = _status_code(current)
+        if status_code is not None and (status_code == 429 or status_code >= 500):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class PooledLLM(BaseLLM):
+    """BaseLLM adapter that spreads calls across several endpoints."""
+
+    llm_type: str = "pooled"
+    endpoints: List[Any] = Field(exclude=True)
+    concurrency_limits: List[int] = Field(exclude=True)
+
+    _in_flight: List[int] = PrivateAttr(default_factory=list)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @classmethod
+    def from_llms(cls, endpoints: List[BaseLLM], concurrency_limits: List[int]) -> "PooledLLM":
+        primary = endpoints[0]
+        pool = cls(
+            model=primary.model,
+            provider=primary.provider,
+            temperature=primary.temperature,
+            seed=primary.seed,
+            stop=list(primary.stop),
+            endpoints=endpoints,
+            concurrency_limits=concurrency_limits
+        )
+        pool._in_flight = [0] * len(endpoints)
+        return pool
+
+    def _ranked_endpoints(self) -> List[int]:
+        """Endpoint indexes ordered by load (ties keep configured priority)"""
+        with self._lock:
+            return sorted(
+                range(len(self.endpoints)),
+                key=lambda i: self._in_flight[i] / self.concurrency_limits[i]
+            )
+
+    def _acquire(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] += 1
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        last_error = None
+        for index in self._ranked_endpoints():
+            endpoint = self.endpoints[index]
+            self._acquire(index)
+            try:
+                with call_stop_override(endpoint, self.stop_sequences):
+                    return endpoint.call(
+                        messages,
+                        tools=tools,
+                        callbacks=callbacks,
+                        available_functions=available_functions,
+                        from_task=from_task,
+                        from_agent=from_agent,
+                        response_model=response_model,
+                    )
+            except Exception as e:
+                if not _is_failover_error(e):
+                    raise
+                logger.warning("LLM endpoint %s failed, failing over: %s", endpoint.model, e)
+                last_error = e
+            finally:
+                self._release(index)
+        raise last_error
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None):
+        last_error = None
+        for index in self._ranked_endpoints():
+            endpoint = self.endpoints[index]
+            self._acquire(index)
+            try:
+                with call_stop_override(endpoint, self.stop_sequences):
+                    return await endpoint.acall(
+                        messages,
+                        tools=tools,
+                        callbacks=callbacks,
+                        available_functions=available_functions,
+                        from_task=from_task,
+                        from_agent=from_agent,
+                        response_model=response_model,
+                    )
+            except Exception as e:
+                if not _is_failover_error(e):
+                    raise
+                logger.warning("LLM endpoint %s failed, failing over: %s", endpoint.model, e)
+                last_error = e
+            finally:
+                self._release(index)
+        raise last_error
+
+    # Capabilities follow the primary endpoint, which the prompts target
+    def supports_function_calling(self) -> bool:
+        return self.endpoints[0].supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.endpoints[0].supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return min(endpoint.get_context_window_size() for endpoint in self.endpoints)
+
+    def supports_multimodal(self) -> bool:
+        return self.endpoints[0].supports_multimodal()
+
+    def get_token_usage_summary(self) -> UsageMetrics:
+        """Token usage summed across every endpoint"""
+        usage = UsageMetrics()
+        for endpoint in self.endpoints:
+            usage.add_usage_metrics(endpoint.get_token_usage_summary())
+        return usage
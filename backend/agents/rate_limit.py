@@ -0,0 +1,111 @@
+"""
+Client-side request rate limiting for the shared LLM.
+
+Research tasks run concurrently, so a burst of agent calls can exceed the
+provider's requests-per-minute quota. A token bucket smooths the burst out
+before it reaches the API; 429s that still occur are retried with backoff by
+CrewAI's BaseLLM call wrapper.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from pydantic import Field
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate_per_minute`."""
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RateLimitedLLM(BaseLLM):
+    """BaseLLM wrapper that takes a token from a TokenBucket before each call."""
+
+    llm_type: str = "rate_limited"
+    inner: BaseLLM = Field(exclude=True)
+    bucket: Any = Field(exclude=True)
+
+    @classmethod
+    def wrap(cls, inner: BaseLLM, bucket: TokenBucket) -> "RateLimitedLLM":
+        return cls(
+            model=inner.model,
+            provider=inner.provider,
+            temperature=inner.temperature,
+            seed=inner.seed,
+            stop=list(inner.stop),
+            inner=inner,
+            bucket=bucket
+        )
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.bucket.acquire()
+        with call_stop_override(self.inner, self.stop_sequences):
+            return self.inner.call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+                response_model=response_model,
+            )
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None):
+        await self.bucket.acquire_async()
+        with call_stop_override(self.inner, self.stop_sequences):
+            return await self.inner.acall(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+                response_model=response_model,
+            )
+
+    def supports_function_calling(self) -> bool:
+        return self.inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size()
+
+    def supports_multimodal(self) -> bool:
+        return self.inner.supports_multimodal()
+
+    def get_token_usage_summary(self):
+        return self.inner.get_token_usage_summary()
@@ -4,15 +4,23 @@ Handle OAuth authentication for MCP services (GitHub, Google Calendar, etc.)
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
 import logging
+
+import orjson
+
 from tools.mcp_client import mcp_client
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Longest an /oauth/events stream waits before reporting "pending"
+OAUTH_EVENT_TIMEOUT = 300.0
+
 class OAuthInitiateResponse(BaseModel):
     oauth_session_id: str
     auth_url: str
@@ -71,11 +79,13 @@ async def initiate_oauth(mcp_name: str):
             status="pending"
         )
     
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"OAuth initiation error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"OAuth initiation failed: {e}", exc_info=True)
+        logger.error(f"OAuth initiation failed: {type(e).__name__}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(status_code=500, detail=f"Failed to initiate OAuth: {str(e)}")
 
 @router.get("/oauth/status/{oauth_session_id}", response_model=OAuthStatusResponse)
@@ -107,69 +117,38 @@ async def check_oauth_status(oauth_session_id: str, mcp_name: str):
                     message="OAuth authentication completed successfully"
                 )
         
-        # Check if we have a pending session for this ID
-        if hasattr(client_instance, '_pending_oauth_sessions'):
-            if oauth_session_id in client_instance._pending_oauth_sessions:
-                pending_session = client_instance._pending_oauth_sessions[oauth_session_id]
-                
-                # Try to check if this session is now completed
-                # Use wait_for_completion with a very short timeout
-                # If session is complete, it returns immediately
-                # If still pending, it will timeout
-                import asyncio
-                try:
-                    # Try waiting with a short timeout
-                    # If session is already complete, wait_for_completion returns immediately
-                    # If still pending, it will timeout
-                    logger.debug(f"Checking if OAuth session {oauth_session_id} is completed...")
-                    await asyncio.wait_for(
-                        client_instance.metorial.oauth.wait_for_completion([pending_session]),
-                        timeout=0.5  # 500ms - should be enough if complete, will timeout if pending
-                    )
-                    # If we get here without timeout, session completed!
-                    logger.info(f"✅ OAuth session {oauth_session_id} is now completed!")
-                    
-                    # Move to completed cache - ensure it's properly stored
-                    client_instance._oauth_sessions[mcp_name] = pending_session
-                    if oauth_session_id in client_instance._pending_oauth_sessions:
-                        del client_instance._pending_oauth_sessions[oauth_session_id]
-                    
-                    # Log cache status for debugging
-                    logger.info(f"OAuth session cached for {mcp_name}. Cached sessions: {list(client_instance._oauth_sessions.keys())}")
-                    
+        # Pending sessions are watched by a background task that sets this
+        # event on completion - a short wait is just a hand-off
+        event = client_instance._oauth_events.get(oauth_session_id)
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=0.05)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                cached_session = client_instance._oauth_sessions.get(mcp_name)
+                if cached_session is not None and cached_session.id == oauth_session_id:
                     return OAuthStatusResponse(
                         oauth_session_id=oauth_session_id,
                         status="completed",
                         message="OAuth authentication completed successfully"
                     )
-                except asyncio.TimeoutError:
-                    # Still pending - timeout means wait_for_completion didn't return quickly
-                    # This could mean: 1) session is still pending, or 2) it's complete but took >500ms
-                    # Let's assume it's still pending for now
-                    logger.debug(f"OAuth session {oauth_session_id} still waiting (timeout)...")
-                    pass
-                except Exception as wait_error:
-                    # Check error message for completion indicators
-                    error_str = str(wait_error).lower()
-                    logger.debug(f"wait_for_completion error: {wait_error}")
-                    
-                    # Some errors indicate completion (e.g., "already completed")
-                    if any(keyword in error_str for keyword in ['complete', 'finished', 'success', 'already', 'done']):
-                        logger.info(f"✅ OAuth session {oauth_session_id} appears completed (from error): {wait_error}")
-                        # Move to completed cache
-                        client_instance._oauth_sessions[mcp_name] = pending_session
-                        if oauth_session_id in client_instance._pending_oauth_sessions:
-                            del client_instance._pending_oauth_sessions[oauth_session_id]
-                        return OAuthStatusResponse(
-                            oauth_session_id=oauth_session_id,
-                            status="completed",
-                            message="OAuth authentication completed successfully"
-                        )
-                    # Other error - might be a real error or just means still pending
-                    logger.debug(f"Error checking session completion (might be pending): {wait_error}")
-                    pass
-        
-        # Session not found or not completed
+                return OAuthStatusResponse(
+                    oauth_session_id=oauth_session_id,
+                    status="failed",
+                    message="OAuth authentication did not complete"
+                )
+
+        # Finished watchers drop their event: a session neither cached nor
+        # pending failed or expired
+        if event is None and oauth_session_id not in client_instance._pending_oauth_sessions:
+            return OAuthStatusResponse(
+                oauth_session_id=oauth_session_id,
+                status="failed",
+                message="OAuth authentication did not complete"
+            )
+
+        # Session not completed yet
         logger.info(f"OAuth session {oauth_session_id} still pending...")
         return OAuthStatusResponse(
             oauth_session_id=oauth_session_id,
@@ -178,13 +157,66 @@ async def check_oauth_status(oauth_session_id: str, mcp_name: str):
         )
     
     except Exception as e:
-        logger.error(f"Error checking OAuth status: {e}", exc_info=True)
+        logger.error(f"Error checking OAuth status: {type(e).__name__}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         return OAuthStatusResponse(
             oauth_session_id=oauth_session_id,
             status="failed",
             message=f"Error checking status: {str(e)}"
         )
 
+@router.get("/oauth/events/{oauth_session_id}")
+async def oauth_events(oauth_session_id: str, mcp_name: str):
+    """
+    Stream the OAuth session's outcome as a single SSE event
+
+    Holds one connection until the session's completion watcher fires (or
+    OAUTH_EVENT_TIMEOUT passes), emits the status and closes - instead of
+    the frontend polling /oauth/status. /oauth/status remains as fallback.
+
+    Args:
+        oauth_session_id: OAuth session ID from initiate_oauth
+        mcp_name: Name of MCP (github, gcalendar, gdrive)
+
+    Returns:
+        StreamingResponse with one OAuthStatusResponse event
+    """
+    client_instance = mcp_client._ensure_instance()
+
+    async def event_generator():
+        event = client_instance._oauth_events.get(oauth_session_id)
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=OAUTH_EVENT_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+
+        cached_session = client_instance._oauth_sessions.get(mcp_name)
+        if cached_session is not None and cached_session.id == oauth_session_id:
+            status = OAuthStatusResponse(
+                oauth_session_id=oauth_session_id,
+                status="completed",
+                message="OAuth authentication completed successfully"
+            )
+        elif event is None or event.is_set():
+            status = OAuthStatusResponse(
+                oauth_session_id=oauth_session_id,
+                status="failed",
+                message="OAuth authentication did not complete"
+            )
+        else:
+            status = OAuthStatusResponse(
+                oauth_session_id=oauth_session_id,
+                status="pending",
+                message="Waiting for authentication..."
+            )
+        yield b"data: " + orjson.dumps(status.model_dump()) + b"\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/oauth/complete/{mcp_name}")
 async def complete_oauth(mcp_name: str, oauth_session_id: str):
     """
@@ -226,7 +258,7 @@ async def complete_oauth(mcp_name: str, oauth_session_id: str):
         }
     
     except Exception as e:
-        logger.error(f"Error completing OAuth: {e}", exc_info=True)
+        logger.error(f"Error completing OAuth: {type(e).__name__}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         return {
             "status": "failed",
             "oauth_session_id": oauth_session_id,
@@ -3,20 +3,24 @@ REST API routes for VC Council
 Handles analysis requests and status polling
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import logging
 
 # Import works from backend/ directory (Railway setup)
 from services.crew_orchestrator import VCCouncilOrchestrator
+from api.sse import sse_manager
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Global orchestrator instance
-orchestrator = VCCouncilOrchestrator()
+
+def get_orchestrator(request: Request) -> VCCouncilOrchestrator:
+    """Return this worker's orchestrator (created in main.lifespan)"""
+    return request.app.state.orchestrator
+
 
 # Request/Response models
 class AnalysisRequest(BaseModel):
@@ -26,19 +30,19 @@ class AnalysisRequest(BaseModel):
     industry: Optional[str] = None
     product_description: Optional[str] = None
     financial_metrics: Optional[Dict[str, Any]] = None
+    batch_mode: bool = False  # Research via OpenAI Batch API (cheaper, up to 24h latency)
 
 class AnalysisResponse(BaseModel):
     status: str
     session_id: str
     message: str
-
-@router.options("/analyze")
-async def analyze_options():
-    """Handle CORS preflight for analyze endpoint"""
-    return {}
+    cache_hit: bool = False  # Served from the analysis cache (no LLM calls)
 
 @router.post("/analyze", response_model=AnalysisResponse)
-async def start_analysis(request: AnalysisRequest):
+async def start_analysis(
+    request: AnalysisRequest,
+    orchestrator: VCCouncilOrchestrator = Depends(get_orchestrator)
+):
     """
     Start a new investment analysis
 
@@ -53,13 +57,22 @@ async def start_analysis(request: AnalysisRequest):
         HTTPException: If analysis fails to start
     """
     try:
-        logger.info(f"Starting analysis for {request.company_name}")
+        logger.info("Starting analysis for %s", request.company_name)
 
         # Start analysis via orchestrator
-        session_id = await orchestrator.start_analysis(request.dict())
-
-        logger.info(f"Analysis started with session: {session_id}")
-
+        session_id = await orchestrator.start_analysis(request.model_dump(exclude_none=True))
+
+        if orchestrator.sessions.get(session_id).cache_hit:
+            # Nothing runs: the stored result is final
+            logger.info("Served cached analysis with session: %s", session_id)
+            return AnalysisResponse(
+                status="completed",
+                session_id=session_id,
+                message=f"Returned the cached analysis for {request.company_name}. The result is available at /api/analysis/{session_id}.",
+                cache_hit=True
+            )
+
+        logger.info("Analysis started with session: %s", session_id)
         return AnalysisResponse(
             status="started",
             session_id=session_id,
@@ -67,11 +80,14 @@ async def start_analysis(request: AnalysisRequest):
         )
 
     except Exception as e:
-        logger.error(f"Failed to start analysis: {e}", exc_info=True)
+        logger.error("Failed to start analysis: %s: %s", type(e).__name__, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(status_code=500, detail=f"Failed to start analysis: {str(e)}")
 
 @router.get("/analysis/{session_id}")
-async def get_analysis_status(session_id: str):
+async def get_analysis_status(
+    session_id: str,
+    orchestrator: VCCouncilOrchestrator = Depends(get_orchestrator)
+):
     """
     Get analysis status and results
 
@@ -85,7 +101,7 @@ async def get_analysis_status(session_id: str):
         HTTPException: If session not found
     """
     try:
-        logger.info(f"Fetching analysis status for {session_id}")
+        logger.debug("Fetching analysis status for %s", session_id)
 
         result = await orchestrator.get_result(session_id)
 
@@ -97,12 +113,12 @@ async def get_analysis_status(session_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting analysis status: {str(e)}", exc_info=True)
+        logger.error("Error getting analysis status: %s: %s", type(e).__name__, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(orchestrator: VCCouncilOrchestrator = Depends(get_orchestrator)):
     """
     Health check endpoint for orchestrator
 
@@ -112,5 +128,7 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "vc-council-orchestrator",
-        "active_sessions": orchestrator.get_session_count()
+        "active_sessions": orchestrator.get_session_count(),
+        "queued_analyses": orchestrator.analysis_queue.qsize(),
+        "sse_dropped_events": sse_manager.dropped_event_count
     }
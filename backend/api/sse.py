@@ -3,89 +3,222 @@ Server-Side Events (SSE) manager for real-time updates to frontend
 Replaces WebSocket with simpler SSE implementation
 """
 
-from fastapi import Request
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from fastapi.responses import StreamingResponse
-from typing import Dict, Any, Optional
-import json
+from typing import Deque, Dict, Any, List, Optional, Set, Tuple
 import asyncio
+import itertools
 import logging
-from datetime import datetime
+import time
+
+import orjson
+
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Seconds between keep-alive pings on each SSE connection (below the 29-60s
+# idle timeouts of common proxies/load balancers)
+PING_INTERVAL = 15.0
+
+# Constant frames are encoded once at import
+# SSE comment line: keeps proxies from idling out the stream and is
+# ignored by EventSource, so the client parses nothing
+PING_FRAME = b": ping\n\n"
+
+# Queued in place of a frame to end a client's stream
+CLOSE_STREAM = None
+
+
+def now_ms() -> int:
+    """Event timestamp: Unix epoch milliseconds (what the frontend's Date() takes)."""
+    return time.time_ns() // 1_000_000
+
+
+def encode_frame(message: Dict[str, Any], event_id: Optional[int] = None) -> bytes:
+    """
+    Encode a {"type", "data"} message as an SSE data frame (orjson, bytes)
+
+    Args:
+        message: Event message
+        event_id: Optional SSE id (becomes the client's EventSource.lastEventId)
+    """
+    # Plain bytes concatenation measured faster than b"".join() or building
+    # into a bytearray; a reused buffer is unsafe since frames are shared
+    # across client queues
+    frame = b"data: " + orjson.dumps(message) + b"\n\n"
+    if event_id is not None:
+        frame = b"id: %d\n" % event_id + frame
+    return frame
+
+
+@dataclass(slots=True, eq=False)
+class Subscriber:
+    """One connected SSE client (hashed by identity)"""
+    queue: asyncio.Queue
+    connected_at: float = field(default_factory=time.monotonic)
+    dropped: int = 0  # Consecutive events dropped for falling behind (reset once it keeps up)
+
 
 class SSEManager:
     """
     Manages SSE connections and broadcasts events
     
-    For each session, maintains a queue of events to send
+    For each session, maintains a queue of encoded SSE frames per client
     """
 
+    __slots__ = (
+        "session_subscribers", "dropped_event_count", "_event_ids", "_history",
+        "_pending_messages", "_subscribed"
+    )
+
     def __init__(self):
-        # session_id -> list of event queues (one per connected client)
-        self.session_queues: Dict[str, list] = {}
+        # session_id -> subscribers (one per connected client)
+        self.session_subscribers: Dict[str, Set[Subscriber]] = {}
+        # Events dropped because a client's queue was full (slow consumers)
+        self.dropped_event_count = 0
+        # Process-wide, increasing SSE event ids
+        self._event_ids = itertools.count(1)
+        # session_id -> recent (event_id, frame) for Last-Event-ID replay,
+        # least recently written session first
+        self._history: "OrderedDict[str, Deque[Tuple[int, bytes]]]" = OrderedDict()
+        # session_id -> (flush timer, agent messages waiting to go out as one batch)
+        self._pending_messages: Dict[str, Tuple[asyncio.TimerHandle, List[Dict[str, Any]]]] = {}
+        # session_id -> event set by the session's first subscriber (see wait_for_subscriber)
+        self._subscribed: Dict[str, asyncio.Event] = {}
 
-    async def subscribe(self, session_id: str) -> asyncio.Queue:
+    async def subscribe(self, session_id: str) -> Subscriber:
         """
         Subscribe to events for a session
         
-        Returns a queue that will receive events
+        Returns a subscriber whose queue receives SSE frames (already serialized)
         """
-        if session_id not in self.session_queues:
-            self.session_queues[session_id] = []
-        
-        queue = asyncio.Queue()
-        self.session_queues[session_id].append(queue)
-        
-        logger.info(f"SSE subscribed for session {session_id}. Total clients: {len(self.session_queues[session_id])}")
-        return queue
+        # Bounded so a stalled client can't grow its backlog without limit
+        subscriber = Subscriber(asyncio.Queue(maxsize=settings.sse_max_queue_size))
+        self.session_subscribers.setdefault(session_id, set()).add(subscriber)
+        subscribed = self._subscribed.get(session_id)
+        if subscribed is not None:
+            subscribed.set()
 
-    async def unsubscribe(self, session_id: str, queue: asyncio.Queue):
+        logger.info("SSE subscribed for session %s. Total clients: %s", session_id, len(self.session_subscribers[session_id]))
+        return subscriber
+
+    async def unsubscribe(self, session_id: str, subscriber: Subscriber):
         """
         Unsubscribe from events for a session
         """
-        if session_id in self.session_queues:
-            try:
-                self.session_queues[session_id].remove(queue)
-                logger.info(f"SSE unsubscribed for session {session_id}. Remaining clients: {len(self.session_queues[session_id])}")
-                
-                # Clean up empty session
-                if not self.session_queues[session_id]:
-                    del self.session_queues[session_id]
-                    logger.info(f"Session {session_id} has no more clients. Removed.")
-            except ValueError:
-                pass
+        subscribers = self.session_subscribers.get(session_id)
+        if subscribers is None:
+            return
+
+        subscribers.discard(subscriber)
+        logger.info("SSE unsubscribed for session %s. Remaining clients: %s", session_id, len(subscribers))
+
+        # Clean up empty session
+        if not subscribers:
+            del self.session_subscribers[session_id]
+            logger.info("Session %s has no more clients. Removed.", session_id)
+
+    async def wait_for_subscriber(self, session_id: str, timeout: float) -> bool:
+        """
+        Wait until a client is subscribed to the session (at most `timeout`
+        seconds), so an analysis doesn't emit its first events into the void
+
+        Returns:
+            True if a client is connected
+        """
+        if self.session_subscribers.get(session_id):
+            return True
+        subscribed = self._subscribed.setdefault(session_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(subscribed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._subscribed.pop(session_id, None)
 
     async def broadcast(self, session_id: str, event_type: str, data: Dict[str, Any]):
+        """Broadcast event to all clients subscribed to a session (see publish)"""
+        self.publish(session_id, event_type, data)
+
+    def publish(self, session_id: str, event_type: str, data: Dict[str, Any]):
         """
         Broadcast event to all clients subscribed to a session
+
+        Never blocks, so it can also be scheduled from crew worker threads
+        with loop.call_soon_threadsafe (it must run on the event loop).
         
         Args:
             session_id: Session ID to broadcast to
             event_type: Type of event (phase_change, agent_message, etc.)
             data: Event data
         """
-        if session_id not in self.session_queues:
-            logger.warning(f"No SSE clients for session {session_id}")
+        # Buffered agent messages go out first, so events stay in order
+        if session_id in self._pending_messages:
+            self._flush_agent_messages(session_id)
+
+        # Serialize once; every client queue (and the replay buffer) gets
+        # the same SSE frame
+        event_id = next(self._event_ids)
+        frame = encode_frame({"type": event_type, "data": data}, event_id)
+        self._remember(session_id, event_id, frame)
+
+        if session_id not in self.session_subscribers:
+            logger.warning("No SSE clients for session %s", session_id)
             return
 
-        message = {
-            "type": event_type,
-            "data": data
-        }
+        # Send to all queues for this session without blocking on slow
+        # clients: a full queue drops its oldest event to make room, so the
+        # newest state (e.g. the decision) is always delivered. Only a client
+        # that stays behind for sse_max_dropped_events in a row is cut off.
+        for subscriber in list(self.session_subscribers[session_id]):
+            queue = subscriber.queue
+            if not queue.full():
+                subscriber.dropped = 0
+            else:
+                queue.get_nowait()
+                self.dropped_event_count += 1
+                subscriber.dropped += 1
+                if subscriber.dropped == 1:
+                    logger.warning("SSE client for session %s is behind - dropping oldest events", session_id)
+                elif subscriber.dropped >= settings.sse_max_dropped_events:
+                    self._disconnect(session_id, subscriber)
+                    continue
+            queue.put_nowait(frame)
 
-        # Send to all queues for this session
-        for queue in self.session_queues[session_id]:
-            try:
-                await queue.put(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to queue: {e}")
+    def _remember(self, session_id: str, event_id: int, frame: bytes):
+        """Keep the frame for clients that reconnect with Last-Event-ID"""
+        history = self._history.get(session_id)
+        if history is None:
+            history = self._history[session_id] = deque(maxlen=settings.sse_replay_buffer_size)
+            if len(self._history) > settings.sse_replay_max_sessions:
+                self._history.popitem(last=False)
+        else:
+            self._history.move_to_end(session_id)
+        history.append((event_id, frame))
+
+    def _disconnect(self, session_id: str, subscriber: Subscriber):
+        """
+        Stop feeding a client that keeps falling behind; its stream ends and
+        the client reconnects with a fresh queue, passing its last event id
+        so the replay buffer fills in what it can
+        """
+        logger.warning(
+            "SSE client for session %s dropped %s events - disconnecting", session_id, subscriber.dropped
+        )
+        self.session_subscribers[session_id].discard(subscriber)
+        queue = subscriber.queue
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(CLOSE_STREAM)
 
     async def send_phase_change(self, session_id: str, phase: str):
         """Broadcast phase change"""
         await self.broadcast(session_id, "phase_change", {
             "phase": phase,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_ms()
         })
 
     async def send_agent_message(
@@ -96,23 +229,74 @@ class SSEManager:
         message_type: str = "info"
     ):
         """Broadcast agent message"""
-        await self.broadcast(session_id, "agent_message", {
+        self.publish_agent_message(session_id, agent, message, message_type)
+
+    def publish_agent_message(
+        self,
+        session_id: str,
+        agent: str,
+        message: str,
+        message_type: str = "info"
+    ):
+        """
+        Broadcast agent message (sync; see publish)
+
+        Messages arriving within settings.sse_batch_window_ms of each other
+        (e.g. steps from four parallel rounds) are sent as one
+        agent_messages_batch event: one frame and one client-side update
+        instead of one per step.
+        """
+        data = {
             "agent": agent,
             "message": message,
             "message_type": message_type,
-            "timestamp": int(datetime.now().timestamp() * 1000)
-        })
+            "timestamp": now_ms()
+        }
+        if settings.sse_batch_window_ms <= 0:
+            self.publish(session_id, "agent_message", data)
+            return
+
+        pending = self._pending_messages.get(session_id)
+        if pending is None:
+            handle = asyncio.get_running_loop().call_later(
+                settings.sse_batch_window_ms / 1000, self._flush_agent_messages, session_id
+            )
+            pending = self._pending_messages[session_id] = (handle, [])
+        pending[1].append(data)
+
+    def _flush_agent_messages(self, session_id: str):
+        """Send a session's buffered agent messages (a lone message keeps the agent_message type)"""
+        pending = self._pending_messages.pop(session_id, None)
+        if pending is None:
+            return
+        handle, messages = pending
+        handle.cancel()  # No-op when the timer itself is flushing
+        if len(messages) == 1:
+            self.publish(session_id, "agent_message", messages[0])
+        else:
+            self.publish(session_id, "agent_messages_batch", {"messages": messages})
 
     async def send_decision(self, session_id: str, decision: Dict[str, Any]):
         """Broadcast final decision"""
         await self.broadcast(session_id, "decision", decision)
 
+    async def send_decision_field(self, session_id: str, field: str, value: Any):
+        """Broadcast one field of the decision as soon as it has streamed in"""
+        self.publish_decision_field(session_id, field, value)
+
+    def publish_decision_field(self, session_id: str, field: str, value: Any):
+        """Broadcast one decision field (sync; see publish)"""
+        self.publish(session_id, "decision_field", {
+            "field": field,
+            "value": value
+        })
+
     async def send_error(self, session_id: str, error_message: str, error_code: str = "ERROR"):
         """Broadcast error"""
         await self.broadcast(session_id, "error", {
             "message": error_message,
             "code": error_code,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_ms()
         })
     
     async def send_oauth_request(self, session_id: str, mcp_name: str, auth_url: str, oauth_session_id: str):
@@ -121,58 +305,93 @@ class SSEManager:
             "mcp_name": mcp_name,
             "auth_url": auth_url,
             "oauth_session_id": oauth_session_id,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_ms()
         })
 
     async def send_ping(self, session_id: str):
         """Send heartbeat ping"""
         await self.broadcast(session_id, "ping", {})
 
-    def stream_events(self, session_id: str, request: Request):
+    def stream_events(self, session_id: str, last_event_id: Optional[int] = None):
         """
         Create an SSE stream for a session
         
         This is the generator function that yields SSE events
+
+        Args:
+            session_id: Session to stream
+            last_event_id: Last-Event-ID sent by a reconnecting EventSource;
+                buffered frames after it are replayed before live events
         """
         async def event_generator():
-            queue = await self.subscribe(session_id)
-            
+            # Snapshot and subscribe with no await in between, so no frame
+            # is both replayed and queued, or missed
+            missed = []
+            if last_event_id is not None:
+                missed = [
+                    frame for event_id, frame in self._history.get(session_id, ())
+                    if event_id > last_event_id
+                ]
+            subscriber = await self.subscribe(session_id)
+            queue = subscriber.queue
+            loop = asyncio.get_running_loop()
+            ping_handle = None
+
+            def enqueue_ping():
+                # Keep-alive rides the same queue as events: one TimerHandle
+                # per client instead of a wait_for() Task per frame
+                nonlocal ping_handle
+                if not queue.full():
+                    queue.put_nowait(PING_FRAME)
+                ping_handle = loop.call_later(PING_INTERVAL, enqueue_ping)
+
             try:
                 # Send initial connection message
-                yield f"data: {json.dumps({'type': 'connected', 'data': {'session_id': session_id}})}\n\n"
-                
-                # Send periodic pings to keep connection alive
-                ping_interval = 30  # seconds
-                last_ping = datetime.now()
-                
+                yield encode_frame({"type": "connected", "data": {"session_id": session_id}})
+
+                if missed:
+                    logger.info("Replaying %s SSE events for session %s", len(missed), session_id)
+                for frame in missed:
+                    yield frame
+
+                ping_handle = loop.call_later(PING_INTERVAL, enqueue_ping)
+
+                # Block on the queue. Client disconnects surface as
+                # cancellation from StreamingResponse (or a failed write of
+                # the next frame/ping).
                 while True:
-                    # Check if client disconnected
-                    if await request.is_disconnected():
-                        logger.info(f"SSE client disconnected for session {session_id}")
+                    frame = await queue.get()
+                    if frame is CLOSE_STREAM:
                         break
-
-                    # Send ping if needed
-                    now = datetime.now()
-                    if (now - last_ping).total_seconds() >= ping_interval:
-                        yield f"data: {json.dumps({'type': 'ping', 'data': {}})}\n\n"
-                        last_ping = now
-
-                    # Try to get message from queue (with timeout)
-                    try:
-                        message = await asyncio.wait_for(queue.get(), timeout=1.0)
-                        yield f"data: {json.dumps(message)}\n\n"
-                    except asyncio.TimeoutError:
-                        # No message, continue loop to check connection and send ping
+                    if queue.empty():
+                        yield frame
                         continue
 
+                    # A burst is waiting (e.g. four rounds finishing steps
+                    # together): send everything queued as one chunk, one
+                    # ASGI send. Concatenated frames parse as separate events.
+                    frames = [frame]
+                    closing = False
+                    while not queue.empty():
+                        frame = queue.get_nowait()
+                        if frame is CLOSE_STREAM:
+                            closing = True
+                            break
+                        frames.append(frame)
+                    yield b"".join(frames)
+                    if closing:
+                        break
+
             except asyncio.CancelledError:
-                logger.info(f"SSE stream cancelled for session {session_id}")
+                logger.info("SSE stream cancelled for session %s", session_id)
             except Exception as e:
-                logger.error(f"SSE stream error for session {session_id}: {e}")
-                yield f"data: {json.dumps({'type': 'error', 'data': {'message': str(e)}})}\n\n"
+                logger.error("SSE stream error for session %s: %s", session_id, e)
+                yield encode_frame({"type": "error", "data": {"message": str(e)}})
             finally:
                 # Cleanup
-                await self.unsubscribe(session_id, queue)
+                if ping_handle is not None:
+                    ping_handle.cancel()
+                await self.unsubscribe(session_id, subscriber)
 
         return event_generator()
 
@@ -1,142 +1,59 @@
 """
 Mock SSE endpoint for testing frontend SSE integration
 Generates realistic mock events without requiring full backend implementation
+
+Every frame is encoded once at import; per session only the session_id and
+timestamps are spliced in, and the decision frame is rebuilt once per day
+(its calendar events are dated today).
 """
 
 import asyncio
-import json
+from datetime import date, datetime, time
+from functools import lru_cache
 from fastapi import Request
 from fastapi.responses import StreamingResponse
-from datetime import datetime
 import logging
 
+from api.sse import encode_frame, now_ms
+
 logger = logging.getLogger(__name__)
 
-
-async def generate_mock_events(session_id: str, request: Request):
-    """
-    Generate mock SSE events for testing
-    Simulates a full analysis flow: research → debate → decision
-    """
-    
-    # IMPORTANT: Send initial connection message immediately
-    # EventSource needs data immediately to establish connection
-    yield f"data: {json.dumps({'type': 'connected', 'data': {'session_id': session_id}})}\n\n"
-    
-    # Flush immediately (FastAPI does this automatically, but just to be safe)
-    # Small delay to ensure connection is established
-    await asyncio.sleep(0.1)
-    
-    # Phase 1: Research Phase
-    yield f"data: {json.dumps({'type': 'phase_change', 'data': {'phase': 'research', 'timestamp': datetime.now().isoformat()}})}\n\n"
-    await asyncio.sleep(0.3)
-    
-    # Research agent messages
-    research_messages = [
-        ("market_researcher", "Analyzing Total Addressable Market (TAM)...", "analysis"),
-        ("founder_evaluator", "Evaluating founder GitHub profile...", "analysis"),
-        ("product_critic", "Evaluating product defensibility...", "analysis"),
-        ("financial_analyst", "Analyzing unit economics...", "analysis"),
-        ("risk_assessor", "Identifying potential risks...", "analysis"),
-        ("market_researcher", "TAM estimated at $5.2B with 30% YoY growth.", "insight"),
-        ("founder_evaluator", "Founder has 127 repositories, strong ML/AI focus.", "insight"),
-        ("product_critic", "Product has strong network effects and proprietary datasets.", "insight"),
-        ("financial_analyst", "LTV:CAC ratio of 5.2:1 (healthy). Current burn rate: $85K/month.", "insight"),
-        ("risk_assessor", "Top risks: Regulatory uncertainty, Competition, Talent acquisition.", "insight"),
-        ("market_researcher", "Market sentiment on HackerNews is highly positive (89%).", "conclusion"),
-        ("founder_evaluator", "Team execution score: 9/10. Strong technical background.", "conclusion"),
-        ("product_critic", "Product-market fit signals: 12 enterprise pilots, 4 signed LOIs.", "conclusion"),
-        ("financial_analyst", "Financial health score: 8/10. Strong unit economics.", "conclusion"),
-        ("risk_assessor", "Risk severity: MEDIUM. Manageable with proper execution.", "conclusion"),
-    ]
-    
-    for agent_id, message, message_type in research_messages:
-        if await request.is_disconnected():
-            return
-        
-        event_data = {
-            'type': 'agent_message',
-            'data': {
-                'agent': agent_id,
-                'message': message,
-                'message_type': message_type,
-                'timestamp': int(datetime.now().timestamp() * 1000)
-            }
-        }
-        yield f"data: {json.dumps(event_data)}\n\n"
-        
-        # Stagger messages for realism
-        await asyncio.sleep(0.5)
-    
-    # Phase 2: Debate Phase
-    await asyncio.sleep(1)
-    yield f"data: {json.dumps({'type': 'phase_change', 'data': {'phase': 'debate', 'timestamp': datetime.now().isoformat()}})}\n\n"
-    await asyncio.sleep(0.3)
-    
-    # Debate agent messages
-    debate_messages = [
-        ("bull_agent", "Building the bull case...", "analysis"),
-        ("bull_agent", "🐂 STRONG BUY: Market growing 30% YoY, exceptional team with Google/DeepMind background, proven product-market fit.", "insight"),
-        ("bear_agent", "Building the bear case...", "analysis"),
-        ("bear_agent", "🐻 CAUTION: Only 14 months runway, 60% revenue concentration risk, facing well-funded competition.", "insight"),
-        ("bull_agent", "Upside potential: 10x in 3 years. Enterprise AI safety is a $50B+ market by 2028.", "conclusion"),
-        ("bear_agent", "Regulatory uncertainty could kill the market. OpenAI and Anthropic entering with 100x more resources.", "conclusion"),
-        ("bull_agent", "This team can execute. Strong unit economics (LTV:CAC 5.2:1) and clear path to profitability.", "conclusion"),
-        ("bear_agent", "Valuation risk: At current traction, difficult to justify post-money valuation expectations.", "conclusion"),
-    ]
-    
-    for agent_id, message, message_type in debate_messages:
-        if await request.is_disconnected():
-            return
-        
-        event_data = {
-            'type': 'agent_message',
-            'data': {
-                'agent': agent_id,
-                'message': message,
-                'message_type': message_type,
-                'timestamp': int(datetime.now().timestamp() * 1000)
-            }
-        }
-        yield f"data: {json.dumps(event_data)}\n\n"
-        
-        await asyncio.sleep(0.6)
-    
-    # Phase 3: Decision Phase
-    await asyncio.sleep(1)
-    yield f"data: {json.dumps({'type': 'phase_change', 'data': {'phase': 'decision', 'timestamp': datetime.now().isoformat()}})}\n\n"
-    await asyncio.sleep(0.3)
-    
-    # Lead Partner messages
-    decision_messages = [
-        ("lead_partner", "Synthesizing all arguments...", "analysis"),
-        ("lead_partner", "Weighing bull vs bear cases against research findings...", "insight"),
-        ("lead_partner", "Final decision reached. Generating investment memo...", "conclusion"),
-    ]
-    
-    for agent_id, message, message_type in decision_messages:
-        if await request.is_disconnected():
-            return
-        
-        event_data = {
-            'type': 'agent_message',
-            'data': {
-                'agent': agent_id,
-                'message': message,
-                'message_type': message_type,
-                'timestamp': int(datetime.now().timestamp() * 1000)
-            }
-        }
-        yield f"data: {json.dumps(event_data)}\n\n"
-        
-        await asyncio.sleep(1)
-    
-    # Final Decision
-    await asyncio.sleep(1)
-    decision = {
-        "decision": "INVEST",
-        "reasoning": "Strong market opportunity with proven team and product-market fit. Risks are manageable with proper execution.",
-        "investment_memo": """# Investment Memo: Test Company
+RESEARCH_MESSAGES = [
+    ("market_researcher", "Analyzing Total Addressable Market (TAM)...", "analysis"),
+    ("founder_evaluator", "Evaluating founder GitHub profile...", "analysis"),
+    ("product_critic", "Evaluating product defensibility...", "analysis"),
+    ("financial_analyst", "Analyzing unit economics...", "analysis"),
+    ("risk_assessor", "Identifying potential risks...", "analysis"),
+    ("market_researcher", "TAM estimated at $5.2B with 30% YoY growth.", "insight"),
+    ("founder_evaluator", "Founder has 127 repositories, strong ML/AI focus.", "insight"),
+    ("product_critic", "Product has strong network effects and proprietary datasets.", "insight"),
+    ("financial_analyst", "LTV:CAC ratio of 5.2:1 (healthy). Current burn rate: $85K/month.", "insight"),
+    ("risk_assessor", "Top risks: Regulatory uncertainty, Competition, Talent acquisition.", "insight"),
+    ("market_researcher", "Market sentiment on HackerNews is highly positive (89%).", "conclusion"),
+    ("founder_evaluator", "Team execution score: 9/10. Strong technical background.", "conclusion"),
+    ("product_critic", "Product-market fit signals: 12 enterprise pilots, 4 signed LOIs.", "conclusion"),
+    ("financial_analyst", "Financial health score: 8/10. Strong unit economics.", "conclusion"),
+    ("risk_assessor", "Risk severity: MEDIUM. Manageable with proper execution.", "conclusion"),
+]
+
+DEBATE_MESSAGES = [
+    ("bull_agent", "Building the bull case...", "analysis"),
+    ("bull_agent", "🐂 STRONG BUY: Market growing 30% YoY, exceptional team with Google/DeepMind background, proven product-market fit.", "insight"),
+    ("bear_agent", "Building the bear case...", "analysis"),
+    ("bear_agent", "🐻 CAUTION: Only 14 months runway, 60% revenue concentration risk, facing well-funded competition.", "insight"),
+    ("bull_agent", "Upside potential: 10x in 3 years. Enterprise AI safety is a $50B+ market by 2028.", "conclusion"),
+    ("bear_agent", "Regulatory uncertainty could kill the market. OpenAI and Anthropic entering with 100x more resources.", "conclusion"),
+    ("bull_agent", "This team can execute. Strong unit economics (LTV:CAC 5.2:1) and clear path to profitability.", "conclusion"),
+    ("bear_agent", "Valuation risk: At current traction, difficult to justify post-money valuation expectations.", "conclusion"),
+]
+
+DECISION_MESSAGES = [
+    ("lead_partner", "Synthesizing all arguments...", "analysis"),
+    ("lead_partner", "Weighing bull vs bear cases against research findings...", "insight"),
+    ("lead_partner", "Final decision reached. Generating investment memo...", "conclusion"),
+]
+
+MOCK_MEMO = """# Investment Memo: Test Company
 
 ## Executive Summary
 
@@ -180,38 +97,107 @@ Test Company demonstrates strong product-market fit with enterprise pilots and g
 
 1. Due diligence kickoff meeting
 2. Partner meeting to review terms
-3. Term sheet negotiation""",
+3. Term sheet negotiation"""
+
+# (title, start, end, attendees, description) - dated today
+MOCK_CALENDAR_EVENTS = [
+    ("Due Diligence Kickoff", time(10, 0), time(11, 0),
+     ["Lead Partner", "Market Researcher", "Financial Analyst"],
+     "Initial due diligence meeting to review company documents"),
+    ("Partner Meeting - Investment Review", time(14, 0), time(15, 30),
+     ["All Partners", "Legal Team"],
+     "Review investment decision and discuss terms"),
+    ("Term Sheet Negotiation", time(16, 0), time(17, 0),
+     ["Lead Partner", "Legal Team", "Founders"],
+     "Finalize term sheet and investment structure"),
+]
+
+
+def _timestamped_frame(event_type: str, data: dict) -> tuple:
+    """
+    Pre-encode a frame whose last data field is "timestamp"
+
+    Returns:
+        (head, tail) bytes; the frame is head + str(now_ms()) + tail
+    """
+    frame = encode_frame({"type": event_type, "data": {**data, "timestamp": 0}})
+    head, tail = frame.rsplit(b"0", 1)
+    return head, tail
+
+
+def _phase_frame(phase: str) -> tuple:
+    return _timestamped_frame("phase_change", {"phase": phase})
+
+
+def _message_frames(messages: list) -> list:
+    return [
+        _timestamped_frame("agent_message", {
+            "agent": agent_id,
+            "message": message,
+            "message_type": message_type
+        })
+        for agent_id, message, message_type in messages
+    ]
+
+
+@lru_cache(maxsize=1)
+def _decision_frame(day: date) -> bytes:
+    """Encode the mock decision with calendar events on `day` (memoized per day)."""
+    decision = {
+        "decision": "INVEST",
+        "reasoning": "Strong market opportunity with proven team and product-market fit. Risks are manageable with proper execution.",
+        "investment_memo": MOCK_MEMO,
         "calendar_events": [
             {
-                "title": "Due Diligence Kickoff",
-                "start_time": (datetime.now().replace(hour=10, minute=0, second=0, microsecond=0).isoformat()),
-                "end_time": (datetime.now().replace(hour=11, minute=0, second=0, microsecond=0).isoformat()),
-                "attendees": ["Lead Partner", "Market Researcher", "Financial Analyst"],
-                "description": "Initial due diligence meeting to review company documents"
-            },
-            {
-                "title": "Partner Meeting - Investment Review",
-                "start_time": (datetime.now().replace(hour=14, minute=0, second=0, microsecond=0).isoformat()),
-                "end_time": (datetime.now().replace(hour=15, minute=30, second=0, microsecond=0).isoformat()),
-                "attendees": ["All Partners", "Legal Team"],
-                "description": "Review investment decision and discuss terms"
-            },
-            {
-                "title": "Term Sheet Negotiation",
-                "start_time": ((datetime.now().replace(hour=16, minute=0, second=0, microsecond=0)).isoformat()),
-                "end_time": ((datetime.now().replace(hour=17, minute=0, second=0, microsecond=0)).isoformat()),
-                "attendees": ["Lead Partner", "Legal Team", "Founders"],
-                "description": "Finalize term sheet and investment structure"
+                "title": title,
+                "start_time": datetime.combine(day, start).isoformat(),
+                "end_time": datetime.combine(day, end).isoformat(),
+                "attendees": attendees,
+                "description": description
             }
+            for title, start, end, attendees, description in MOCK_CALENDAR_EVENTS
         ]
     }
+    return encode_frame({"type": "decision", "data": decision})
+
+
+# Sentinel step: the decision frame (date-dependent, see _decision_frame)
+DECISION_STEP = None
+
+# (delay before the frame in seconds, (head, tail) frame parts or DECISION_STEP)
+# Simulates a full analysis flow: research → debate → decision
+MOCK_SCRIPT = [
+    (0.1, _phase_frame("research")),
+    *((0.3 if i == 0 else 0.5, frame) for i, frame in enumerate(_message_frames(RESEARCH_MESSAGES))),
+    (1.5, _phase_frame("debate")),
+    *((0.3 if i == 0 else 0.6, frame) for i, frame in enumerate(_message_frames(DEBATE_MESSAGES))),
+    (1.6, _phase_frame("decision")),
+    *((0.3 if i == 0 else 1.0, frame) for i, frame in enumerate(_message_frames(DECISION_MESSAGES))),
+    (2.0, DECISION_STEP),
+    (0.5, _phase_frame("completed")),
+]
+
+
+async def generate_mock_events(session_id: str, request: Request):
+    """
+    Generate mock SSE events for testing
+    Simulates a full analysis flow: research → debate → decision
+    """
     
-    yield f"data: {json.dumps({'type': 'decision', 'data': decision})}\n\n"
-    
-    # Mark as completed
-    await asyncio.sleep(0.5)
-    yield f"data: {json.dumps({'type': 'phase_change', 'data': {'phase': 'completed', 'timestamp': datetime.now().isoformat()}})}\n\n"
-    
+    # IMPORTANT: Send initial connection message immediately
+    # EventSource needs data immediately to establish connection
+    yield encode_frame({'type': 'connected', 'data': {'session_id': session_id}})
+
+    for delay, frame in MOCK_SCRIPT:
+        await asyncio.sleep(delay)
+        if await request.is_disconnected():
+            return
+        if frame is DECISION_STEP:
+            yield _decision_frame(date.today())
+        else:
+            head, tail = frame
+            yield head + str(now_ms()).encode() + tail
+
     # Close connection gracefully after completion
     # EventSource will detect the closure, but frontend will know it's a normal completion
     # No need to keep connection open - frontend has all the data
@@ -230,7 +216,7 @@ def create_test_sse_endpoint(session_id: str, request: Request):
         event_generator,
         media_type="text/event-stream",
         headers={
-            "Cache-Control": "no-cache",
+            "Cache-Control": "no-cache, no-transform",
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",
             "Access-Control-Allow-Origin": origin if origin else "*",
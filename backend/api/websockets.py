@@ -1,79 +0,0 @@
-"""
-WebSocket manager for real-time updates to frontend
-Broadcasts agent messages, phase changes, and results
-
-TODO: Implement WebSocket broadcasting
-"""
-
-from fastapi import WebSocket
-from typing import List, Dict, Any
-import json
-import logging
-
-logger = logging.getLogger(__name__)
-
-class WebSocketManager:
-    """
-    Manages WebSocket connections and broadcasts events
-
-    TODO: Implement WebSocket connection management
-    """
-
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        """
-        Accept new WebSocket connection
-
-        TODO: Implement
-        """
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Total: {len(self.active_connections)}")
-
-    def disconnect(self, websocket: WebSocket):
-        """
-        Remove WebSocket connection
-
-        TODO: Implement
-        """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
-
-    async def broadcast(self, event_type: str, data: Dict[str, Any]):
-        """
-        Broadcast event to all connected clients
-
-        Args:
-            event_type: Type of event (phase_change, agent_message, etc.)
-            data: Event data
-
-        TODO: Implement to send JSON to all connections
-        """
-        # TODO: Implement
-        pass
-
-    async def send_phase_change(self, phase: str):
-        """Broadcast phase change"""
-        await self.broadcast("phase_change", {"phase": phase})
-
-    async def send_agent_message(self, agent: str, message: str, message_type: str = "info"):
-        """Broadcast agent message"""
-        await self.broadcast("agent_message", {
-            "agent": agent,
-            "message": message,
-            "message_type": message_type
-        })
-
-    async def send_decision(self, decision: Dict[str, Any]):
-        """Broadcast final decision"""
-        await self.broadcast("decision", decision)
-
-    async def send_error(self, error_message: str):
-        """Broadcast error"""
-        await self.broadcast("error", {"message": error_message})
-
-# Global WebSocket manager instance
-websocket_manager = WebSocketManager()
@@ -3,12 +3,10 @@ Configuration management for VC Council
 Loads environment variables and validates settings
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 from typing import Optional
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class Settings(BaseSettings):
     """Application settings from environment variables"""
@@ -19,8 +17,11 @@ class Settings(BaseSettings):
     llm_provider: str = "openai"
     llm_model: str = "gpt-4-turbo-preview"
     model: Optional[str] = None  # Alias/shortcut for llm_model (deprecated, use llm_model)
+    vllm_base_url: str = "http://localhost:8001/v1"  # LLM_PROVIDER=vllm (local server)
+    vllm_api_key: str = "EMPTY"
+    lmcache_blend_separator: str = " # # "  # Must match LMCACHE_BLEND_SPECIAL_STR; "" disables
 
-    # Mock Mode (for testing)
+    # Mock / Demo Mode (for testing)
     mock_mode: bool = False
 
     # Metorial Configuration
@@ -33,24 +34,78 @@ class Settings(BaseSettings):
     mcp_exa_id: Optional[str] = None  # Bonus: Exa search engine
     mcp_gdrive_id: Optional[str] = None
     mcp_gcalendar_id: Optional[str] = None
+    # Pending OAuth sessions are abandoned after their expiry, or this long if they report none
+    oauth_session_timeout_seconds: float = 900
 
     # Backend Configuration
     backend_host: str = "0.0.0.0"
     backend_port: int = 8000
+    backend_uds: Optional[str] = None  # Unix socket path (e.g. behind a local nginx); overrides host/port
+    backend_reload: bool = True  # `python main.py` is the dev entrypoint; production runs the uvicorn CLI
 
-    # Demo Mode
-    mock_mode: bool = False
+    # SSE
+    sse_max_queue_size: int = 256  # Per-client event backlog; oldest events are dropped beyond this
+    sse_max_dropped_events: int = 1000  # Disconnect a client after this many consecutive drops (it reconnects)
+    sse_replay_buffer_size: int = 100  # Recent events kept per session for Last-Event-ID replay
+    sse_replay_max_sessions: int = 1000  # Sessions with a replay buffer; least recent are evicted
+    sse_connect_timeout_seconds: float = 1.5  # Max wait for the client's SSE connection before an analysis starts emitting
+    sse_batch_window_ms: int = 30  # Agent messages within this window go out as one batch event (0 = off)
+    enable_sse_test_endpoint: bool = False  # Mount /api/sse/test/{session_id} (mock events, frontend dev)
 
     # CORS
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:5174", "http://localhost:3000"]
 
+    # Orchestration
+    preload_agents: bool = True  # Build agents at app import (off for serverless cold starts)
+    crew_verbose: bool = False  # CrewAI step-by-step console output (debug only)
+    max_parallel_research: int = 4  # Research tasks kicked off concurrently
+    analysis_workers: int = 2  # Analyses run concurrently per process; further requests queue
+    crew_threads: int = 8  # Threads for blocking crew kickoffs (up to 4 per running analysis)
+    max_sessions: int = 1024  # Sessions kept in memory; least recently updated are evicted
+    session_ttl_seconds: int = 3600  # Finished sessions expire this long after their last update
+    dry_run: bool = False  # Force max_iter=1 for every agent (smoke tests)
+    min_research_chars: int = 500  # Shorter research output enables Bull/Bear delegation
+    min_cache_hit_rate: float = 0.3  # Warn when cached/prompt tokens of a run drops below this
+    stream_lead_partner: bool = True  # Stream the decision JSON and emit fields as they complete
+    lead_partner_round_digests: bool = True  # Lead Partner sees Tasks 4/8/12/16 (with Round Digests), not all 16
+
+    # Extra "provider/model" endpoints to balance and fail over to,
+    # e.g. LLM_FALLBACK_ENDPOINTS='["openai/gpt-4o"]'
+    llm_fallback_endpoints: list[str] = []
+    llm_endpoint_concurrency_limit: int = 10  # In-flight calls per endpoint before spilling over
+    llm_requests_per_minute: int = 0  # Client-side token bucket; 0 disables
+
+    # Read-only tool results (HackerNews, GitHub, Exa) shared across agents
+    tool_cache_ttl_seconds: int = 900
+
+    # LLM response cache (repeat analyses skip the API call). Opt-in: a hit
+    # replays an earlier completion, which is only wanted for dev/demo reruns
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = ".cache/llm_responses.db"
+    llm_cache_ttl_seconds: int = 24 * 3600
+
+    # Whole-analysis cache (repeat analyses of a company skip the crew).
+    # Opt-in like the LLM response cache: a hit replays an earlier decision
+    analysis_cache_enabled: bool = False
+    analysis_cache_path: str = ".cache/analyses.db"
+    analysis_cache_ttl_seconds: int = 24 * 3600
+
+    # Use agents/prompts_compressed.py (see agents/compress_prompts.py)
+    use_compressed_prompts: bool = False
+
+    # Agent iteration ceilings (max LLM loop iterations per task)
+    max_iter_research: int = 5  # Research agents + risk assessor
+    max_iter_debate: int = 4    # Bull / Bear
+    max_iter_lead: int = 3      # Lead partner
+
     # Output Truncation Limits (set high to prevent data loss)
     max_task_output_chars: int = 50000  # Increased from 2000 to prevent truncation
     max_conclusion_chars: int = 10000   # Increased from 800 to prevent truncation
     max_thought_chars: int = 5000       # Increased from 500 to prevent truncation
 
     model_config = ConfigDict(
-        env_file=".env",  # Load from backend/.env
+        env_file=("../.env", ".env"),  # Repo-root .env, overridden by backend/.env
+        env_nested_delimiter="__",
         case_sensitive=False,
         extra='ignore'  # Ignore extra fields from environment (like MODEL, MOCK_MODE)
     )
@@ -62,7 +117,14 @@ class Settings(BaseSettings):
         if self.llm_provider == "anthropic" and not self.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY is required when using Anthropic")
 
-# Global settings instance
-settings = Settings()
-# TODO: Uncomment when you have real API keys
-# settings.validate_llm_config()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment and .env on first use."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # `from config import settings` resolves lazily to the cached instance
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,31 +3,89 @@ FastAPI Backend for Socrat Space
 Main application entry point
 """
 
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict
+
+import httpx
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from config import settings
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+from config import get_settings
+from agents.definitions import create_all_agents
+from agents.llm import HTTP_LIMITS, HTTP_TIMEOUT, warm_vllm_prefix_cache
 from api.routes import router
+from services.crew_orchestrator import VCCouncilOrchestrator
 from api.sse import sse_manager  # IMPORTANT: Use same import path as orchestrator
 from api.oauth_routes import router as oauth_router  # OAuth routes for GitHub/Calendar auth
-from api.sse_test import create_test_sse_endpoint, generate_mock_events
+import atexit
 import logging
+import logging.handlers
+import queue
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: the event loop only enqueues records; formatting and
+# writing to stderr happen on the QueueListener's thread
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on shutdown
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# Build the shared agents at import time instead of on the first request.
+# Under `gunicorn --preload` the master builds them once and forked workers
+# inherit them copy-on-write; plain uvicorn workers pay the cost at boot.
+# Serverless deploys can set PRELOAD_AGENTS=false to defer it to first use.
+if settings.preload_agents:
+    try:
+        create_all_agents()
+    except Exception as e:
+        logger.warning("Agent preload failed, will retry on first analysis: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create per-process state on startup (one orchestrator per worker)."""
+    # Checked here rather than at import so a missing key is logged, not a boot crash
+    if not settings.mock_mode:
+        try:
+            settings.validate_llm_config()
+        except ValueError as e:
+            logger.error("LLM configuration invalid: %s", e)
+
+    # One pooled client for outbound HTTP, reused across requests and analyses
+    app.state.http = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    app.state.orchestrator = VCCouncilOrchestrator(http_client=app.state.http)
+    app.state.orchestrator.start_workers()
+
+    # Pre-fill the local vLLM/LMCache prefix cache with every agent's backstory
+    if settings.llm_provider == "vllm":
+        await warm_vllm_prefix_cache(create_all_agents().values(), app.state.http)
+
+    yield
+
+    await app.state.orchestrator.stop_workers()
+    await app.state.http.aclose()
+
 # Create FastAPI app
 app = FastAPI(
     title="Socrat Space API",
     description="AI Investment Intelligence - 8-Agent Investment Committee",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Compress JSON responses (e.g. /api/analysis with the full memo and task
+# outputs). SSE streams (text/event-stream) are excluded by Starlette so
+# frames are still flushed one by one.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -41,19 +99,54 @@ app.add_middleware(
 app.include_router(router, prefix="/api")
 app.include_router(oauth_router, prefix="/api")  # OAuth authentication endpoints
 
+# Same origins as the CORS middleware above
+_ALLOWED_ORIGINS = frozenset(settings.cors_origins)
+
+
+@lru_cache(maxsize=32)
+def _cors_headers(origin: str) -> Dict[str, str]:
+    """
+    CORS headers for the SSE routes, built once per origin
+
+    Configured origins are echoed back with credentials; any other origin
+    gets the anonymous wildcard. Callers must copy, not mutate, the result.
+    """
+    if origin in _ALLOWED_ORIGINS:
+        return {
+            "Access-Control-Allow-Origin": origin,
+            "Access-Control-Allow-Credentials": "true",
+            "Access-Control-Allow-Headers": "Cache-Control, Last-Event-ID",
+            "Vary": "Origin",
+        }
+    return {
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Headers": "Cache-Control, Last-Event-ID",
+    }
+
+
+# Headers every SSE response carries, whatever the origin
+_STATIC_SSE_HEADERS = (
+    ("Cache-Control", "no-cache, no-transform"),
+    ("Connection", "keep-alive"),
+    ("X-Accel-Buffering", "no"),
+)
+
+
+@lru_cache(maxsize=32)
+def _sse_headers(origin: str) -> Dict[str, str]:
+    """Complete SSE response headers for an origin (same caveat as _cors_headers)"""
+    return {**dict(_STATIC_SSE_HEADERS), **_cors_headers(origin)}
+
+
 # CORS preflight for SSE
 @app.options("/api/sse/{session_id}")
 async def sse_options(session_id: str, request: Request):
     """Handle CORS preflight for SSE endpoint"""
-    from fastapi.responses import Response
-    origin = request.headers.get("origin", "*")
     return Response(
         status_code=200,
         headers={
-            "Access-Control-Allow-Origin": origin if origin else "*",
-            "Access-Control-Allow-Credentials": "true",
+            **_cors_headers(request.headers.get("origin", "")),
             "Access-Control-Allow-Methods": "GET, OPTIONS",
-            "Access-Control-Allow-Headers": "Cache-Control",
         }
     )
 
@@ -70,45 +163,40 @@ async def sse_endpoint(session_id: str, request: Request):
     Returns:
         StreamingResponse with SSE format
     
-    Note: When backend orchestrator is ready, this will use sse_manager.
-    Currently uses test endpoint for mock events.
+    Mock events for frontend-only work: /api/sse/test/{session_id}
+    (ENABLE_SSE_TEST_ENDPOINT=true)
     """
-    logger.info(f"SSE connection requested for session: {session_id}")
+    logger.info("SSE connection requested for session: %s", session_id)
 
-    # Get origin from request
-    origin = request.headers.get("origin", "*")
+    # A reconnecting EventSource sends the id of the last frame it received;
+    # the frontend's own reconnects pass it as ?last_event_id= instead
+    last_event_id = request.headers.get("last-event-id") or request.query_params.get("last_event_id")
+    last_event_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
 
     # Use real SSE manager connected to orchestrator
-    event_generator = sse_manager.stream_events(session_id, request)
-
-    # Mock implementation (disabled):
-    # event_generator = generate_mock_events(session_id, request)
+    event_generator = sse_manager.stream_events(session_id, last_event_id)
     
     response = StreamingResponse(
         event_generator,
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-            "Access-Control-Allow-Origin": origin if origin else "*",
-            "Access-Control-Allow-Credentials": "true",
-            "Access-Control-Allow-Headers": "Cache-Control, Last-Event-ID",
-        }
+        headers=_sse_headers(request.headers.get("origin", ""))
     )
     
     return response
 
 
-# Test SSE endpoint (explicit test route - can be removed later)
-@app.get("/api/sse/test/{session_id}")
-async def sse_test_endpoint(session_id: str, request: Request):
-    """
-    Test SSE endpoint that generates mock events
-    Use this for testing frontend SSE integration without full backend
-    """
-    logger.info(f"Test SSE connection requested for session: {session_id}")
-    return create_test_sse_endpoint(session_id, request)
+# Test SSE endpoint (mock events), only imported and mounted when enabled
+if settings.enable_sse_test_endpoint:
+    from api.sse_test import create_test_sse_endpoint
+
+    @app.get("/api/sse/test/{session_id}")
+    async def sse_test_endpoint(session_id: str, request: Request):
+        """
+        Test SSE endpoint that generates mock events
+        Use this for testing frontend SSE integration without full backend
+        """
+        logger.info("Test SSE connection requested for session: %s", session_id)
+        return create_test_sse_endpoint(session_id, request)
 
 # Health check
 @app.get("/health")
@@ -117,9 +205,15 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
+    # Development server. Production starts uvicorn directly (railway.toml)
+    # as a single worker: sessions and SSE subscribers live in this process,
+    # so extra workers would need a shared session store and event bus first.
     uvicorn.run(
         "main:app",
         host=settings.backend_host,
         port=settings.backend_port,
-        reload=True
+        uds=settings.backend_uds,
+        reload=settings.backend_reload,
+        loop="uvloop",  # uvloop/httptools ship with uvicorn[standard]
+        http="httptools"
     )
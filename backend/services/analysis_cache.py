@@ -0,0 +1,82 @@
+"""
+Whole-analysis cache for repeat company lookups.
+
+Re-analyzing the same company within the TTL returns the stored decision and
+task outputs without running the crew, so a repeat costs zero LLM calls. Keys
+are built from the normalized company identity (name, website, founder
+GitHub, industry), so "Acme" / "https://www.acme.com/" hits the same entry as
+"acme" / "acme.com", plus the inputs the agents reason over (product
+description, financial metrics), so updated numbers get a fresh analysis.
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Optional
+
+import orjson
+
+from config import settings
+from services.response_cache import ResponseCache
+
+# Only cache real decisions - never ERROR/UNKNOWN fallbacks
+CACHEABLE_DECISIONS = ("PASS", "MAYBE", "INVEST")
+
+
+def _normalize_website(website: str) -> str:
+    website = website.strip().lower()
+    for prefix in ("https://", "http://", "www."):
+        if website.startswith(prefix):
+            website = website[len(prefix):]
+    return website.rstrip("/")
+
+
+def analysis_cache_key(company_data: dict) -> str:
+    """
+    Build the cache key for an analysis request
+
+    Args:
+        company_data: /analyze payload
+
+    Returns:
+        str: BLAKE2b hex digest of the normalized company identity and inputs
+    """
+    identity = "\n".join((
+        (company_data.get("company_name") or "").strip().lower(),
+        _normalize_website(company_data.get("website") or ""),
+        (company_data.get("founder_github") or "").strip().lower(),
+        (company_data.get("industry") or "").strip().lower(),
+        " ".join((company_data.get("product_description") or "").split()),
+    ))
+    digest = hashlib.blake2b(identity.encode("utf-8"), digest_size=16)
+    # Sorted keys: the same metrics in any order give the same key
+    digest.update(orjson.dumps(company_data.get("financial_metrics") or {}, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_analysis_cache() -> ResponseCache:
+    """Return the process-wide analysis cache."""
+    return ResponseCache(settings.analysis_cache_path, settings.analysis_cache_ttl_seconds)
+
+
+def get_cached_analysis(company_data: dict) -> Optional[dict]:
+    """
+    Look up a previous analysis of the same company
+
+    Returns:
+        {"result": decision, "task_outputs": [...]} or None
+    """
+    if not settings.analysis_cache_enabled:
+        return None
+    cached = get_analysis_cache().get(analysis_cache_key(company_data))
+    return orjson.loads(cached) if cached else None
+
+
+def store_analysis(company_data: dict, decision: dict, task_outputs: list) -> None:
+    """Store a completed analysis (real decisions only)."""
+    if not settings.analysis_cache_enabled or decision.get("decision") not in CACHEABLE_DECISIONS:
+        return
+    get_analysis_cache().set(
+        analysis_cache_key(company_data),
+        orjson.dumps({"result": decision, "task_outputs": task_outputs}).decode()
+    )
@@ -7,13 +7,24 @@ Architecture: Independent Round Contexts
 - Round 2 (Team): Tasks 5-8, fresh start (no Round 1 context)
 - Round 3 (Product): Tasks 9-12, fresh start (no previous rounds)
 - Round 4 (Financial): Tasks 13-16, fresh start (no previous rounds)
-- Round 5 (Decision): Task 17, sees ALL 16 previous tasks
+- Round 5 (Decision): Task 17, sees ALL 16 previous tasks (or the round digests)
+
+Rounds 1-4 are independent, so they run as concurrent pipelines (research,
+then the round's debate crew), and Task 17 runs once all four are done.
 """
 
-from crewai import Crew, Process, Task
-from agents.definitions import create_all_agents
-from api.sse import sse_manager
+from crewai import Crew, Process, Task, TaskOutput
+from agents.definitions import (
+    create_all_agents,
+    create_bull_agent,
+    create_bear_agent,
+    needs_more_evidence
+)
+from api.sse import now_ms, sse_manager
 from config import settings
+from services.analysis_cache import get_cached_analysis, store_analysis
+from services.decision_stream import extract_decision, stream_decision_fields
+from services.session_store import Session, SessionStore
 
 # Task imports - your friend is working on these
 # Will be available once task functions are created
@@ -48,25 +59,159 @@ except ImportError as e:
     TASKS_AVAILABLE = False
 
 import asyncio
+import contextvars
+import functools
+import queue
+import threading
 import uuid
 import logging
-import json
-import re
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+
+# Labels of the 17 tasks, in all_tasks order (task_outputs entries)
+TASK_LABELS = (
+    "Task 1: Market Researcher",
+    "Task 2: Bull - Market",
+    "Task 3: Bear - Market",
+    "Task 4: Risk Assessor - Market",
+    "Task 5: Founder Evaluator",
+    "Task 6: Bull - Team",
+    "Task 7: Bear - Team",
+    "Task 8: Risk Assessor - Team",
+    "Task 9: Product Critic",
+    "Task 10: Bull - Product",
+    "Task 11: Bear - Product",
+    "Task 12: Market Researcher - PMF",
+    "Task 13: Financial Analyst",
+    "Task 14: Bull - Financial",
+    "Task 15: Bear - Financial",
+    "Task 16: Risk Assessor - Financial",
+    "Task 17: Lead Partner Decision"
+)
+
+
+def _company_summary(company_data: dict) -> Dict[str, Any]:
+    """The company fields a session keeps for get_result (not the full request)"""
+    return {
+        "company_name": company_data.get("company_name"),
+        "website": company_data.get("website"),
+    }
+
+
+def _sequential_crew(agents: list, tasks: list) -> "Crew":
+    """
+    Build a sequential crew for one stage of an analysis
+
+    Crews are cheap next to their LLM calls, and their tasks carry
+    per-session state (outputs, step callbacks), so they are built per run
+    rather than shared; only the construction options are fixed here.
+    """
+    return Crew(
+        agents=agents,
+        tasks=tasks,
+        process=Process.sequential,
+        verbose=settings.crew_verbose  # Console trace of every step (debug only)
+    )
+
+
+def _run_agents(make_step_callback: Callable[[str], Callable]) -> Dict[str, Any]:
+    """
+    Copy the shared agents for one analysis, each bound to its step callback
+
+    create_all_agents() is built once per process and analysis workers run
+    concurrently, so per-run state only ever goes on these copies.
+    """
+    agents = {}
+    for agent_id, shared_agent in create_all_agents().items():
+        agent = shared_agent.copy()
+        agent.step_callback = make_step_callback(agent.role)
+        agents[agent_id] = agent
+    return agents
+
+
+def _blend_separator() -> str:
+    """LMCache blend separator for research outputs ("" unless serving from vLLM)"""
+    return settings.lmcache_blend_separator if settings.llm_provider == "vllm" else ""
+
+
+def _total_usage(crew_outputs: list):
+    """Sum the token usage of several crew runs (None if none reported any)"""
+    from crewai.types.usage_metrics import UsageMetrics
+
+    usages = [output.token_usage for output in crew_outputs if getattr(output, "token_usage", None)]
+    if not usages:
+        return None
+    total = UsageMetrics()
+    for usage in usages:
+        total.add_usage_metrics(usage)
+    return total
+
+
 class VCCouncilOrchestrator:
     """
     Main orchestrator for VC Council
     Manages 17 sequential tasks through 5 topic-based rounds
     """
 
-    def __init__(self):
-        self.sessions = {}  # Store active sessions
-        self.task_to_agent_map = {}  # Map session_id -> list of agent role names (one per task, 17 total)
-        self.current_task_index = {}  # Map session_id -> current task index (0-16)
+    def __init__(self, http_client=None):
+        # Shared pooled httpx.AsyncClient for outbound calls (app.state.http)
+        self.http_client = http_client
+        self.sessions = SessionStore(settings.max_sessions, settings.session_ttl_seconds)
+        # (session_id, company_data) jobs drained by the analysis worker pool
+        self.analysis_queue: asyncio.Queue = asyncio.Queue()
+        self._workers: list = []
+        # Cached-analysis replays in flight (the loop only keeps weak references to tasks)
+        self._replays: set = set()
+        # Step messages from crew threads, drained on the loop by _drain_steps;
+        # _drain_scheduled (under _drain_lock) keeps it to one wakeup per burst
+        self._pending_steps: queue.SimpleQueue = queue.SimpleQueue()
+        self._drain_lock = threading.Lock()
+        self._drain_scheduled = False
+        # Blocking crew kickoffs run here rather than in the loop's default
+        # executor, which to_thread shares with every other caller
+        self._crew_executor = ThreadPoolExecutor(
+            max_workers=settings.crew_threads,
+            thread_name_prefix="crew"
+        )
+
+    def start_workers(self, count: Optional[int] = None):
+        """
+        Spawn the analysis worker pool (idempotent)
+
+        Args:
+            count: Number of workers (default: settings.analysis_workers)
+        """
+        if self._workers:
+            return
+        count = count or settings.analysis_workers
+        self._workers = [
+            asyncio.create_task(self._analysis_worker(i)) for i in range(count)
+        ]
+        logger.info(f"Started {count} analysis workers")
+
+    async def stop_workers(self):
+        """Cancel the worker pool (running analyses are abandoned)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._crew_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _analysis_worker(self, worker_id: int):
+        """Run queued analyses one at a time"""
+        while True:
+            session_id, company_data = await self.analysis_queue.get()
+            try:
+                await self._run_analysis(session_id, company_data)
+            except Exception as e:
+                # _run_analysis records its own failures; this only guards the pool
+                logger.error(f"Analysis worker {worker_id} failed on session {session_id}: {type(e).__name__}: {e}")
+            finally:
+                self.analysis_queue.task_done()
 
     async def start_analysis(self, company_data: dict) -> str:
         """
@@ -79,18 +224,51 @@ class VCCouncilOrchestrator:
             session_id: Unique ID for this analysis
         """
         session_id = str(uuid.uuid4())
-        self.sessions[session_id] = {
-            "status": "running",
-            "company_data": company_data,
-            "result": None
-        }
 
-        # Run analysis in background
-        asyncio.create_task(self._run_analysis(session_id, company_data))
-
-        logger.info(f"Started analysis for {company_data.get('company_name')} (session: {session_id})")
+        # SQLite lookup: kept off the event loop
+        cached = None if company_data.get("batch_mode") else await asyncio.to_thread(get_cached_analysis, company_data)
+        if cached:
+            self.sessions.set(session_id, Session(
+                status="completed",
+                company_data=_company_summary(company_data),
+                result=cached["result"],
+                task_outputs=cached["task_outputs"],
+                cache_hit=True,
+                completed_at=datetime.now().isoformat()
+            ))
+            replay = asyncio.create_task(self._replay_cached_analysis(session_id, cached["result"]))
+            self._replays.add(replay)
+            replay.add_done_callback(self._replays.discard)
+            logger.info(f"Served cached analysis for {company_data.get('company_name')} (session: {session_id})")
+            return session_id
+
+        # The full payload travels with the queued job, not the session
+        self.sessions.set(session_id, Session(company_data=_company_summary(company_data)))
+
+        # Hand off to the worker pool; the request returns immediately and
+        # at most settings.analysis_workers crews run at once per process
+        self.start_workers()
+        self.analysis_queue.put_nowait((session_id, company_data))
+
+        logger.info(
+            f"Queued analysis for {company_data.get('company_name')} "
+            f"(session: {session_id}, queue depth: {self.analysis_queue.qsize()})"
+        )
         return session_id
 
+    async def _replay_cached_analysis(self, session_id: str, decision: dict):
+        """Send a cached decision to the session's SSE client"""
+        # Same SSE connection race as _run_analysis
+        await sse_manager.wait_for_subscriber(session_id, settings.sse_connect_timeout_seconds)
+        await sse_manager.send_agent_message(
+            session_id,
+            "system",
+            "Returning the cached analysis from an earlier run on this company",
+            "info"
+        )
+        await sse_manager.send_decision(session_id, decision)
+        await sse_manager.send_phase_change(session_id, "completed")
+
     async def _run_analysis(self, session_id: str, company_data: dict):
         """
         Execute 17 sequential tasks through 5 topic rounds
@@ -107,9 +285,11 @@ class VCCouncilOrchestrator:
         try:
             logger.info(f"Starting 17-task analysis for {company_data['company_name']}")
 
-            # Wait briefly for SSE client to connect (avoid race condition)
+            # Wait briefly for SSE client to connect (avoid race condition);
+            # returns as soon as it subscribes
             logger.info(f"Waiting for SSE client to connect for session {session_id}...")
-            await asyncio.sleep(1.5)  # Give frontend time to establish SSE connection
+            if not await sse_manager.wait_for_subscriber(session_id, settings.sse_connect_timeout_seconds):
+                logger.info(f"No SSE client yet for session {session_id} - starting anyway")
 
             # Send starting message via SSE
             await sse_manager.send_phase_change(session_id, "initializing")
@@ -120,9 +300,20 @@ class VCCouncilOrchestrator:
                 "info"
             )
 
-            # Create all 8 agents
+            # Callbacks hold the Session itself, so steps never look it up
+            # (and it goes when the session is evicted)
+            session = self.sessions.get(session_id)
+
+            # Create thread-safe callbacks for SSE broadcasting
+            def make_step_callback(agent_role: str):
+                def step_callback_sync(step_output):
+                    """Runs on the crew thread; hands the step to the loop without blocking"""
+                    self._step_callback(loop, session, session_id, step_output, agent_role)
+                return step_callback_sync
+
+            # Create all 8 agents (this analysis's copies of the shared set)
             logger.info("Creating 8 agents...")
-            agents = create_all_agents()
+            agents = _run_agents(make_step_callback)
             logger.info(f"Agents created: {list(agents.keys())}")
 
             # Check if tasks are available
@@ -133,8 +324,11 @@ class VCCouncilOrchestrator:
                     "Task functions are being implemented. Please wait for completion.",
                     "TASKS_NOT_READY"
                 )
-                self.sessions[session_id]["status"] = "pending_tasks"
-                self.sessions[session_id]["message"] = "Waiting for task implementations"
+                self.sessions.update(
+                    session_id,
+                    status="pending_tasks",
+                    message="Waiting for task implementations"
+                )
                 return
 
             # ==========================================
@@ -221,13 +415,20 @@ class VCCouncilOrchestrator:
             await sse_manager.send_phase_change(session_id, "final_decision")
 
             # Task 17: Lead Partner (context=[Tasks 1-16])  ← Full debate history!
+            # With round digests, only the round-closing tasks (each ends in a
+            # Round Digest), cutting the decision prompt roughly 4x
+            if settings.lead_partner_round_digests:
+                decision_context = [task_4, task_8, task_12, task_16]
+            else:
+                decision_context = [task_1, task_2, task_3, task_4,      # Round 1
+                                    task_5, task_6, task_7, task_8,      # Round 2
+                                    task_9, task_10, task_11, task_12,   # Round 3
+                                    task_13, task_14, task_15, task_16]  # Round 4
             task_17 = create_lead_partner_decision_task(
                 agents,
                 company_data,
-                context=[task_1, task_2, task_3, task_4,      # Round 1
-                         task_5, task_6, task_7, task_8,      # Round 2
-                         task_9, task_10, task_11, task_12,   # Round 3
-                         task_13, task_14, task_15, task_16]  # Round 4
+                context=decision_context,
+                round_digests=settings.lead_partner_round_digests
             )
 
             # ==========================================
@@ -247,34 +448,13 @@ class VCCouncilOrchestrator:
             # BUILD TASK-TO-AGENT MAPPING
             # Extract agent role from each task for step_callback attribution
             # ==========================================
-            task_agent_map = []
-            for i, task in enumerate(all_tasks):
-                agent_role = task.agent.role if hasattr(task, 'agent') and hasattr(task.agent, 'role') else "unknown"
-                task_agent_map.append(agent_role)
-                logger.info(f"Task {i+1} mapped to agent: {agent_role}")
+            task_agent_map = tuple(getattr(task.agent, 'role', "unknown") for task in all_tasks)
+            logger.debug("Task-to-agent mapping: %s", task_agent_map)
 
-            # Store mapping for this session
-            self.task_to_agent_map[session_id] = task_agent_map
-            self.current_task_index[session_id] = 0  # Start at task 0
+            # Store mapping on the session
+            self.sessions.update(session_id, task_to_agent_map=task_agent_map, current_task_index=0)
             logger.info(f"✅ Task-to-agent mapping created for session {session_id}: {len(task_agent_map)} tasks mapped")
 
-            # Create crew with thread-safe callbacks for SSE broadcasting
-            def step_callback_sync(step_output):
-                """Thread-safe wrapper for async step callback (agent activity)"""
-                asyncio.run_coroutine_threadsafe(
-                    self._step_callback(session_id, step_output),
-                    loop
-                )
-
-            crew = Crew(
-                agents=list(agents.values()),
-                tasks=all_tasks,
-                process=Process.sequential,  # Run tasks in order
-                verbose=True,
-                step_callback=step_callback_sync
-            )
-
-            logger.info("Starting 17-task sequential debate...")
             await sse_manager.send_agent_message(
                 session_id,
                 "system",
@@ -282,142 +462,122 @@ class VCCouncilOrchestrator:
                 "info"
             )
 
-            # Run the crew (blocking, so use asyncio.to_thread)
-            result = await asyncio.to_thread(
-                crew.kickoff,
-                inputs=company_data
-            )
+            # ==========================================
+            # ROUNDS 1-4: PARALLEL PIPELINES
+            # Rounds never see each other's output, so each runs as its own
+            # pipeline: research, then Bull -> Bear -> closing task. Within a
+            # round every task reads the ones before it (Bear rebuts Bull, the
+            # closing task weighs both), so that chain stays sequential; what
+            # overlaps is each round starting its debate as soon as its own
+            # research is in, instead of waiting for every round's research.
+            # ==========================================
+            rounds = [
+                (task_1, [task_2, task_3, task_4]),      # Round 1: Market
+                (task_5, [task_6, task_7, task_8]),      # Round 2: Team
+                (task_9, [task_10, task_11, task_12]),   # Round 3: Product
+                (task_13, [task_14, task_15, task_16]),  # Round 4: Financial
+            ]
+            research_tasks = [research_task for research_task, _ in rounds]
+
+            if company_data.get("batch_mode"):
+                # Batch research is a single submission covering every round
+                logger.info(f"Submitting {len(research_tasks)} research tasks to the Batch API...")
+                await self._run_research_batch(session_id, research_tasks, company_data)
+                research_slots = None
+            else:
+                research_slots = asyncio.Semaphore(settings.max_parallel_research)
+
+            logger.info(f"Starting {len(rounds)} rounds in parallel...")
+            round_results = await asyncio.gather(*(
+                self._run_round(
+                    research_task,
+                    debate_tasks,
+                    company_data,
+                    agents,
+                    make_step_callback,
+                    research_slots
+                )
+                for research_task, debate_tasks in rounds
+            ))
+            round_results = [output for outputs in round_results for output in outputs]
+
+            # ==========================================
+            # ROUND 5: FINAL DECISION (Task 17)
+            # ==========================================
+            crew = _sequential_crew([task_17.agent], [task_17])
+
+            # Relay each decision field to the frontend as the lead partner streams it
+            def on_decision_field(field, value):
+                loop.call_soon_threadsafe(sse_manager.publish_decision_field, session_id, field, value)
+
+            # Run the crew (blocking, so on the crew thread pool)
+            with stream_decision_fields(task_17, on_decision_field):
+                result = await self._kickoff(crew, company_data)
+
+            separator = _blend_separator()
+            if separator:
+                for task in research_tasks:
+                    if task.output:
+                        task.output.raw = task.output.raw[len(separator):-len(separator)]
+
+            self._log_cache_hit_rate(_total_usage([*round_results, result]))
 
             # Capture individual task outputs
             task_outputs = []
-            task_labels = [
-                "Task 1: Market Researcher",
-                "Task 2: Bull - Market",
-                "Task 3: Bear - Market",
-                "Task 4: Risk Assessor - Market",
-                "Task 5: Founder Evaluator",
-                "Task 6: Bull - Team",
-                "Task 7: Bear - Team",
-                "Task 8: Risk Assessor - Team",
-                "Task 9: Product Critic",
-                "Task 10: Bull - Product",
-                "Task 11: Bear - Product",
-                "Task 12: Market Researcher - PMF",
-                "Task 13: Financial Analyst",
-                "Task 14: Bull - Financial",
-                "Task 15: Bear - Financial",
-                "Task 16: Risk Assessor - Financial",
-                "Task 17: Lead Partner Decision"
-            ]
 
             for i, task in enumerate(all_tasks):
                 try:
                     output = str(task.output) if hasattr(task, 'output') and task.output else "No output"
                     task_outputs.append({
                         "task_number": i + 1,
-                        "task_label": task_labels[i],
-                        "agent": task.agent.role if hasattr(task, 'agent') else "Unknown",
+                        "task_label": TASK_LABELS[i],
+                        "agent": task_agent_map[i],
                         "output": output[:settings.max_task_output_chars]  # Configurable limit (default: 50000 chars)
                     })
                 except Exception as e:
                     logger.error(f"Error capturing task {i+1} output: {e}")
                     task_outputs.append({
                         "task_number": i + 1,
-                        "task_label": task_labels[i],
+                        "task_label": TASK_LABELS[i],
                         "error": str(e)
                     })
 
             # Parse and store result
             logger.info(f"Crew completed. Result type: {type(result)}")
-            logger.info(f"Result attributes: {dir(result) if hasattr(result, '__dict__') else 'N/A'}")
-            
+
             # CrewAI returns a CrewOutput object, we need to extract the actual output
-            # Try multiple ways to extract the decision JSON
             decision = None
             raw_output = None
-            
-            # Try to get raw output from CrewOutput
-            if hasattr(result, 'raw'):
-                raw_output = result.raw
-                logger.info(f"Extracted from result.raw (type: {type(raw_output)}, length: {len(str(raw_output)) if raw_output else 0})")
-            elif hasattr(result, 'output'):
-                raw_output = result.output
-                logger.info(f"Extracted from result.output (type: {type(raw_output)}, length: {len(str(raw_output)) if raw_output else 0})")
-            elif hasattr(result, 'final_answer'):
-                raw_output = result.final_answer
-                logger.info(f"Extracted from result.final_answer (type: {type(raw_output)}, length: {len(str(raw_output)) if raw_output else 0})")
-            elif isinstance(result, str):
-                raw_output = result
-                logger.info(f"Result is already a string (length: {len(raw_output)})")
+
+            # Structured output (InvestmentDecision) - the normal path
+            if getattr(result, 'pydantic', None) is not None:
+                decision = result.pydantic.model_dump()
+                logger.info(f"Decision from structured output: {decision['decision']}")
             elif isinstance(result, dict):
                 # Already a dict, use it directly
                 decision = result
                 logger.info(f"Result is already a dict: {decision.get('decision', 'UNKNOWN')}")
             else:
-                # Try converting to string
-                raw_output = str(result)
-                logger.info(f"Converted result to string (length: {len(raw_output)})")
-            
+                # Fallback: providers without structured output - parse the raw text
+                raw_output = (
+                    getattr(result, 'raw', None)
+                    or getattr(result, 'output', None)
+                    or getattr(result, 'final_answer', None)
+                    or (result if isinstance(result, str) else str(result))
+                )
+                logger.info(f"Parsing decision from text output (type: {type(raw_output).__name__})")
+
             # If we don't have decision yet and have raw_output, try to parse it
             if not decision and raw_output:
-                # If it's a string, try to find JSON in it
+                # If it's a string, find the decision JSON in it
+                # (CrewAI output often has "Final Answer:" prefix or is wrapped in markdown)
                 if isinstance(raw_output, str):
-                    # Look for JSON object in the string
-                    # CrewAI output often has "Final Answer:" prefix or is wrapped in markdown
-                    json_start = raw_output.find('{')
-                    json_end = raw_output.rfind('}') + 1
-                    
-                    if json_start != -1 and json_end > json_start:
-                        json_str = raw_output[json_start:json_end]
-                        logger.debug(f"Found JSON in string (start: {json_start}, end: {json_end}, length: {len(json_str)})")
-                        try:
-                            decision = json.loads(json_str)
-                            logger.info(f"✅ Successfully parsed JSON decision: {decision.get('decision', 'UNKNOWN')}")
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse JSON from string: {e}")
-                            logger.debug(f"JSON string preview: {json_str[:500]}")
-                            # Try to extract decision field using regex as fallback
-                            decision_match = re.search(r'"decision"\s*:\s*"([^"]+)"', raw_output, re.IGNORECASE)
-                            if decision_match:
-                                decision_type = decision_match.group(1).upper()
-                                logger.info(f"Extracted decision using regex: {decision_type}")
-                                
-                                # Try to extract other fields too
-                                reasoning_match = re.search(r'"reasoning"\s*:\s*"([^"]+)"', raw_output, re.IGNORECASE | re.DOTALL)
-                                memo_match = re.search(r'"investment_memo"\s*:\s*"([^"]+)"', raw_output, re.IGNORECASE | re.DOTALL)
-                                events_match = re.search(r'"calendar_events"\s*:\s*(\[[^\]]+\])', raw_output, re.IGNORECASE | re.DOTALL)
-                                
-                                decision = {
-                                    "decision": decision_type,
-                                    "reasoning": reasoning_match.group(1) if reasoning_match else "No reasoning provided",
-                                    "investment_memo": memo_match.group(1) if memo_match else "No memo provided",
-                                    "calendar_events": json.loads(events_match.group(1)) if events_match else []
-                                }
-                            else:
-                                logger.error("Could not extract decision from output")
-                                decision = {"decision": "ERROR", "raw_output": raw_output[:2000]}
+                    decision = extract_decision(raw_output)
+                    if decision:
+                        logger.info(f"✅ Successfully parsed decision: {decision.get('decision', 'UNKNOWN')}")
                     else:
-                        # No JSON found, try regex to extract decision
-                        logger.debug("No JSON braces found, trying regex extraction")
-                        decision_match = re.search(r'"decision"\s*:\s*"([^"]+)"', raw_output, re.IGNORECASE)
-                        if decision_match:
-                            decision_type = decision_match.group(1).upper()
-                            logger.info(f"Extracted decision using regex: {decision_type}")
-                            
-                            # Extract other fields
-                            reasoning_match = re.search(r'"reasoning"\s*:\s*"([^"]+)"', raw_output, re.IGNORECASE | re.DOTALL)
-                            memo_match = re.search(r'"investment_memo"\s*:\s*"([^"]+)"', raw_output, re.IGNORECASE | re.DOTALL)
-                            events_match = re.search(r'"calendar_events"\s*:\s*(\[[^\]]+\])', raw_output, re.IGNORECASE | re.DOTALL)
-                            
-                            decision = {
-                                "decision": decision_type,
-                                "reasoning": reasoning_match.group(1) if reasoning_match else "No reasoning provided",
-                                "investment_memo": memo_match.group(1) if memo_match else "No memo provided",
-                                "calendar_events": json.loads(events_match.group(1)) if events_match else []
-                            }
-                        else:
-                            logger.error(f"Could not find decision in output. Raw output preview: {raw_output[:500]}")
-                            decision = {"decision": "ERROR", "raw_output": raw_output[:2000]}
+                        logger.error(f"Could not find decision in output. Raw output preview: {raw_output[:500]}")
+                        decision = {"decision": "ERROR", "raw_output": raw_output[:2000]}
                 else:
                     # Not a string, try to use it directly if it's a dict
                     if isinstance(raw_output, dict):
@@ -434,10 +594,14 @@ class VCCouncilOrchestrator:
                 logger.error(f"Result str preview: {str(result)[:500]}")
                 decision = {"decision": "UNKNOWN", "raw_output": str(result)[:2000]}
 
-            self.sessions[session_id]["status"] = "completed"
-            self.sessions[session_id]["result"] = decision
-            self.sessions[session_id]["task_outputs"] = task_outputs  # Store individual task outputs
-            self.sessions[session_id]["completed_at"] = datetime.now().isoformat()
+            self.sessions.update(
+                session_id,
+                status="completed",
+                result=decision,
+                task_outputs=task_outputs,  # Store individual task outputs
+                completed_at=datetime.now().isoformat()
+            )
+            await asyncio.to_thread(store_analysis, company_data, decision, task_outputs)
 
             # Broadcast final decision via SSE
             await sse_manager.send_decision(session_id, decision)
@@ -481,7 +645,7 @@ class VCCouncilOrchestrator:
                     await sse_manager.broadcast(session_id, "freelancer_job_notification", {
                         "content": job_content,
                         "company": company_data.get("company_name", "Unknown Company"),
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_ms()
                     })
 
                     logger.info(f"Freelancer job notification sent for {company_data.get('company_name')}")
@@ -496,25 +660,14 @@ class VCCouncilOrchestrator:
             if decision and "calendar_events" in decision and decision["calendar_events"]:
                 await self._create_calendar_events(session_id, decision["calendar_events"])
 
-            # Cleanup task tracking state
-            if session_id in self.task_to_agent_map:
-                del self.task_to_agent_map[session_id]
-            if session_id in self.current_task_index:
-                del self.current_task_index[session_id]
-            logger.info(f"[CLEANUP] Removed task tracking for completed session {session_id}")
-
         except Exception as e:
             logger.error(f"Analysis failed: {str(e)}", exc_info=True)
-            self.sessions[session_id]["status"] = "failed"
-            self.sessions[session_id]["error"] = str(e)
-            self.sessions[session_id]["failed_at"] = datetime.now().isoformat()
-
-            # Cleanup task tracking state
-            if session_id in self.task_to_agent_map:
-                del self.task_to_agent_map[session_id]
-            if session_id in self.current_task_index:
-                del self.current_task_index[session_id]
-            logger.info(f"[CLEANUP] Removed task tracking for failed session {session_id}")
+            self.sessions.update(
+                session_id,
+                status="failed",
+                error=str(e),
+                failed_at=datetime.now().isoformat()
+            )
 
             # Broadcast error via SSE
             try:
@@ -527,24 +680,186 @@ class VCCouncilOrchestrator:
             except Exception as sse_error:
                 logger.error(f"Failed to broadcast error via SSE: {sse_error}")
 
-    async def _step_callback(self, session_id: str, step_output):
+    def _log_cache_hit_rate(self, usage):
+        """
+        Log prompt-cache effectiveness for a crew run and warn on a low hit rate
+
+        Args:
+            usage: CrewAI UsageMetrics (prompt_tokens, cached_prompt_tokens,
+                cache_creation_tokens) or None
+        """
+        if usage is None or not usage.prompt_tokens:
+            return
+
+        hit_rate = usage.cached_prompt_tokens / usage.prompt_tokens
+        logger.info(
+            f"Prompt cache: {usage.cached_prompt_tokens}/{usage.prompt_tokens} prompt tokens read from cache "
+            f"({hit_rate:.0%}), {usage.cache_creation_tokens} written"
+        )
+        if hit_rate < settings.min_cache_hit_rate:
+            logger.warning(
+                f"Prompt cache hit rate {hit_rate:.0%} is below {settings.min_cache_hit_rate:.0%} - "
+                "check for dynamic content in the static prompt prefixes"
+            )
+
+    async def _kickoff(self, crew: Crew, inputs: dict):
+        """
+        Run crew.kickoff on the crew thread pool
+
+        Like asyncio.to_thread, the caller's contextvars are carried over.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, crew.kickoff, inputs=inputs)
+        return await loop.run_in_executor(self._crew_executor, call)
+
+    async def _run_round(
+        self,
+        research_task: Task,
+        debate_tasks: list,
+        company_data: dict,
+        agents: dict,
+        make_step_callback: Callable[[str], Callable],
+        research_slots: Optional[asyncio.Semaphore]
+    ) -> list:
+        """
+        Run one topic round: its research task, then the debate as a
+        sequential Crew (Bull -> Bear -> closing task)
+
+        Bull, Bear and the Risk Assessor take part in every round, and a
+        CrewAI Agent keeps its executor state on itself while it runs, so the
+        debate works on this round's own copies of the analysis's agents.
+
+        Args:
+            research_task: The round-opening research task
+            debate_tasks: The round's remaining tasks, in order
+            company_data: Inputs passed to the crew kickoffs
+            agents: This analysis's agents, by agent id
+            make_step_callback: Builds the SSE step callback for an agent role
+            research_slots: Bounds concurrent research kickoffs; None when
+                the research already ran (batch mode)
+
+        Returns:
+            list of CrewOutput for the crews this round ran
+        """
+        outputs = []
+        if research_slots is not None:
+            async with research_slots:
+                research_crew = _sequential_crew([research_task.agent], [research_task])
+                outputs.append(await self._kickoff(research_crew, company_data))
+
+        # Bull/Bear only get delegation when this round's research came back
+        # thin; otherwise it just adds extra research round-trips.
+        coworkers = []
+        research_output = research_task.output.raw if research_task.output else ""
+        if needs_more_evidence([research_output]):
+            logger.info(f"Research for '{research_task.agent.role}' incomplete - enabling Bull/Bear delegation")
+            delegating = {
+                id(agents["bull_agent"]): create_bull_agent(allow_delegation=True),
+                id(agents["bear_agent"]): create_bear_agent(allow_delegation=True)
+            }
+            for task in debate_tasks:
+                task.agent = delegating.get(id(task.agent), task.agent)
+            coworkers = [
+                delegating.get(id(agent), agent)
+                for agent_id, agent in agents.items() if agent_id != "lead_partner"
+            ]
+
+        # The research output reaches Bull, Bear and Risk behind different
+        # prefixes. Fencing it with LMCache's blend separator lets a local
+        # vLLM server reuse its KV position-independently (removed again
+        # once the decision is made).
+        separator = _blend_separator()
+        if separator and research_task.output:
+            research_task.output.raw = f"{separator}{research_task.output.raw}{separator}"
+
+        copies = {}
+
+        def copy_of(agent):
+            if id(agent) not in copies:
+                copy = agent.copy()
+                copy.step_callback = make_step_callback(copy.role)
+                copies[id(agent)] = copy
+            return copies[id(agent)]
+
+        for task in debate_tasks:
+            task.agent = copy_of(task.agent)
+        crew_agents = [copy_of(agent) for agent in coworkers] or list(copies.values())
+
+        crew = _sequential_crew(crew_agents, debate_tasks)  # Bull -> Bear -> closing task
+        outputs.append(await self._kickoff(crew, company_data))
+        return outputs
+
+    async def _run_research_batch(self, session_id: str, research_tasks: list, company_data: dict):
+        """
+        Run the research tasks through the OpenAI Batch API (50% cheaper, up to
+        24h latency) and attach the results as the tasks' outputs, so the debate
+        phase picks them up as context exactly like realtime research.
+
+        Args:
+            session_id: Session ID for this analysis (batch_id is stored on it)
+            research_tasks: Round-opening research tasks, in RESEARCH_TASK_FACTORIES order
+            company_data: Company details
+        """
+        from agents.batch_runner import RESEARCH_TASK_FACTORIES, run_research_batch
+
+        def on_submit(batch_id: str):
+            self.sessions.update(session_id, batch_id=batch_id)
+
+        await sse_manager.send_agent_message(
+            session_id,
+            "system",
+            "Research submitted to the batch queue - results may take up to 24 hours",
+            "info"
+        )
+
+        [report] = await run_research_batch(
+            [company_data], on_submit=on_submit, http_client=self.http_client
+        )
+
+        for task, agent_id in zip(research_tasks, RESEARCH_TASK_FACTORIES):
+            task.output = TaskOutput(
+                description=task.description,
+                expected_output=task.expected_output,
+                raw=report["research"].get(agent_id, "Error: no batch result"),
+                agent=task.agent.role
+            )
+
+    def _step_callback(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        session: Session,
+        session_id: str,
+        step_output,
+        agent_name: Optional[str] = None
+    ):
         """
         Callback for each agent step during CrewAI execution
         Broadcasts real-time updates to frontend via SSE
 
+        Runs on the crew's worker thread: the message is extracted here and
+        only the (already truncated) text is queued for the event loop
+        (_drain_steps) - no coroutine or Task per step, and the loop never
+        waits on the crew thread.
+
         Args:
+            loop: The event loop serving this session's SSE clients
+            session: This analysis's session record (task tracking)
             session_id: Session ID for this analysis
             step_output: Step output from CrewAI (contains agent and message info)
+            agent_name: Role of the agent that produced the step. Rounds run
+                concurrently, so every crew passes it; the task-to-agent
+                mapping fallback is only right for a single sequential crew.
         """
         try:
             # Look up current agent from task-to-agent mapping
-            task_index = self.current_task_index.get(session_id, 0)
-            task_map = self.task_to_agent_map.get(session_id, [])
-            agent_name = task_map[task_index] if task_index < len(task_map) else "unknown"
+            task_index = session.current_task_index
+            if agent_name is None:
+                task_map = session.task_to_agent_map
+                agent_name = task_map[task_index] if task_index < len(task_map) else "unknown"
 
             output_type = type(step_output).__name__
 
-            logger.info(f"[STEP CALLBACK] Type: {output_type}, Task: {task_index+1}/17, Agent: {agent_name}")
+            logger.info("[STEP CALLBACK] Type: %s, Tasks done: %d/17, Agent: %s", output_type, task_index, agent_name)
 
             # Extract and filter messages for curated UX (medium detail)
             message = None
@@ -558,7 +873,7 @@ class VCCouncilOrchestrator:
                     if len(output_text) > 100:
                         message = f"✅ {output_text[:settings.max_conclusion_chars]}"  # Configurable limit (default: 10000 chars)
                         message_type = "conclusion"
-                        logger.info(f"[STEP CALLBACK] Broadcasting conclusion ({len(output_text)} chars)")
+                        logger.info("[STEP CALLBACK] Broadcasting conclusion (%d chars)", len(output_text))
 
             elif hasattr(step_output, 'thought') and step_output.thought:
                 # ✅ SHOW: Agent reasoning (user wants to see thoughts)
@@ -567,7 +882,7 @@ class VCCouncilOrchestrator:
                 if len(thought_text) > 20 and not thought_text.startswith("I tried reusing"):
                     message = f"💭 {thought_text[:settings.max_thought_chars]}"  # Configurable limit (default: 5000 chars)
                     message_type = "thought"
-                    logger.info(f"[STEP CALLBACK] Broadcasting thought ({len(thought_text)} chars)")
+                    logger.info("[STEP CALLBACK] Broadcasting thought (%d chars)", len(thought_text))
 
             # ❌ SKIP: Tool results (too noisy for medium detail)
             # ❌ SKIP: Other step types (TaskOutput, dict, etc.)
@@ -575,20 +890,20 @@ class VCCouncilOrchestrator:
 
             # Broadcast to frontend via SSE if we have a message
             if message and len(message.strip()) > 0:
-                await sse_manager.send_agent_message(
+                self._pending_steps.put((
+                    session,
                     session_id,
                     agent_name,
                     message,
                     message_type  # Use dynamic message_type (thought/conclusion/step)
-                )
-                logger.info(f"[STEP CALLBACK] ✅ Broadcasted {message_type} to frontend")
-
-                # Track task progression: AgentFinish with conclusion = task completed
-                if output_type == 'AgentFinish' and message_type == "conclusion":
-                    current_index = self.current_task_index.get(session_id, 0)
-                    if current_index < 16:  # Don't increment beyond task 17 (index 16)
-                        self.current_task_index[session_id] = current_index + 1
-                        logger.info(f"[TASK PROGRESSION] Task {current_index+1} completed. Moving to task {current_index+2}/17")
+                ))
+                # Wake the loop only if no drain is already pending: steps
+                # from the four rounds arriving together share one wakeup
+                with self._drain_lock:
+                    if self._drain_scheduled:
+                        return
+                    self._drain_scheduled = True
+                loop.call_soon_threadsafe(self._drain_steps)
             else:
                 # Silently skip - this is expected for tool results and other filtered steps
                 pass
@@ -596,6 +911,32 @@ class VCCouncilOrchestrator:
         except Exception as e:
             logger.error(f"❌ Step callback error: {str(e)}", exc_info=True)
 
+    def _drain_steps(self):
+        """Publish every queued step message (runs on the event loop)"""
+        # Cleared before draining: a step queued after this point either is
+        # drained below or schedules the next drain
+        with self._drain_lock:
+            self._drain_scheduled = False
+        while True:
+            try:
+                step = self._pending_steps.get_nowait()
+            except queue.Empty:
+                return
+            self._publish_step(*step)
+
+    def _publish_step(self, session: Session, session_id: str, agent_name: str, message: str, message_type: str):
+        """Broadcast a step message (runs on the event loop, see _step_callback)"""
+        sse_manager.publish_agent_message(session_id, agent_name, message, message_type)
+        logger.info("[STEP CALLBACK] ✅ Broadcasted %s to frontend", message_type)
+
+        # Track task progression: a conclusion (AgentFinish) = task completed.
+        # Conclusions from the four rounds interleave, so only count them.
+        if message_type == "conclusion":
+            current_index = session.current_task_index
+            if current_index < 16:  # Don't increment beyond task 17 (index 16)
+                session.current_task_index = current_index + 1
+                logger.info("[TASK PROGRESSION] %s finished a task (%d/17 done)", agent_name, current_index + 1)
+
     async def _create_calendar_events(self, session_id: str, calendar_events: list):
         """
         Create Google Calendar events from the decision
@@ -690,15 +1031,14 @@ class VCCouncilOrchestrator:
                                 f"🔗 Google Calendar authentication required. Please authenticate in the dialog.",
                                 "warning"
                             )
-                            # Wait for OAuth completion via polling
-                            max_wait = 300  # 5 minutes
-                            wait_interval = 2  # Check every 2 seconds
-                            waited = 0
-                            while waited < max_wait:
-                                if "gcalendar" in client_instance._oauth_sessions:
-                                    break
-                                await asyncio.sleep(wait_interval)
-                                waited += wait_interval
+                            # Wait for the OAuth completion watcher (up to 5 minutes);
+                            # no event means it has already finished
+                            oauth_event = client_instance._oauth_events.get(oauth_result["session"].id)
+                            if oauth_event is not None:
+                                try:
+                                    await asyncio.wait_for(oauth_event.wait(), timeout=300)
+                                except asyncio.TimeoutError:
+                                    pass
                             if "gcalendar" not in client_instance._oauth_sessions:
                                 raise Exception("Google Calendar OAuth timed out. Please authenticate and try again.")
                     
@@ -762,19 +1102,21 @@ class VCCouncilOrchestrator:
         """
         session = self.sessions.get(session_id)
         if not session:
-            logger.warning(f"Session not found: {session_id}")
+            # Unknown ids surface as a 404 in the access log
+            logger.debug("Session not found: %s", session_id)
             return None
 
         return {
             "session_id": session_id,
-            "status": session["status"],
-            "company_data": session["company_data"],
-            "result": session.get("result"),
-            "task_outputs": session.get("task_outputs", []),  # Individual task outputs
-            "error": session.get("error"),
-            "message": session.get("message"),
-            "completed_at": session.get("completed_at"),
-            "failed_at": session.get("failed_at")
+            "status": session.status,
+            "company_data": session.company_data,
+            "result": session.result,
+            "task_outputs": session.task_outputs,  # Individual task outputs
+            "error": session.error,
+            "message": session.message,
+            "completed_at": session.completed_at,
+            "failed_at": session.failed_at,
+            "cache_hit": session.cache_hit
         }
 
     def get_session_count(self) -> int:
@@ -791,12 +1133,7 @@ class VCCouncilOrchestrator:
         Returns:
             True if session was found and cleared, False otherwise
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        if self.sessions.pop(session_id) is not None:
             logger.info(f"Cleared session: {session_id}")
             return True
         return False
-
-
-# Global orchestrator instance
-orchestrator = VCCouncilOrchestrator()
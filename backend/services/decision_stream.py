@@ -0,0 +1,173 @@
+"""
+Incremental parsing of the Lead Partner's streamed decision JSON.
+
+The InvestmentDecision object is 2-4K output tokens, most of it in the
+reasoning and memo strings. With the lead partner's LLM streaming, each
+top-level field is decoded as soon as its value is complete, so the frontend
+can render the decision within the first few tokens instead of waiting for
+the whole memo. The final validated decision is still broadcast as usual.
+
+extract_decision() recovers the decision from the final text when a provider
+returns plain text instead of structured output.
+"""
+
+import json
+import logging
+import re
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# InvestmentDecision fields, in the order the model emits them
+DECISION_FIELDS = ("decision", "reasoning", "calendar_events", "investment_memo")
+
+# A decision field key followed by the first character of its value
+_FIELD_KEY_PATTERN = re.compile(
+    r'"(' + "|".join(DECISION_FIELDS) + r')"\s*:\s*(?=\S)'
+)
+# Any decision field key, for one pass over text that isn't valid JSON
+_ANY_FIELD_PATTERN = re.compile(
+    r'"(' + "|".join(DECISION_FIELDS) + r')"\s*:\s*', re.IGNORECASE
+)
+# Body of a JSON string up to its closing quote (or a trailing lone backslash)
+_STRING_BODY_PATTERN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_decoder = json.JSONDecoder()
+
+
+class DecisionStreamParser:
+    """
+    Accumulates streamed JSON text and yields top-level fields once complete.
+
+    Scanning resumes where it stopped (a multi-KB memo streamed token by
+    token is read once, not re-parsed per chunk), and key names inside
+    string values are never taken for keys.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pending = list(DECISION_FIELDS)
+        self._pos = 0  # End of the last completed value
+        self._field: Optional[str] = None  # Field whose value is streaming
+        self._value_start = 0  # Start of that value
+        self._scan = 0  # How far a string value has been scanned
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add a streamed chunk
+
+        Args:
+            chunk: Next piece of the lead partner's JSON output
+
+        Returns:
+            list of (field, value) pairs completed by this chunk
+        """
+        self._buffer += chunk
+        # A value can only complete on a closing quote/bracket/brace
+        if not self._pending or not any(c in chunk for c in '"]}'):
+            return []
+
+        buffer = self._buffer
+        completed = []
+        while self._pending:
+            if self._field is None:
+                match = _FIELD_KEY_PATTERN.search(buffer, self._pos)
+                if not match:
+                    break
+                self._field = match.group(1)
+                self._value_start = self._scan = match.end()
+                if buffer[self._value_start] == '"':
+                    self._scan += 1
+
+            if buffer[self._value_start] == '"':
+                self._scan = _STRING_BODY_PATTERN.match(buffer, self._scan).end()
+                if self._scan == len(buffer):
+                    break  # String still open
+            try:
+                value, self._pos = _decoder.raw_decode(buffer, self._value_start)
+            except json.JSONDecodeError:
+                break  # Array/object still open
+            field, self._field = self._field, None
+            if field in self._pending:  # A repeated key keeps its first value
+                self._pending.remove(field)
+                completed.append((field, value))
+        return completed
+
+
+@contextmanager
+def stream_decision_fields(task, on_field: Callable[[str, Any], None]) -> Iterator[None]:
+    """
+    Call on_field(field, value) for each decision field streamed by `task`
+    while the context is open.
+
+    Stream chunk handlers run synchronously on the crew thread, in order.
+
+    Args:
+        task: The lead partner's CrewAI Task
+        on_field: Callback invoked with each completed top-level field
+    """
+    from crewai.events import LLMStreamChunkEvent, crewai_event_bus
+
+    task_id = str(task.id)
+    parser = DecisionStreamParser()
+
+    def on_chunk(source, event):
+        # The lead partner has no tools, so tool-call chunks (structured
+        # output via tool use) carry the decision JSON too
+        if event.task_id != task_id:
+            return
+        for field, value in parser.feed(event.chunk):
+            logger.info(f"Streamed decision field: {field}")
+            on_field(field, value)
+
+    crewai_event_bus.register_handler(LLMStreamChunkEvent, on_chunk)
+    try:
+        yield
+    finally:
+        crewai_event_bus.off(LLMStreamChunkEvent, on_chunk)
+
+
+def extract_decision(raw_output: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the decision out of the lead partner's final text
+
+    The first JSON object in the text is decoded in place (a "Final Answer:"
+    prefix or markdown fence around it is skipped). If that fails, e.g. the
+    model's JSON is truncated or malformed, the decision fields are picked
+    out of the text in a single scan.
+
+    Args:
+        raw_output: Raw text of Task 17's output
+
+    Returns:
+        The decision dict, or None if no decision field was found
+    """
+    start = raw_output.find("{")
+    if start != -1:
+        try:
+            decision, _ = _decoder.raw_decode(raw_output, start)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse JSON from string: {e}")
+        else:
+            if isinstance(decision, dict) and "decision" in decision:
+                return decision
+
+    fields = {}
+    for match in _ANY_FIELD_PATTERN.finditer(raw_output):
+        field = match.group(1).lower()
+        if field in fields:
+            continue
+        try:
+            fields[field], _ = _decoder.raw_decode(raw_output, match.end())
+        except json.JSONDecodeError:
+            continue
+
+    if not isinstance(fields.get("decision"), str):
+        return None
+    logger.info(f"Extracted decision fields from text: {sorted(fields)}")
+    return {
+        "decision": fields["decision"].upper(),
+        "reasoning": fields.get("reasoning") or "No reasoning provided",
+        "investment_memo": fields.get("investment_memo") or "No memo provided",
+        "calendar_events": fields.get("calendar_events") or [],
+    }
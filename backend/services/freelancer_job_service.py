@@ -3,12 +3,12 @@ Freelancer Job Content Generator
 Generates AI-powered job descriptions for copy/paste to Freelancer
 """
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 from config import settings
 import logging
 
 logger = logging.getLogger(__name__)
-openai_client = OpenAI(api_key=settings.openai_api_key)
+openai_client = AsyncOpenAI(api_key=settings.openai_api_key)  # Async: called from the event loop
 
 async def generate_freelancer_job_content(
     company_name: str,
@@ -86,7 +86,7 @@ Be specific about {company_name} and the key uncertainties from the AI analysis.
 """
 
     try:
-        response = openai_client.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model="gpt-4",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
@@ -0,0 +1,63 @@
+"""
+SQLite-backed key/value cache with per-entry expiry.
+
+Shared by the LLM response cache (agents/llm_cache.py) and the
+whole-analysis cache (services/analysis_cache.py); kept free of CrewAI so
+either can be used and tested without it.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class ResponseCache:
+    """
+    Thread-safe SQLite key/value store with per-entry expiry.
+
+    Expired rows are deleted when the cache is opened and on every write,
+    so the file doesn't keep every entry ever written.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+        )
+        self._purge_expired()
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value for ttl_seconds."""
+        with self._lock:
+            self._purge_expired()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + self.ttl_seconds)
+            )
+            self._conn.commit()
+
+    def _purge_expired(self) -> None:
+        """Delete expired rows (caller holds the lock or owns the connection)."""
+        self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
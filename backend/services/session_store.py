@@ -0,0 +1,121 @@
+"""
+In-memory store for analysis sessions.
+
+Sessions are slotted Session records (status, company_data, result, ...) kept
+in write order, so eviction works from the front: finished sessions older than
+the TTL (since their last write) are dropped, then the oldest finished sessions
+beyond the size cap. Running analyses are never evicted - a batch-mode run can
+go hours between writes. A shared backend (e.g. Redis for multi-worker deploys)
+can implement the same get/set/update/pop interface without touching the
+orchestrator.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Session:
+    """State of one analysis, as reported by the orchestrator's get_result"""
+    status: str = "running"
+    company_data: Dict[str, Any] = field(default_factory=dict)  # Summary, not the full request
+    result: Optional[Dict[str, Any]] = None
+    task_outputs: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    message: Optional[str] = None
+    completed_at: Optional[str] = None
+    failed_at: Optional[str] = None
+    cache_hit: bool = False
+    batch_id: Optional[str] = None  # OpenAI Batch API job, in batch mode
+    # Step-callback tracking (not reported): agent role per task (17 total)
+    # and tasks finished so far (0-16). Rounds run in parallel, so the index
+    # counts completions; it is not the position of a running task.
+    task_to_agent_map: Tuple[str, ...] = ()
+    current_task_index: int = 0
+
+
+class SessionStore:
+    """LRU- and TTL-bounded session_id -> Session mapping"""
+
+    def __init__(self, max_sessions: int, ttl_seconds: float):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        # session_id -> (last write, session), least recently written first
+        self._sessions: "OrderedDict[str, Tuple[float, Session]]" = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[Session]:
+        """Return the session, or None if unknown or expired (running sessions never expire)"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        if entry[1].status != "running" and time.monotonic() - entry[0] > self.ttl_seconds:
+            del self._sessions[session_id]
+            return None
+        return entry[1]
+
+    def set(self, session_id: str, session: Session) -> None:
+        """Create or replace a session"""
+        self._sessions[session_id] = (time.monotonic(), session)
+        self._sessions.move_to_end(session_id)
+        self._evict()
+
+    def update(self, session_id: str, **fields: Any) -> None:
+        """
+        Merge fields into a session
+
+        Running sessions are never evicted, so a missing session was popped
+        or expired after finishing; the update is dropped rather than
+        resurrecting it as a bare record.
+        """
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            logger.warning("Dropping update for unknown session %s: %s", session_id, list(fields))
+            return
+        session = entry[1]
+        for name, value in fields.items():
+            setattr(session, name, value)
+        self.set(session_id, session)
+
+    def pop(self, session_id: str) -> Optional[Session]:
+        """Remove and return a session"""
+        entry = self._sessions.pop(session_id, None)
+        return entry[1] if entry else None
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict(self) -> None:
+        """
+        Drop expired finished sessions, then the oldest finished sessions
+        beyond max_sessions (running analyses are never dropped)
+        """
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = []
+        for session_id, (written_at, session) in self._sessions.items():
+            if written_at >= cutoff:
+                break
+            if session.status != "running":
+                expired.append(session_id)
+        for session_id in expired:
+            del self._sessions[session_id]
+            logger.info("Evicted expired session %s", session_id)
+
+        excess = len(self._sessions) - self.max_sessions
+        if excess <= 0:
+            return
+        finished = (
+            session_id for session_id, (_, session) in self._sessions.items()
+            if session.status != "running"
+        )
+        for session_id in list(islice(finished, excess)):
+            del self._sessions[session_id]
+            logger.info("Evicted session %s", session_id)
@@ -1,6 +1,9 @@
 """
 Round-based Debate Tasks
 Bull and Bear agents argue opposite sides for each topic in isolation.
+
+Company name, dates and other per-analysis values go at the tail of each
+description (see research_tasks.py) so the instruction prefix is cacheable.
 """
 
 from crewai import Task
@@ -30,7 +33,7 @@ def create_bull_market_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case FOR investing in {company_name} based on the MARKET opportunity.
+    Build the STRONGEST case FOR investing in the company based on the MARKET opportunity.
 
     You have access to the Market Research findings via context. Read it carefully.
 
@@ -45,6 +48,8 @@ def create_bull_market_task(
     team, product, or financial discussions. Be persuasive but evidence-based.
 
     You can use your tools to find additional supporting evidence if needed.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -87,7 +92,7 @@ def create_bear_market_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case AGAINST investing in {company_name} based on the MARKET analysis.
+    Build the STRONGEST case AGAINST investing in the company based on the MARKET analysis.
 
     You have access to:
     - Market research via context
@@ -104,6 +109,8 @@ def create_bear_market_task(
     financial discussions. Challenge assumptions rigorously.
 
     You can use your tools to find additional evidence of market risks if needed.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -148,7 +155,7 @@ def create_bull_team_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case FOR investing in {company_name} based on the TEAM quality.
+    Build the STRONGEST case FOR investing in the company based on the TEAM quality.
 
     You have access to the Founder Evaluation findings via context. Read it carefully.
 
@@ -163,6 +170,8 @@ def create_bull_team_task(
     market, product, or financial discussions. Be persuasive but evidence-based.
 
     Team quality is 70% of investment decisions. Build a compelling case.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -205,7 +214,7 @@ def create_bear_team_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case AGAINST investing in {company_name} based on the TEAM analysis.
+    Build the STRONGEST case AGAINST investing in the company based on the TEAM analysis.
 
     You have access to:
     - Founder evaluation via context
@@ -222,6 +231,8 @@ def create_bear_team_task(
     financial discussions. Challenge assumptions rigorously.
 
     Team quality is 70% of investment decisions. Be thorough about risks.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -266,7 +277,7 @@ def create_bull_product_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case FOR investing in {company_name} based on the PRODUCT/MOAT.
+    Build the STRONGEST case FOR investing in the company based on the PRODUCT/MOAT.
 
     You have access to the Product Analysis findings via context. Read it carefully.
 
@@ -281,6 +292,8 @@ def create_bull_product_task(
     market, team, or financial discussions. Be persuasive but evidence-based.
 
     Even weak moats can be strengthened. Build the most optimistic case.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -323,7 +336,7 @@ def create_bear_product_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case AGAINST investing in {company_name} based on the PRODUCT analysis.
+    Build the STRONGEST case AGAINST investing in the company based on the PRODUCT analysis.
 
     You have access to:
     - Product analysis via context
@@ -340,6 +353,8 @@ def create_bear_product_task(
     financial discussions. Challenge assumptions rigorously.
 
     Most products lack real moats. Be skeptical and evidence-based.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -384,7 +399,7 @@ def create_bull_financial_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case FOR investing in {company_name} based on the FINANCIALS.
+    Build the STRONGEST case FOR investing in the company based on the FINANCIALS.
 
     You have access to the Financial Analysis findings via context. Read it carefully.
 
@@ -399,6 +414,8 @@ def create_bull_financial_task(
     market, team, or product discussions. Be persuasive but evidence-based.
 
     Even mediocre unit economics can improve. Build the optimistic case.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -441,7 +458,7 @@ def create_bear_financial_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Build the STRONGEST case AGAINST investing in {company_name} based on the FINANCIAL analysis.
+    Build the STRONGEST case AGAINST investing in the company based on the FINANCIAL analysis.
 
     You have access to:
     - Financial analysis via context
@@ -458,6 +475,8 @@ def create_bear_financial_task(
     product discussions. Challenge assumptions rigorously.
 
     Bad unit economics rarely improve. Be skeptical and data-driven.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -1,6 +1,9 @@
 """
 Round-based Decision Tasks
 Risk assessors synthesize debates within each round, and Lead Partner makes final decision.
+
+Company name, dates and other per-analysis values go at the tail of each
+description (see research_tasks.py) so the instruction prefix is cacheable.
 """
 
 from crewai import Task
@@ -30,14 +33,24 @@ class InvestmentDecision(BaseModel):
         ...,
         description="3-5 paragraph explanation of decision weighing both sides"
     )
-    investment_memo: str = Field(
-        ...,
-        description="Comprehensive memo summarizing key findings and recommendation"
-    )
+    # Field order is the order the model streams them in: short, early-useful
+    # fields first, the long memo last (see services/decision_stream.py)
     calendar_events: List[CalendarEvent] = Field(
         ...,
         description="Calendar events based on decision (PASS=[], MAYBE=1 event, INVEST=2-3 events)"
     )
+    investment_memo: str = Field(
+        ...,
+        description="Comprehensive memo summarizing key findings and recommendation"
+    )
+
+
+# Closing section of every round-closing task (4, 8, 12, 16). With
+# settings.lead_partner_round_digests the Lead Partner reads only these four
+# outputs instead of all 16, so the digest must carry both sides of the round.
+ROUND_DIGEST_SECTION = """- **Round Digest:** At most 200 words for the Lead Partner: key data points,
+      Bull's strongest argument, Bear's strongest concern, and your verdict for this round
+    """
 
 
 # ========== RISK ASSESSMENT TASKS ==========
@@ -63,7 +76,7 @@ def create_risk_market_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Assess risks related to MARKET opportunity based on Round 1 debate for {company_name}.
+    Assess risks related to MARKET opportunity based on Round 1 debate for the company.
 
     You have access to:
     - Market research
@@ -83,6 +96,8 @@ def create_risk_market_task(
     competitive dynamics, market sentiment). You will not see team, product, or financial data.
 
     Be rigorous and data-driven. Risks with likelihood or impact of 4-5 are serious concerns.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -90,7 +105,7 @@ def create_risk_market_task(
     - **Top 3-5 Market Risks:** Table with columns: Risk | Likelihood (1-5) | Impact (1-5) | Mitigation
     - **Market Failure Scenario:** Narrative of how the market opportunity fails
     - **Risk Assessment Summary:** Overall risk level and key concerns
-    """
+    """ + ROUND_DIGEST_SECTION
 
     # Get the risk assessor agent from the agents dict
     risk_assessor_agent = agents["risk_assessor"]
@@ -124,7 +139,7 @@ def create_risk_team_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Assess risks related to TEAM execution based on Round 2 debate for {company_name}.
+    Assess risks related to TEAM execution based on Round 2 debate for the company.
 
     You have access to:
     - Founder evaluation
@@ -145,6 +160,8 @@ def create_risk_team_task(
 
     Team quality is 70% of investment decisions. Be thorough and critical.
     Risks with likelihood or impact of 4-5 are serious concerns.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -152,7 +169,7 @@ def create_risk_team_task(
     - **Top 3-5 Execution Risks:** Table with columns: Risk | Likelihood (1-5) | Impact (1-5) | Mitigation
     - **Team Failure Scenario:** Narrative of how the team fails to execute
     - **Risk Assessment Summary:** Overall risk level and key concerns
-    """
+    """ + ROUND_DIGEST_SECTION
 
     # Get the risk assessor agent from the agents dict
     risk_assessor_agent = agents["risk_assessor"]
@@ -186,7 +203,7 @@ def create_market_product_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Assess product-market fit for {company_name} based on Round 3 debate.
+    Assess product-market fit for the company based on Round 3 debate.
 
     You have access to:
     - Product/moat analysis
@@ -205,6 +222,8 @@ def create_market_product_task(
 
     Be honest and skeptical. Many products lack true product-market fit.
     Consider both bull and bear perspectives carefully.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -214,7 +233,7 @@ def create_market_product_task(
     - **Differentiation Validity:** Are the differentiators real or superficial?
     - **Moat Reality Check:** Aspirational vs. realistic defensibility
     - **PMF Summary:** Overall assessment and key concerns/strengths
-    """
+    """ + ROUND_DIGEST_SECTION
 
     # Get the market researcher agent from the agents dict
     # Special case: Market Researcher does PMF assessment in Round 3
@@ -249,7 +268,7 @@ def create_risk_financial_task(
     company_name = company_data.get("company_name", "the company")
 
     description = f"""
-    Assess risks related to FINANCIAL sustainability based on Round 4 debate for {company_name}.
+    Assess risks related to FINANCIAL sustainability based on Round 4 debate for the company.
 
     You have access to:
     - Financial analysis
@@ -271,6 +290,8 @@ def create_risk_financial_task(
 
     Be rigorous with numbers. Challenge optimistic assumptions about LTV, CAC, and margins.
     Risks with likelihood or impact of 4-5 are serious concerns.
+
+    Company: {company_name}
     """
 
     expected_output = """
@@ -278,7 +299,7 @@ def create_risk_financial_task(
     - **Top 3-5 Financial Risks:** Table with columns: Risk | Likelihood (1-5) | Impact (1-5) | Mitigation
     - **Financial Failure Scenario:** Narrative of how the company runs out of money
     - **Risk Assessment Summary:** Overall risk level and key concerns
-    """
+    """ + ROUND_DIGEST_SECTION
 
     # Get the risk assessor agent from the agents dict
     risk_assessor_agent = agents["risk_assessor"]
@@ -293,20 +314,59 @@ def create_risk_financial_task(
 
 # ========== FINAL DECISION TASK ==========
 
+FULL_HISTORY_OVERVIEW = """You have access to ALL 16 previous tasks via context:
+
+    **Round 1 - Market Discussion:**
+    - Task 1: Market research
+    - Task 2: Bull's market case
+    - Task 3: Bear's market concerns
+    - Task 4: Market risk assessment
+
+    **Round 2 - Team Discussion:**
+    - Task 5: Founder evaluation
+    - Task 6: Bull's team case
+    - Task 7: Bear's team concerns
+    - Task 8: Execution risk assessment
+
+    **Round 3 - Product Discussion:**
+    - Task 9: Product/moat analysis
+    - Task 10: Bull's product case
+    - Task 11: Bear's product concerns
+    - Task 12: Product-market fit assessment
+
+    **Round 4 - Financial Discussion:**
+    - Task 13: Financial analysis
+    - Task 14: Bull's financial case
+    - Task 15: Bear's financial concerns
+    - Task 16: Financial risk assessment"""
+
+ROUND_DIGEST_OVERVIEW = """You have access to the closing task of each round via context. Each ends
+    with a Round Digest summarizing the research, Bull's case and Bear's concerns:
+
+    - Task 4: Market risk assessment (Round 1 - Market)
+    - Task 8: Execution risk assessment (Round 2 - Team)
+    - Task 12: Product-market fit assessment (Round 3 - Product)
+    - Task 16: Financial risk assessment (Round 4 - Financial)"""
+
+
 def create_lead_partner_decision_task(
     agents: dict,
     company_data: dict,
-    context: List[Task]  # ALL 16 previous tasks
+    context: List[Task],  # ALL 16 previous tasks, or the 4 round-closing tasks
+    round_digests: bool = False
 ) -> Task:
     """
     Task 17: Lead Partner makes final PASS/MAYBE/INVEST decision.
 
-    Context: [Tasks 1-16] (ALL previous rounds)
+    Context: [Tasks 1-16] (ALL previous rounds), or [Tasks 4, 8, 12, 16] when
+    round_digests is set
 
     Args:
         agents: Dictionary containing all 8 agent instances
         company_data: User input with company details
-        context: List of previous Task objects this task can see (all 16 tasks)
+        context: List of previous Task objects this task can see
+        round_digests: Context is the round-closing tasks only; decide from
+            their Round Digest sections
 
     Returns:
         CrewAI Task object with structured output
@@ -320,34 +380,12 @@ def create_lead_partner_decision_task(
     two_weeks = today + timedelta(days=14)
     three_months = today + timedelta(days=90)
 
-    description = f"""
-    Make the final investment decision for {company_name}.
-
-    You have access to ALL 16 previous tasks via context:
-
-    **Round 1 - Market Discussion:**
-    - Task 1: Market research
-    - Task 2: Bull's market case
-    - Task 3: Bear's market concerns
-    - Task 4: Market risk assessment
+    context_overview = ROUND_DIGEST_OVERVIEW if round_digests else FULL_HISTORY_OVERVIEW
 
-    **Round 2 - Team Discussion:**
-    - Task 5: Founder evaluation
-    - Task 6: Bull's team case
-    - Task 7: Bear's team concerns
-    - Task 8: Execution risk assessment
-
-    **Round 3 - Product Discussion:**
-    - Task 9: Product/moat analysis
-    - Task 10: Bull's product case
-    - Task 11: Bear's product concerns
-    - Task 12: Product-market fit assessment
+    description = f"""
+    Make the final investment decision for the company.
 
-    **Round 4 - Financial Discussion:**
-    - Task 13: Financial analysis
-    - Task 14: Bull's financial case
-    - Task 15: Bear's financial concerns
-    - Task 16: Financial risk assessment
+    {context_overview}
 
     Decision Framework:
     - **PASS:** Fundamental flaws, insurmountable risks, or weak team/product
@@ -355,7 +393,7 @@ def create_lead_partner_decision_task(
     - **INVEST:** Strong opportunity with compelling team, market, product, and economics
 
     Process:
-    1. Read ALL 16 task outputs from context carefully
+    1. Read every task output in context carefully
     2. Synthesize findings across market, team, product, and financial dimensions
     3. Weigh Bull vs Bear arguments on each topic
     4. Identify patterns and contradictions across all rounds
@@ -365,32 +403,30 @@ def create_lead_partner_decision_task(
     Calendar Event Rules:
     - **PASS:** calendar_events = [] (empty array)
     - **MAYBE:** 1 event in 90 days (re-evaluation)
-      - Title: "Re-evaluate: {company_name} traction review"
-      - Start: {three_months.strftime('%Y-%m-%dT14:00:00')}
-      - End: {three_months.strftime('%Y-%m-%dT15:00:00')}
+      - Title: "Re-evaluate: <company> traction review"
+      - Start/End: the re-evaluation slot below
       - Attendees: ["Partner: Lead Partner", "IC: Investment Committee"]
     - **INVEST:** 2-3 events within 14 days:
-      1. "Due Diligence Kickoff: {company_name}" - {tomorrow.strftime('%Y-%m-%dT14:00:00')} to {tomorrow.strftime('%Y-%m-%dT16:00:00')}
-      2. "IC Meeting: {company_name}" - {next_week.strftime('%Y-%m-%dT14:00:00')} to {next_week.strftime('%Y-%m-%dT15:30:00')}
-      3. "Term Sheet Discussion: {company_name}" - {two_weeks.strftime('%Y-%m-%dT14:00:00')} to {two_weeks.strftime('%Y-%m-%dT15:00:00')}
-
-    CRITICAL: Your output MUST be valid JSON parseable by Pydantic.
-    The InvestmentDecision model expects:
-    - decision: "PASS" | "MAYBE" | "INVEST"
-    - reasoning: string (3-5 paragraphs weighing all evidence)
-    - investment_memo: string (comprehensive summary citing specific findings)
-    - calendar_events: array of CalendarEvent objects or empty array
-
-    Your reasoning and memo MUST cite specific findings from the 16 tasks.
+      1. "Due Diligence Kickoff: <company>" - the due diligence slot below
+      2. "IC Meeting: <company>" - the IC meeting slot below
+      3. "Term Sheet Discussion: <company>" - the term sheet slot below
+
+    Your reasoning and memo MUST cite specific findings from the tasks in context.
     Reference task numbers and specific data points (e.g., "Task 1 showed TAM of $5B growing at 20% YoY").
+
+    Company: {company_name}
+    Calendar slots:
+    - Re-evaluation: {three_months.strftime('%Y-%m-%dT14:00:00')} to {three_months.strftime('%Y-%m-%dT15:00:00')}
+    - Due diligence: {tomorrow.strftime('%Y-%m-%dT14:00:00')} to {tomorrow.strftime('%Y-%m-%dT16:00:00')}
+    - IC meeting: {next_week.strftime('%Y-%m-%dT14:00:00')} to {next_week.strftime('%Y-%m-%dT15:30:00')}
+    - Term sheet: {two_weeks.strftime('%Y-%m-%dT14:00:00')} to {two_weeks.strftime('%Y-%m-%dT15:00:00')}
     """
 
+    # Output shape is enforced via output_pydantic (provider structured output)
     expected_output = """
-    Valid structured output matching InvestmentDecision Pydantic model:
-    - decision: "PASS" | "MAYBE" | "INVEST"
-    - reasoning: 3-5 paragraph explanation weighing all evidence across 4 rounds
-    - investment_memo: Comprehensive memo summarizing all findings with specific citations
-    - calendar_events: Array of events (0 for PASS, 1 for MAYBE, 2-3 for INVEST)
+    Investment decision with reasoning weighing all evidence across 4 rounds,
+    an investment memo citing specific findings, and calendar events
+    (0 for PASS, 1 for MAYBE, 2-3 for INVEST).
     """
 
     # Get the lead partner agent
@@ -400,6 +436,6 @@ def create_lead_partner_decision_task(
         description=description,
         expected_output=expected_output,
         agent=lead_partner_agent,
-        context=context,  # ALL 16 previous tasks
-        output_pydantic=InvestmentDecision  # Structured output
+        context=context,
+        output_pydantic=InvestmentDecision  # Native structured output (json_schema / tool use)
     )
@@ -1,6 +1,10 @@
 """
 Round-based Research Tasks
 These initiate each of the 4 discussion rounds with independent, fresh analysis.
+
+Descriptions keep the static instructions first and company-specific details
+at the tail, so the shared prefix stays byte-identical across companies and
+providers' automatic prefix caching can hit on it.
 """
 
 from crewai import Task
@@ -31,12 +35,7 @@ def create_market_researcher_task(
     product_desc = company_data.get("product_description", "")
 
     description = f"""
-    Research the market opportunity for {company_name}.
-
-    Company details:
-    - Website: {website}
-    - Industry: {industry}
-    - Product: {product_desc}
+    Research the market opportunity for the company described at the end of this task.
 
     Research instructions:
     1. Research the company website to understand their value proposition
@@ -51,6 +50,12 @@ def create_market_researcher_task(
 
     If tools are unavailable, clearly state "Data unavailable" but reason through
     the market analysis using available information and industry knowledge.
+
+    Company details:
+    - Company: {company_name}
+    - Website: {website}
+    - Industry: {industry}
+    - Product: {product_desc}
     """
 
     expected_output = """
@@ -96,11 +101,7 @@ def create_founder_evaluator_task(
     website = company_data.get("website", "")
 
     description = f"""
-    Evaluate the founding team for {company_name}.
-
-    Founder details:
-    - GitHub: {founder_github if founder_github else "Not provided"}
-    - Company website: {website}
+    Evaluate the founding team of the company described at the end of this task.
 
     Evaluation instructions:
     1. Review GitHub profile (if provided) for technical skills, project quality, contribution history
@@ -115,6 +116,11 @@ def create_founder_evaluator_task(
 
     Team quality is 70% of investment decisions. Be critical but fair.
     If GitHub unavailable, state "GitHub data unavailable" and assess via other signals.
+
+    Founder details:
+    - Company: {company_name}
+    - GitHub: {founder_github if founder_github else "Not provided"}
+    - Company website: {website}
     """
 
     expected_output = """
@@ -160,11 +166,7 @@ def create_product_critic_task(
     product_desc = company_data.get("product_description", "")
 
     description = f"""
-    Analyze the product and competitive defensibility for {company_name}.
-
-    Product details:
-    - Website: {website}
-    - Description: {product_desc}
+    Analyze the product and competitive defensibility of the company described at the end of this task.
 
     Analysis instructions:
     1. Understand the core product and problem it solves
@@ -179,6 +181,11 @@ def create_product_critic_task(
 
     Most products lack real moats. Be skeptical. If no moat, explain why.
     If tools unavailable, state "Product data unavailable" but reason through defensibility.
+
+    Product details:
+    - Company: {company_name}
+    - Website: {website}
+    - Description: {product_desc}
     """
 
     expected_output = """
@@ -223,10 +230,7 @@ def create_financial_analyst_task(
     financial_metrics = company_data.get("financial_metrics", {})
 
     description = f"""
-    Analyze the financial health and unit economics for {company_name}.
-
-    Financial metrics provided:
-    {financial_metrics if financial_metrics else "None provided - use conservative industry benchmarks"}
+    Analyze the financial health and unit economics of the company described at the end of this task.
 
     Analysis instructions:
     1. Extract or assume financial metrics: ARPU, CAC, gross margin, churn rate, monthly burn, cash in bank
@@ -242,6 +246,10 @@ def create_financial_analyst_task(
     Use conservative assumptions if data missing. Show all calculations explicitly.
     If key metrics missing, use industry benchmarks and state "Assumed based on industry norms".
     LTV:CAC < 2:1 is a red flag.
+
+    Company: {company_name}
+    Financial metrics provided:
+    {financial_metrics if financial_metrics else "None provided - use conservative industry benchmarks"}
     """
 
     expected_output = """
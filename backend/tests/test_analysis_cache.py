@@ -0,0 +1,55 @@
+"""
+Tests for the whole-analysis cache
+"""
+
+from config import settings
+from services.analysis_cache import (
+    analysis_cache_key,
+    get_analysis_cache,
+    get_cached_analysis,
+    store_analysis
+)
+
+COMPANY = {
+    "company_name": "Acme Robotics",
+    "website": "https://www.acme.example/",
+    "founder_github": "acme-founder",
+    "industry": "Robotics",
+    "product_description": "Warehouse picking robots\nfor mid-size retailers",
+    "financial_metrics": {"arr": 1200000, "burn": 80000, "runway_months": 18},
+}
+
+
+def test_key_ignores_metric_order_and_whitespace():
+    reordered = {
+        **COMPANY,
+        "company_name": "  acme robotics ",
+        "website": "acme.example",
+        "product_description": "  Warehouse picking   robots for\tmid-size retailers ",
+        "financial_metrics": {"runway_months": 18, "arr": 1200000, "burn": 80000},
+    }
+    assert analysis_cache_key(reordered) == analysis_cache_key(COMPANY)
+
+
+def test_key_changes_with_analysis_inputs():
+    key = analysis_cache_key(COMPANY)
+    assert analysis_cache_key({**COMPANY, "product_description": "Warehouse picking robots"}) != key
+    assert analysis_cache_key({**COMPANY, "financial_metrics": {"arr": 1500000}}) != key
+    assert analysis_cache_key({**COMPANY, "company_name": "Acme Robots"}) != key
+
+
+
+def test_stored_analysis_is_returned_for_the_same_company(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "analysis_cache_enabled", True)
+    monkeypatch.setattr(settings, "analysis_cache_path", str(tmp_path / "analyses.db"))
+    get_analysis_cache.cache_clear()
+    try:
+        decision = {"decision": "INVEST", "reasoning": "Strong team"}
+        store_analysis(COMPANY, decision, [{"task": 1}])
+        store_analysis({**COMPANY, "company_name": "Other"}, {"decision": "UNKNOWN"}, [])
+
+        cached = get_cached_analysis({**COMPANY, "website": "acme.example"})
+        assert cached == {"result": decision, "task_outputs": [{"task": 1}]}
+        assert get_cached_analysis({**COMPANY, "company_name": "Other"}) is None
+    finally:
+        get_analysis_cache.cache_clear()
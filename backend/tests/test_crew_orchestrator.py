@@ -0,0 +1,69 @@
+"""
+Tests for step attribution across concurrent analyses
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from agents.definitions import create_all_agents
+from services import crew_orchestrator
+from services.crew_orchestrator import VCCouncilOrchestrator, _run_agents
+from services.session_store import Session
+
+
+class Thought:
+    """Minimal stand-in for a CrewAI AgentAction step"""
+    thought = "Weighing the market size against the competition"
+
+
+class RecordingSSE:
+    def __init__(self):
+        self.messages = []
+
+    def publish_agent_message(self, session_id, agent_name, message, message_type):
+        self.messages.append((session_id, agent_name))
+
+
+@pytest.mark.asyncio
+async def test_interleaved_analyses_report_to_their_own_sessions(monkeypatch):
+    sse = RecordingSSE()
+    monkeypatch.setattr(crew_orchestrator, "sse_manager", sse)
+    orchestrator = VCCouncilOrchestrator()
+    loop = asyncio.get_running_loop()
+
+    def callbacks_for(session_id):
+        session = Session()
+
+        def make_step_callback(agent_role):
+            def step_callback(step_output):
+                orchestrator._step_callback(loop, session, session_id, step_output, agent_role)
+            return step_callback
+        return make_step_callback
+
+    agents_a = _run_agents(callbacks_for("session-a"))
+    agents_b = _run_agents(callbacks_for("session-b"))
+
+    agents_a["bull_agent"].step_callback(Thought())
+    agents_b["bull_agent"].step_callback(Thought())
+    agents_b["bear_agent"].step_callback(Thought())
+    agents_a["bear_agent"].step_callback(Thought())
+    await asyncio.sleep(0)  # Let the queued drain run
+
+    bull = agents_a["bull_agent"].role
+    bear = agents_a["bear_agent"].role
+    assert sse.messages == [
+        ("session-a", bull),
+        ("session-b", bull),
+        ("session-b", bear),
+        ("session-a", bear),
+    ]
+
+    # The process-wide agents are never bound to either run
+    shared = create_all_agents()
+    for agent_id, agent in shared.items():
+        assert agents_a[agent_id] is not agent
+        assert agent.step_callback is not agents_a[agent_id].step_callback
+        assert agent.step_callback is not agents_b[agent_id].step_callback
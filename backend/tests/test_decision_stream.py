@@ -0,0 +1,47 @@
+"""
+Tests for incremental parsing of the streamed decision JSON
+"""
+
+import json
+
+import pytest
+
+from services.decision_stream import DecisionStreamParser
+
+DECISION = {
+    "decision": "INVEST",
+    "reasoning": 'Strong team. The bear case ("decision": "PASS") rested on churn \\ retention.',
+    "calendar_events": [{"title": "Partner meeting", "attendees": ["a@example.com"]}],
+    "investment_memo": "Lead the seed round; revisit \"investment_memo\": after Q3.\nThanks",
+}
+
+
+def stream(parser, text, size):
+    fields = []
+    for start in range(0, len(text), size):
+        fields.extend(parser.feed(text[start:start + size]))
+    return fields
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_fields_complete_in_small_chunks(size):
+    text = "Final Answer: " + json.dumps(DECISION, indent=2)
+    fields = stream(DecisionStreamParser(), text, size)
+    assert fields == list(DECISION.items())
+
+
+def test_field_is_reported_once_its_value_closes():
+    parser = DecisionStreamParser()
+    assert parser.feed('{"decision": "INV') == []
+    assert parser.feed('EST", "reasoning": "Says \\"') == [("decision", "INVEST")]
+    assert parser.feed('decision\\": no"') == [("reasoning", 'Says "decision": no')]
+
+
+def test_key_name_inside_string_value_is_not_a_key():
+    parser = DecisionStreamParser()
+    fields = parser.feed('{"reasoning": "Keep \\"investment_memo\\": \\"x\\" out", ')
+    fields += parser.feed('"investment_memo": "memo"}')
+    assert fields == [
+        ("reasoning", 'Keep "investment_memo": "x" out'),
+        ("investment_memo", "memo"),
+    ]
@@ -0,0 +1,88 @@
+"""
+Tests for session expiry and eviction
+"""
+
+import pytest
+
+from services import session_store
+from services.session_store import Session, SessionStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_store.time, "monotonic", clock)
+    return clock
+
+
+def test_finished_session_expires_after_ttl(clock):
+    store = SessionStore(max_sessions=10, ttl_seconds=60)
+    store.set("done", Session(status="completed"))
+
+    clock.now += 59
+    assert store.get("done") is not None
+    clock.now += 2
+    assert store.get("done") is None
+    assert len(store) == 0
+
+
+def test_running_session_never_expires(clock):
+    store = SessionStore(max_sessions=10, ttl_seconds=60)
+    running = Session()
+    store.set("running", running)
+    store.set("done", Session(status="failed"))
+
+    clock.now += 3600  # e.g. waiting on a batch job
+    store.set("new", Session(status="completed"))  # Evicts what has expired
+
+    assert store.get("running") is running
+    assert "done" not in store
+    assert "new" in store
+
+
+def test_update_refreshes_ttl(clock):
+    store = SessionStore(max_sessions=10, ttl_seconds=60)
+    store.set("session", Session())
+
+    clock.now += 50
+    store.update("session", status="completed")
+    clock.now += 50
+    assert store.get("session").status == "completed"
+
+
+def test_oldest_written_finished_sessions_are_evicted_beyond_cap(clock):
+    store = SessionStore(max_sessions=2, ttl_seconds=60)
+    store.set("a", Session(status="completed"))
+    store.set("b", Session(status="completed"))
+    store.update("a", message="rewritten")  # Now the most recent write
+    store.set("c", Session(status="completed"))
+
+    assert "b" not in store
+    assert "a" in store and "c" in store
+
+
+def test_running_sessions_are_not_evicted_beyond_cap(clock):
+    store = SessionStore(max_sessions=2, ttl_seconds=60)
+    store.set("running", Session())
+    store.set("a", Session(status="completed"))
+    store.set("b", Session(status="completed"))
+    store.set("c", Session())
+
+    assert "running" in store and "c" in store
+    assert "a" not in store and "b" not in store
+
+
+def test_update_of_unknown_session_is_dropped(clock):
+    store = SessionStore(max_sessions=10, ttl_seconds=60)
+    store.update("gone", status="completed")
+
+    assert "gone" not in store
+    assert len(store) == 0
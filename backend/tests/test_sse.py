@@ -0,0 +1,118 @@
+"""
+Tests for SSE replay and slow-client handling
+"""
+
+import orjson
+import pytest
+
+from api.sse import CLOSE_STREAM, SSEManager
+from config import settings
+
+
+def event_id(frame: bytes) -> int:
+    """The id: line of an encoded frame"""
+    id_line, _ = frame.split(b"\n", 1)
+    assert id_line.startswith(b"id: ")
+    return int(id_line[len(b"id: "):])
+
+
+def payload(frame: bytes) -> dict:
+    return orjson.loads(frame.split(b"data: ", 1)[1])
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_frames_after_last_event_id():
+    manager = SSEManager()
+    for step in range(1, 6):
+        manager.publish("session", "agent_message", {"step": step})
+
+    stream = manager.stream_events("session", last_event_id=2)
+    try:
+        assert payload(await anext(stream))["type"] == "connected"
+        replayed = [await anext(stream) for _ in range(3)]
+        assert [event_id(frame) for frame in replayed] == [3, 4, 5]
+        assert [payload(frame)["data"]["step"] for frame in replayed] == [3, 4, 5]
+
+        # Live events follow the replay without gaps or repeats
+        manager.publish("session", "agent_message", {"step": 6})
+        assert event_id(await anext(stream)) == 6
+    finally:
+        await stream.aclose()
+
+    assert "session" not in manager.session_subscribers
+
+
+@pytest.mark.asyncio
+async def test_connect_without_last_event_id_skips_replay():
+    manager = SSEManager()
+    manager.publish("session", "agent_message", {"step": 1})
+
+    stream = manager.stream_events("session")
+    try:
+        assert payload(await anext(stream))["type"] == "connected"
+        manager.publish("session", "agent_message", {"step": 2})
+        assert event_id(await anext(stream)) == 2
+    finally:
+        await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_frame(monkeypatch):
+    monkeypatch.setattr(settings, "sse_max_queue_size", 3)
+    manager = SSEManager()
+    subscriber = await manager.subscribe("session")
+
+    for step in range(1, 5):
+        manager.publish("session", "agent_message", {"step": step})
+
+    queued = [subscriber.queue.get_nowait() for _ in range(subscriber.queue.qsize())]
+    assert [event_id(frame) for frame in queued] == [2, 3, 4]
+    assert subscriber.dropped == 1
+    assert manager.dropped_event_count == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_client_is_disconnected_at_drop_threshold(monkeypatch):
+    monkeypatch.setattr(settings, "sse_max_queue_size", 2)
+    monkeypatch.setattr(settings, "sse_max_dropped_events", 3)
+    manager = SSEManager()
+    subscriber = await manager.subscribe("session")
+    other = await manager.subscribe("session")
+
+    for step in range(1, 5):  # Two drops: still connected
+        manager.publish("session", "agent_message", {"step": step})
+        other.queue.get_nowait()
+    assert subscriber in manager.session_subscribers["session"]
+
+    manager.publish("session", "agent_message", {"step": 5})  # Third drop
+    assert subscriber.dropped == 3
+    assert subscriber not in manager.session_subscribers["session"]
+    assert subscriber.queue.get_nowait() is CLOSE_STREAM
+    assert subscriber.queue.empty()
+
+    # The rest of the session's clients keep receiving
+    manager.publish("session", "agent_message", {"step": 6})
+    assert subscriber.queue.empty()
+    assert [event_id(other.queue.get_nowait()) for _ in range(2)] == [5, 6]
+
+
+@pytest.mark.asyncio
+async def test_client_that_catches_up_is_not_disconnected(monkeypatch):
+    monkeypatch.setattr(settings, "sse_max_queue_size", 2)
+    monkeypatch.setattr(settings, "sse_max_dropped_events", 3)
+    manager = SSEManager()
+    subscriber = await manager.subscribe("session")
+
+    step = 0
+    for _ in range(5):  # Falls behind by two events, then drains its queue
+        for _ in range(4):
+            step += 1
+            manager.publish("session", "agent_message", {"step": step})
+        assert subscriber.dropped == 2
+        while not subscriber.queue.empty():
+            assert subscriber.queue.get_nowait() is not CLOSE_STREAM
+
+    manager.publish("session", "agent_message", {"step": step + 1})
+    assert subscriber.dropped == 0
+    assert subscriber in manager.session_subscribers["session"]
+    assert manager.dropped_event_count == 10
@@ -0,0 +1,69 @@
+"""
+Tests for task prompt layout
+"""
+
+from collections import defaultdict
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from agents.definitions import (
+    STATIC_PROMPTS,
+    create_all_agents,
+    create_bear_agent,
+    create_bull_agent
+)
+from tasks.research_tasks import (
+    create_market_researcher_task,
+    create_founder_evaluator_task,
+    create_product_critic_task,
+    create_financial_analyst_task
+)
+
+COMPANY_A = {
+    "company_name": "Acme Robotics",
+    "website": "https://acme.example",
+    "industry": "Robotics",
+    "product_description": "Warehouse picking robots",
+    "founder_github": "acme-founder",
+    "financial_metrics": {"arr": 1200000},
+}
+
+COMPANY_B = {
+    "company_name": "Zephyr Health",
+    "website": "https://zephyr.example",
+    "industry": "Healthcare",
+    "product_description": "Remote patient monitoring",
+}
+
+
+@pytest.mark.parametrize("create_task", [
+    create_market_researcher_task,
+    create_founder_evaluator_task,
+    create_product_critic_task,
+    create_financial_analyst_task,
+])
+def test_research_description_static_prefix(create_task):
+    """Company details only appear after the static instructions"""
+    agents = defaultdict(lambda: None)
+    description_a = create_task(agents, COMPANY_A, context=[]).description
+    description_b = create_task(agents, COMPANY_B, context=[]).description
+
+    prefix_a = description_a[:description_a.index(COMPANY_A["company_name"])]
+    prefix_b = description_b[:description_b.index(COMPANY_B["company_name"])]
+
+    assert prefix_a == prefix_b
+    assert len(prefix_a) > len(description_a) // 2
+
+
+def test_agent_backstories_are_static_prompts():
+    """Every agent's system prompt is a frozen *_PROMPT, identical across analyses"""
+    agents = dict(create_all_agents())
+    agents["delegating_bull"] = create_bull_agent(allow_delegation=True)
+    agents["delegating_bear"] = create_bear_agent(allow_delegation=True)
+
+    for agent_id, agent in agents.items():
+        assert agent.backstory in STATIC_PROMPTS, (
+            f"{agent_id} backstory is not a frozen *_PROMPT - it would defeat prompt caching"
+        )
@@ -0,0 +1,56 @@
+"""
+Tests for the shared tool result cache
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tools import _cache
+from tools._cache import ToolResultCache
+
+
+def test_concurrent_callers_share_one_upstream_call():
+    cache = ToolResultCache()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(cache.get_or_compute, "key", compute)
+        started.wait(5)
+        second = pool.submit(cache.get_or_compute, "key", compute)
+        time.sleep(0.05)  # Let the second caller reach the in-flight call
+        release.set()
+        assert first.result(5) == second.result(5) == "result"
+
+    assert len(calls) == 1
+    assert cache.get_or_compute("key", compute) == "result"
+    assert len(calls) == 1
+
+
+def test_results_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+    cache = ToolResultCache(ttl_seconds=60)
+    results = iter(["old", "new"])
+
+    assert cache.get_or_compute("key", lambda: next(results)) == "old"
+    now[0] += 59
+    assert cache.get_or_compute("key", lambda: next(results)) == "old"
+    now[0] += 2
+    assert cache.get_or_compute("key", lambda: next(results)) == "new"
+
+
+def test_error_results_are_not_cached():
+    cache = ToolResultCache()
+    results = iter(["❌ upstream timeout", "result"])
+
+    assert cache.get_or_compute("key", lambda: next(results)).startswith("❌")
+    assert cache.get_or_compute("key", lambda: next(results)) == "result"
@@ -0,0 +1,79 @@
+"""
+Shared result cache for read-only MCP tools.
+Several agents often issue the same tool call (e.g. the same GitHub user or
+HackerNews query); successful results are kept for settings.tool_cache_ttl_seconds
+so the MCP round-trip is paid once, and concurrent identical calls (the
+parallel debate rounds) wait for the one already in flight instead of
+repeating it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Tuple
+
+from config import settings
+
+
+class ToolResultCache:
+    """Thread-safe LRU/TTL cache of tool results (tools run in CrewAI worker threads)."""
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 900):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, result), least recently used first
+        self._results: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+        # key -> result of the call currently computing it
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], str]) -> str:
+        """
+        Return the cached result for key, computing and storing it on a miss.
+        Callers missing on a key that is already being computed wait for that
+        call. Error results (prefixed with "❌") are returned but never cached.
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._results.move_to_end(key)
+                    return entry[1]
+                del self._results[key]
+            pending = self._in_flight.get(key)
+            if pending is None:
+                pending = self._in_flight[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return pending.result()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            if not result.startswith("❌"):
+                self._results[key] = (time.monotonic() + self.ttl_seconds, result)
+                self._results.move_to_end(key)
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        pending.set_result(result)
+        return result
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._results.clear()
+
+
+# Global cache shared by all tool instances
+tool_result_cache = ToolResultCache(ttl_seconds=settings.tool_cache_ttl_seconds)
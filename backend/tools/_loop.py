@@ -0,0 +1,22 @@
+"""
+Event loop runner for synchronous tool entry points.
+CrewAI calls tool _run() from worker threads, and each call drives its MCP
+coroutine on a fresh loop; uvloop (when installed) makes that loop's setup
+and socket I/O cheaper than the default selector loop.
+"""
+
+import asyncio
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:  # Windows or uvloop not installed
+    uvloop = None
+
+
+def run_async(coro: Coroutine) -> Any:
+    """Run a coroutine to completion on a new (uvloop if available) event loop."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
@@ -7,8 +7,9 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
 from tools.mcp_client import mcp_client
+from tools._loop import run_async
+from tools._cache import tool_result_cache
 import logging
-import asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -107,4 +108,8 @@ Evaluate source credibility and recency when using this information.
                 logger.error(error_msg)
                 return f"❌ {error_msg}\n\nNote: Exa MCP server may not be configured or query may be too broad."
 
-        return asyncio.run(search())
+        # Identical calls from different agents share one MCP round-trip
+        return tool_result_cache.get_or_compute(
+            ("exa", query, num_results),
+            lambda: run_async(search())
+        )
@@ -7,8 +7,8 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type, List, Dict, Optional
 from tools.mcp_client import mcp_client
+from tools._loop import run_async
 import logging
-import asyncio
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -155,7 +155,7 @@ Result:
                 logger.error(error_msg)
                 return f"❌ {error_msg}\n\nNote: Google Calendar OAuth may need to be re-authenticated or check event details."
 
-        return asyncio.run(create_event())
+        return run_async(create_event())
 
     async def _arun(
         self,
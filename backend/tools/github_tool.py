@@ -7,8 +7,9 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
 from tools.mcp_client import mcp_client
+from tools._loop import run_async
+from tools._cache import tool_result_cache
 import logging
-import asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -115,4 +116,8 @@ Red Flags: Watch for inactive accounts, trivial projects, or lack of technical d
                 logger.error(error_msg)
                 return f"❌ {error_msg}\n\nNote: User may not exist or profile may be private."
 
-        return asyncio.run(analyze())
+        # Identical calls from different agents share one MCP round-trip
+        return tool_result_cache.get_or_compute(
+            ("github", username, include_repos),
+            lambda: run_async(analyze())
+        )
@@ -7,8 +7,9 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
 from tools.mcp_client import mcp_client
+from tools._loop import run_async
+from tools._cache import tool_result_cache
 import logging
-import asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -104,4 +105,8 @@ Red flags to watch: Negative sentiment, concerns about business model, technical
                 logger.error(error_msg)
                 return f"❌ {error_msg}\n\nNote: The query might be too specific or no discussions found."
 
-        return asyncio.run(search())
+        # Identical calls from different agents share one MCP round-trip
+        return tool_result_cache.get_or_compute(
+            ("hackernews", query, limit),
+            lambda: run_async(search())
+        )
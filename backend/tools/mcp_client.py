@@ -6,8 +6,10 @@ Supports OAuth authentication for services that require it (Google Calendar, Goo
 
 from metorial import Metorial
 from openai import AsyncOpenAI
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from config import settings
+import asyncio
 import logging
 import json
 
@@ -50,6 +52,11 @@ class MetorialClient:
         # In production, you might want to persist these (e.g., in database)
         self._oauth_sessions: Dict[str, Any] = {}
         self._pending_oauth_sessions: Dict[str, Any] = {}  # session_id -> session object
+        # session_id -> Event set once the session's completion watcher returns
+        # (completed sessions are moved to _oauth_sessions before it is set);
+        # pending sessions only - the watcher removes both entries when done
+        self._oauth_events: Dict[str, asyncio.Event] = {}
+        self._oauth_watchers: Dict[str, asyncio.Task] = {}
 
     async def create_oauth_session(self, mcp_name: str, auto_wait: bool = True) -> Dict[str, Any]:
         """
@@ -116,8 +123,13 @@ class MetorialClient:
             return {"session": oauth_session, "url": None, "completed": True}
         else:
             # Return URL for manual completion
-            # Store pending session for status checking
+            # Store pending session for status checking; a single background
+            # watcher per session signals completion through an Event
             self._pending_oauth_sessions[oauth_session.id] = oauth_session
+            self._oauth_events[oauth_session.id] = asyncio.Event()
+            self._oauth_watchers[oauth_session.id] = asyncio.create_task(
+                self._watch_oauth_completion(mcp_name, oauth_session)
+            )
             return {
                 "session": oauth_session,
                 "url": oauth_session.url,
@@ -128,6 +140,33 @@ class MetorialClient:
         """Wait for an OAuth session to complete"""
         await self.metorial.oauth.wait_for_completion([oauth_session])
 
+    async def _watch_oauth_completion(self, mcp_name: str, oauth_session) -> None:
+        """
+        Wait for a pending OAuth session once (until it expires), cache it on
+        completion and signal its Event (also on failure or expiry, so
+        waiters don't hang)
+
+        Args:
+            mcp_name: Name of MCP the session authenticates
+            oauth_session: Pending Metorial OAuth session
+        """
+        try:
+            await asyncio.wait_for(
+                self.metorial.oauth.wait_for_completion([oauth_session]),
+                timeout=_oauth_timeout(oauth_session)
+            )
+            self._oauth_sessions[mcp_name] = oauth_session
+            logger.info(f"✅ OAuth session {oauth_session.id} completed for {mcp_name}")
+        except asyncio.TimeoutError:
+            logger.warning(f"OAuth session {oauth_session.id} for {mcp_name} expired before completion")
+        except Exception as e:
+            logger.warning(f"OAuth session {oauth_session.id} for {mcp_name} failed: {e}")
+        finally:
+            self._pending_oauth_sessions.pop(oauth_session.id, None)
+            self._oauth_watchers.pop(oauth_session.id, None)
+            # Waiters hold the Event itself, so it can go once set
+            self._oauth_events.pop(oauth_session.id).set()
+
     async def call_mcp(
         self,
         mcp_name: str,
@@ -245,6 +284,20 @@ class MetorialClient:
         self._oauth_sessions.clear()
         logger.info("Cleared all OAuth sessions")
 
+def _oauth_timeout(oauth_session) -> float:
+    """Seconds until a pending OAuth session expires (settings.oauth_session_timeout_seconds if unknown)"""
+    expires_at = getattr(oauth_session, "expires_at", None)
+    if isinstance(expires_at, str):
+        try:
+            expires_at = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+        except ValueError:
+            expires_at = None
+    if not isinstance(expires_at, datetime):
+        return settings.oauth_session_timeout_seconds
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (expires_at - datetime.now(timezone.utc)).total_seconds())
+
 # Global client instance (lazy initialization)
 _mcp_client_instance = None
 
@@ -44,6 +44,7 @@ const OAuthDialog: React.FC<OAuthDialogProps> = ({
   const [error, setError] = useState<string | null>(null);
   const popupWindowRef = useRef<Window | null>(null);
   const pollIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const eventSourceRef = useRef<EventSource | null>(null);
 
   const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -64,7 +65,7 @@ const OAuthDialog: React.FC<OAuthDialogProps> = ({
         // Use existing session from SSE
         setStatus('pending');
         openPopup(initialAuthUrl);
-        startPolling(initialSessionId);
+        startListening(initialSessionId);
       } else {
         // Create new session
         initiateOAuth();
@@ -73,6 +74,7 @@ const OAuthDialog: React.FC<OAuthDialogProps> = ({
 
     // Cleanup on unmount or close
     return () => {
+      stopListening();
       if (pollIntervalRef.current) {
         clearInterval(pollIntervalRef.current);
       }
@@ -96,7 +98,8 @@ const OAuthDialog: React.FC<OAuthDialogProps> = ({
         popupWindowRef.current.close();
       }
       
-      // Clear polling
+      // Clear status stream / polling
+      stopListening();
       if (pollIntervalRef.current) {
         clearInterval(pollIntervalRef.current);
         pollIntervalRef.current = null;
@@ -141,8 +144,8 @@ const OAuthDialog: React.FC<OAuthDialogProps> = ({
       // Open popup window only if we have an auth URL
       if (data.auth_url) {
         openPopup(data.auth_url);
-        // Start polling for completion
-        startPolling(data.oauth_session_id);
+        // Wait for completion (pushed by the backend)
+        startListening(data.oauth_session_id);
       } else {
         setError('No authentication URL provided');
         setStatus('failed');
@@ -173,6 +176,54 @@ const OAuthDialog: React.FC<OAuthDialogProps> = ({
     }
   };
 
+  const stopListening = () => {
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+      eventSourceRef.current = null;
+    }
+  };
+
+  const handleCompleted = (sessionId: string) => {
+    setStatus('completed');
+    if (popupWindowRef.current && !popupWindowRef.current.closed) {
+      popupWindowRef.current.close();
+    }
+    // Call completion callback
+    setTimeout(() => {
+      onComplete(sessionId);
+    }, 1000); // Small delay to show success state
+  };
+
+  // The backend pushes a single status event once the OAuth session settles;
+  // fall back to polling /oauth/status if the stream can't be used.
+  const startListening = (sessionId: string) => {
+    stopListening();
+
+    const eventSource = new EventSource(
+      `${API_URL}/api/oauth/events/${sessionId}?mcp_name=${mcpName}`
+    );
+    eventSourceRef.current = eventSource;
+
+    eventSource.onmessage = (event) => {
+      stopListening();
+      const data = JSON.parse(event.data);
+      if (data.status === 'completed') {
+        handleCompleted(sessionId);
+      } else if (data.status === 'failed') {
+        setError(data.message || 'OAuth authentication failed');
+        setStatus('failed');
+      } else {
+        // Stream timed out while still pending
+        startPolling(sessionId);
+      }
+    };
+
+    eventSource.onerror = () => {
+      stopListening();
+      startPolling(sessionId);
+    };
+  };
+
   const startPolling = (sessionId: string) => {
     if (pollIntervalRef.current) {
       clearInterval(pollIntervalRef.current);
@@ -15,7 +15,7 @@ import { normalizeAgentName } from '../lib/agentUtils';
 interface FreelancerJobData {
   content: string;
   company: string;
-  timestamp: string;
+  timestamp: number;
 }
 
 // OAuth authentication request (for GitHub/Calendar integrations)
@@ -23,7 +23,7 @@ interface OAuthRequest {
   mcp_name: string;
   auth_url: string;
   oauth_session_id: string;
-  timestamp?: string;
+  timestamp?: number;
 }
 
 interface UseSSEReturn {
@@ -41,7 +41,9 @@ interface SSEMessage {
   type:
     | 'phase_change'
     | 'agent_message'
+    | 'agent_messages_batch'  // Several agent_message payloads sent together
     | 'decision'
+    | 'decision_field'  // One decision field, sent as soon as the Lead Partner has written it
     | 'error'
     | 'ping'
     | 'freelancer_job_notification'  // External research job posting
@@ -49,6 +51,16 @@ interface SSEMessage {
   data: any;
 }
 
+/**
+ * Convert a backend agent_message payload to an AgentMessage
+ */
+const toAgentMessage = (data: any): AgentMessage => ({
+  agent: normalizeAgentName(data.agent), // Normalize backend role names to frontend IDs
+  message: data.message,
+  message_type: data.message_type || 'info',
+  timestamp: data.timestamp || Date.now(),
+});
+
 /**
  * SSE Hook for real-time updates from backend
  * 
@@ -67,10 +79,32 @@ export const useSSE = (sessionId: string | null, enabled: boolean = true): UseSS
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const reconnectAttemptsRef = useRef<number>(0);
   const isCompletedRef = useRef<boolean>(false); // Track if stream completed successfully
+  const partialDecisionRef = useRef<Partial<Decision>>({}); // Decision fields streamed so far
+  const lastEventIdRef = useRef<string | null>(null); // Id of the last frame received (for replay)
   
   const MAX_RECONNECT_ATTEMPTS = 5;
   const RECONNECT_DELAY = 1000; // Start with 1 second
 
+  // Merge new agent messages into the timeline in one state update
+  const addAgentMessages = useCallback((incoming: AgentMessage[]) => {
+    setMessages((prev) => {
+      // Avoid duplicates by checking timestamp + agent + message hash
+      const fresh = incoming.filter(
+        (agentMessage) => !prev.some(
+          (m) => m.agent === agentMessage.agent &&
+            m.message === agentMessage.message &&
+            m.timestamp === agentMessage.timestamp
+        )
+      );
+      if (fresh.length === 0) return prev;
+      return [...prev, ...fresh].sort((a, b) => {
+        const aTime = typeof a.timestamp === 'number' ? a.timestamp : 0;
+        const bTime = typeof b.timestamp === 'number' ? b.timestamp : 0;
+        return aTime - bTime;
+      });
+    });
+  }, []);
+
   const connect = useCallback(() => {
     if (!sessionId || !enabled) {
       return;
@@ -88,7 +122,11 @@ export const useSSE = (sessionId: string | null, enabled: boolean = true): UseSS
     }
 
     const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
-    const sseUrl = `${API_URL}/api/sse/${sessionId}`;
+    // A fresh EventSource doesn't send Last-Event-ID, so pass it explicitly
+    // and the backend replays the frames missed while disconnected
+    const sseUrl = lastEventIdRef.current
+      ? `${API_URL}/api/sse/${sessionId}?last_event_id=${encodeURIComponent(lastEventIdRef.current)}`
+      : `${API_URL}/api/sse/${sessionId}`;
 
     setConnectionStatus('connecting');
     setError(null);
@@ -110,6 +148,9 @@ export const useSSE = (sessionId: string | null, enabled: boolean = true): UseSS
       };
 
       eventSource.onmessage = (event: MessageEvent) => {
+        if (event.lastEventId) {
+          lastEventIdRef.current = event.lastEventId;
+        }
         try {
           const sseMessage: SSEMessage = JSON.parse(event.data);
           
@@ -124,34 +165,31 @@ export const useSSE = (sessionId: string | null, enabled: boolean = true): UseSS
               break;
             
             case 'agent_message':
-              // Debug: Log raw agent name from backend
-              console.log('[SSE DEBUG] Raw agent name from backend:', sseMessage.data.agent);
-
-              const agentMessage: AgentMessage = {
-                agent: normalizeAgentName(sseMessage.data.agent), // Normalize backend role names to frontend IDs
-                message: sseMessage.data.message,
-                message_type: sseMessage.data.message_type || 'info',
-                timestamp: sseMessage.data.timestamp || Date.now(),
-              };
+              addAgentMessages([toAgentMessage(sseMessage.data)]);
+              break;
 
-              // Debug: Log normalized agent name
-              console.log('[SSE DEBUG] Normalized to:', agentMessage.agent);
-              setMessages((prev) => {
-                // Avoid duplicates by checking timestamp + agent + message hash
-                const exists = prev.some(
-                  (m) => m.agent === agentMessage.agent &&
-                    m.message === agentMessage.message &&
-                    m.timestamp === agentMessage.timestamp
-                );
-                if (exists) return prev;
-                return [...prev, agentMessage].sort((a, b) => {
-                  const aTime = typeof a.timestamp === 'number' ? a.timestamp : 0;
-                  const bTime = typeof b.timestamp === 'number' ? b.timestamp : 0;
-                  return aTime - bTime;
-                });
-              });
+            case 'agent_messages_batch':
+              // Steps that arrived together (e.g. from parallel rounds): one state update
+              addAgentMessages(sseMessage.data.messages.map(toAgentMessage));
               break;
             
+            case 'decision_field':
+              // Render the decision while the memo is still being written;
+              // the final 'decision' event replaces it with the full result
+              partialDecisionRef.current = {
+                ...partialDecisionRef.current,
+                [sseMessage.data.field]: sseMessage.data.value,
+              };
+              if (partialDecisionRef.current.decision) {
+                setDecision({
+                  reasoning: '',
+                  investment_memo: '',
+                  calendar_events: [],
+                  ...partialDecisionRef.current,
+                } as Decision);
+              }
+              break;
+
             case 'decision':
               setDecision(sseMessage.data as Decision);
               setPhase('completed');
@@ -243,7 +281,7 @@ export const useSSE = (sessionId: string | null, enabled: boolean = true): UseSS
       setConnectionStatus('error');
       setError(err instanceof Error ? err.message : 'Failed to connect');
     }
-  }, [sessionId, enabled]);
+  }, [sessionId, enabled, addAgentMessages]);
 
   const disconnect = useCallback(() => {
     if (eventSourceRef.current) {
@@ -268,6 +306,8 @@ export const useSSE = (sessionId: string | null, enabled: boolean = true): UseSS
   useEffect(() => {
     // Reset completion flag when starting new connection
     isCompletedRef.current = false;
+    partialDecisionRef.current = {};
+    lastEventIdRef.current = null;
     
     if (sessionId && enabled) {
       connect();
@@ -40,11 +40,6 @@ export interface Decision {
 
 export type Phase = 'idle' | 'research' | 'debate' | 'decision' | 'completed';
 
-export interface WebSocketEvent {
-  type: 'phase_change' | 'agent_message' | 'decision' | 'error';
-  data: any;
-}
-
 export interface SimulationState {
   phase: Phase;
   messages: AgentMessage[];